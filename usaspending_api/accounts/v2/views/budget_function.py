@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.accounts.models import TreasuryAppropriationAccount
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 
 
@@ -13,6 +14,7 @@ class ListBudgetFunctionViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/budget_functions/list_budget_functions.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     @cache_response()
     def get(self, request):
@@ -34,6 +36,7 @@ class ListBudgetSubfunctionViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/budget_functions/list_budget_subfunctions.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     @cache_response()
     def post(self, request):
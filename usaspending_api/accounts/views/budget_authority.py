@@ -2,6 +2,7 @@ from django.db.models import Sum
 
 from usaspending_api.accounts.serializers import BudgetAuthoritySerializer
 from usaspending_api.accounts.models import BudgetAuthority
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.views import CachedDetailViewSet
 
@@ -11,6 +12,8 @@ class BudgetAuthorityViewSet(CachedDetailViewSet):
     Return historical budget authority for a given agency id.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     serializer_class = BudgetAuthoritySerializer
     ordering_fields = ("year", "total")
     order_directions = {"asc": "", "desc": "-"}
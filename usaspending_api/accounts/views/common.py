@@ -1,5 +1,6 @@
 from usaspending_api.awards.serializers import FinancialAccountsByAwardsSerializer
 from usaspending_api.awards.models import FinancialAccountsByAwards
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.mixins import FilterQuerysetMixin
 from usaspending_api.common.views import CachedDetailViewSet
 from usaspending_api.common.api_versioning import removed
@@ -13,6 +14,8 @@ class FinancialAccountsByAwardListViewSet(FilterQuerysetMixin, CachedDetailViewS
     Handles requests for financial account data grouped by award.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     serializer_class = FinancialAccountsByAwardsSerializer
 
     def get_queryset(self):
@@ -1,5 +1,6 @@
 from usaspending_api.accounts.serializers import FederalAccountSerializer
 from usaspending_api.accounts.models import FederalAccount
+from usaspending_api.common.cache import UNVERSIONED_DATA_TYPES
 from usaspending_api.common.mixins import FilterQuerysetMixin
 from usaspending_api.common.views import CachedDetailViewSet, AutocompleteView
 from usaspending_api.common.api_versioning import deprecated, removed
@@ -12,6 +13,8 @@ class FederalAccountAutocomplete(FilterQuerysetMixin, AutocompleteView):
     Handle autocomplete requests for federal account information.
     """
 
+    cache_data_types = UNVERSIONED_DATA_TYPES
+
     serializer_class = FederalAccountSerializer
 
     def get_queryset(self):
@@ -32,6 +35,8 @@ class FederalAccountViewSet(FilterQuerysetMixin, CachedDetailViewSet):
     Handle requests for federal account information.
     """
 
+    cache_data_types = UNVERSIONED_DATA_TYPES
+
     serializer_class = FederalAccountSerializer
 
     def get_queryset(self):
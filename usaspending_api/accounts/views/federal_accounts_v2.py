@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.accounts.models import AppropriationAccountBalances, FederalAccount, TreasuryAppropriationAccount
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.generic_helper import get_simple_pagination_metadata
@@ -24,6 +25,7 @@ class ObjectClassFederalAccountsViewSet(APIView):
     endpoint_doc = (
         "usaspending_api/api_contracts/contracts/v2/federal_accounts/federal_account_id/available_object_classes.md"
     )
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     @cache_response()
     def get(self, request, pk, format=None):
@@ -83,6 +85,7 @@ class FiscalYearSnapshotFederalAccountsViewSet(APIView):
     endpoint_doc = (
         "usaspending_api/api_contracts/contracts/v2/federal_accounts/federal_account_id/fiscal_year_snapshot.md"
     )
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     @cache_response()
     def get(self, request, pk, fy=0, format=None):
@@ -115,6 +118,8 @@ class SpendingOverTimeFederalAccountsViewSet(APIView):
     This route takes a federal_account DB ID and returns the data required to visualized the spending over time graphic.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     @cache_response()
     def post(self, request, pk, format=None):
         # create response
@@ -382,6 +387,8 @@ class SpendingByCategoryFederalAccountsViewSet(APIView):
     the Spending By Category graphic.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     @cache_response()
     def post(self, request, pk, format=None):
         json_request = request.data
@@ -433,6 +440,7 @@ class FederalAccountViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/federal_accounts/account_number.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     @cache_response()
     def get(self, request, fed_acct_code, format=None):
@@ -465,6 +473,7 @@ class FederalAccountsViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/federal_accounts.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     def _parse_and_validate_request(self, request_dict):
         """ Validate the Request object includes the required fields """
@@ -1,6 +1,7 @@
 from django.db.models import F, Sum
 from usaspending_api.accounts.models import AppropriationAccountBalances
 from usaspending_api.accounts.serializers import FederalAccountByObligationSerializer
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.views import CachedDetailViewSet
 
@@ -11,6 +12,7 @@ class FederalAccountByObligationViewSet(CachedDetailViewSet):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/federal_obligations.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     serializer_class = FederalAccountByObligationSerializer
 
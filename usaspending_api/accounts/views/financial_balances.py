@@ -2,6 +2,7 @@ from django.db.models import F, Sum
 
 from usaspending_api.accounts.serializers import AgenciesFinancialBalancesSerializer
 from usaspending_api.accounts.models import AppropriationAccountBalances
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.references.models import ToptierAgency
 from usaspending_api.submissions.models import SubmissionAttributes
 from usaspending_api.common.views import CachedDetailViewSet
@@ -14,6 +15,7 @@ class AgenciesFinancialBalancesViewSet(CachedDetailViewSet):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/financial_balances/agencies.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     serializer_class = AgenciesFinancialBalancesSerializer
 
@@ -3,6 +3,7 @@ from usaspending_api.accounts.serializers import (
     ObjectClassFinancialSpendingSerializer,
     MinorObjectClassFinancialSpendingSerializer,
 )
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.views import CachedDetailViewSet
 from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
@@ -16,6 +17,7 @@ class ObjectClassFinancialSpendingViewSet(CachedDetailViewSet):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/financial_spending/major_object_class.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     serializer_class = ObjectClassFinancialSpendingSerializer
 
@@ -82,6 +84,7 @@ class MinorObjectClassFinancialSpendingViewSet(CachedDetailViewSet):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/financial_spending/object_class.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     serializer_class = MinorObjectClassFinancialSpendingSerializer
 
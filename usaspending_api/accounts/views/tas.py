@@ -1,6 +1,7 @@
 from usaspending_api.accounts.models import TreasuryAppropriationAccount
 from usaspending_api.accounts.models import AppropriationAccountBalances
 from usaspending_api.accounts.serializers import TasSerializer
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES, UNVERSIONED_DATA_TYPES
 from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
 from usaspending_api.common.mixins import FilterQuerysetMixin
 from usaspending_api.common.mixins import AggregateQuerysetMixin
@@ -21,6 +22,8 @@ class TASBalancesAggregate(FilterQuerysetMixin, AggregateQuerysetMixin, CachedDe
     Return aggregated award information.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     serializer_class = AggregateSerializer
 
     def get_queryset(self):
@@ -36,6 +39,8 @@ class TASBalancesQuarterAggregate(FilterQuerysetMixin, AggregateQuerysetMixin, C
     Return aggregated award information.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     serializer_class = AggregateSerializer
 
     def get_queryset(self):
@@ -56,6 +61,8 @@ class TASCategoryAggregate(FilterQuerysetMixin, AggregateQuerysetMixin, CachedDe
     Return aggregated award information.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     serializer_class = AggregateSerializer
 
     def get_queryset(self):
@@ -75,6 +82,8 @@ class TASCategoryQuarterAggregate(FilterQuerysetMixin, AggregateQuerysetMixin, C
     account (tas), program activity, and object class.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     serializer_class = AggregateSerializer
 
     def get_queryset(self):
@@ -96,6 +105,8 @@ class TreasuryAppropriationAccountAutocomplete(FilterQuerysetMixin, Autocomplete
     Handle autocomplete requests for appropriation account (i.e., TAS) information.
     """
 
+    cache_data_types = UNVERSIONED_DATA_TYPES
+
     serializer_class = TasSerializer
 
     def get_queryset(self):
@@ -8,6 +8,7 @@ from rest_framework.exceptions import NotFound
 from rest_framework.views import APIView
 
 from usaspending_api.awards.v2.lookups.lookups import award_type_mapping
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.data_classes import Pagination
 from usaspending_api.common.helpers.date_helper import fy
 from usaspending_api.common.helpers.dict_helpers import update_list_of_dictionaries
@@ -26,6 +27,8 @@ logger = logging.getLogger(__name__)
 
 class AgencyBase(APIView):
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     params_to_validate: List[str]
     additional_models: dict
 
@@ -3,6 +3,7 @@ from django.db.models import Exists, OuterRef
 from rest_framework.response import Response
 from usaspending_api.agency.v2.views.agency_base import AgencyBase
 from usaspending_api.awards.models import TransactionNormalized
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.date_helper import fy
 from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
@@ -16,6 +17,7 @@ class AgencyOverview(AgencyBase):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/agency/toptier_code.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -3,6 +3,7 @@ from datetime import datetime
 from elasticsearch_dsl import A
 from rest_framework.response import Response
 from usaspending_api.agency.v2.views.agency_base import AgencyBase
+from usaspending_api.common.cache import ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
 from usaspending_api.common.query_with_filters import QueryWithFilters
@@ -15,6 +16,7 @@ class Awards(AgencyBase):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/agency/toptier_code/awards.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
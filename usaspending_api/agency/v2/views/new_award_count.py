@@ -5,6 +5,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from usaspending_api.agency.v2.views.agency_base import AgencyBase
+from usaspending_api.common.cache import ES_AWARDS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch
 from usaspending_api.common.query_with_filters import QueryWithFilters
@@ -16,6 +17,7 @@ class NewAwardCount(AgencyBase):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/agency/toptier_code/awards/new/count.md"
+    cache_data_types = ES_AWARDS_DATA_TYPES
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from typing import Any
 
 from usaspending_api.agency.v2.views.agency_base import AgencyBase
+from usaspending_api.common.cache import ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.filter_helpers import create_fiscal_year_filter
 from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
@@ -16,6 +17,7 @@ class ObligationsByAwardCategory(AgencyBase):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/agency/toptier_code/obligations_by_award_category.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from typing import Any
 from usaspending_api.agency.v2.views.agency_base import AgencyBase, PaginationMixin
 from fiscalyear import FiscalYear
+from usaspending_api.common.cache import ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
 from usaspending_api.common.elasticsearch.aggregation_helpers import create_count_aggregation
@@ -17,6 +18,7 @@ class SubAgencyCount(PaginationMixin, AgencyBase):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/agency/toptier_code/sub_agency/count.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1,6 +1,7 @@
 from collections import namedtuple
 
 from usaspending_api.awards.models import Award
+from usaspending_api.common.cache import AWARDS_DATA_TYPES
 from usaspending_api.common.mixins import FilterQuerysetMixin, AggregateQuerysetMixin
 from usaspending_api.common.serializers import AggregateSerializer
 from usaspending_api.common.views import CachedDetailViewSet
@@ -19,6 +20,8 @@ class AwardAggregateViewSet(FilterQuerysetMixin, AggregateQuerysetMixin, CachedD
     Return aggregated award information.
     """
 
+    cache_data_types = AWARDS_DATA_TYPES
+
     serializer_class = AggregateSerializer
 
     def get_queryset(self):
@@ -38,6 +41,8 @@ class AwardListViewSet(FilterQuerysetMixin, CachedDetailViewSet):
     This endpoint allows you to search and filter by almost any attribute of an award object.
     """
 
+    cache_data_types = AWARDS_DATA_TYPES
+
     def get_queryset(self):
         """
         Return the view's queryset.
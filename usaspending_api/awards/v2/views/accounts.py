@@ -5,6 +5,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.generic_helper import get_pagination
 from usaspending_api.common.helpers.sql_helpers import execute_sql_to_ordered_dictionary
@@ -70,6 +71,7 @@ class AwardAccountsViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/awards/accounts.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     @staticmethod
     def _business_logic(request_data: dict) -> list:
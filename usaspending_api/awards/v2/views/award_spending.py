@@ -2,6 +2,7 @@ from django.db.models import Case, CharField, F, Q, Sum, TextField, Value, When
 from django.db.models.functions import Coalesce
 from usaspending_api.awards.models import TransactionNormalized
 from usaspending_api.awards.serializers_v2.serializers import RecipientAwardSpendingSerializer
+from usaspending_api.common.cache import AWARDS_DATA_TYPES
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.generic_helper import check_valid_toptier_agency
 from usaspending_api.common.views import CachedDetailViewSet
@@ -13,6 +14,7 @@ class RecipientAwardSpendingViewSet(CachedDetailViewSet):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/award_spending/recipient.md"
+    cache_data_types = AWARDS_DATA_TYPES
     serializer_class = RecipientAwardSpendingSerializer
 
     def get_queryset(self):
@@ -12,6 +12,7 @@ from usaspending_api.awards.v2.data_layer.orm import (
     construct_idv_response,
     construct_assistance_response,
 )
+from usaspending_api.common.cache import AWARDS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.validator.tinyshield import TinyShield
 
@@ -25,6 +26,7 @@ class AwardLastUpdatedViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/awards/last_updated.md"
+    cache_data_types = AWARDS_DATA_TYPES
 
     @cache_response()
     def get(self, request):
@@ -42,6 +44,7 @@ class AwardRetrieveViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/awards/award_id.md"
+    cache_data_types = AWARDS_DATA_TYPES + ["exec_comp"]
 
     def _parse_and_validate_request(self, provided_award_id: str) -> dict:
         request_dict = {"generated_unique_award_id": provided_award_id}
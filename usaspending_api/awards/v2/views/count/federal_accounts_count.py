@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.awards.models import FinancialAccountsByAwards, Award
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.common.validator.award import get_internal_or_generated_award_id_model
@@ -20,6 +21,7 @@ class FederalAccountCountRetrieveViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/awards/count/federal_account/award_id.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     def _parse_and_validate_request(self, provided_award_id: str) -> dict:
         request_dict = {"award_id": provided_award_id}
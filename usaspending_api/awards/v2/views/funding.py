@@ -7,6 +7,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.generic_helper import get_simple_pagination_metadata
 from usaspending_api.common.helpers.sql_helpers import build_composable_order_by, execute_sql_to_ordered_dictionary
@@ -104,6 +105,7 @@ class AwardFundingViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/awards/funding.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     @staticmethod
     def _business_logic(request_data: dict) -> list:
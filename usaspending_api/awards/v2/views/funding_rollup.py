@@ -5,6 +5,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.sql_helpers import execute_sql_to_ordered_dictionary
 from usaspending_api.common.validator.award import get_internal_or_generated_award_id_model
@@ -46,6 +47,7 @@ class AwardFundingRollupViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/awards/funding_rollup.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     @staticmethod
     def _business_logic(request_data: dict) -> OrderedDict:
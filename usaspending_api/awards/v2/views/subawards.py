@@ -4,6 +4,7 @@ from django.db.models import F
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from usaspending_api.common.cache import AWARDS_DATA_TYPES
 from usaspending_api.search.models import SubawardView
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.generic_helper import get_simple_pagination_metadata
@@ -19,6 +20,7 @@ class SubawardsViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/subawards.md"
+    cache_data_types = AWARDS_DATA_TYPES
 
     subaward_lookup = {
         # "Display Name": "database_column"
@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.awards.models import TransactionNormalized
+from usaspending_api.common.cache import AWARDS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.generic_helper import get_simple_pagination_metadata
 from usaspending_api.common.validator import (
@@ -23,6 +24,7 @@ class TransactionViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/transactions.md"
+    cache_data_types = AWARDS_DATA_TYPES
 
     transaction_lookup = {
         # "Display Name": "database_column"
@@ -86,6 +86,20 @@ def get_latest_load_date(keys, default=None):
     return latest_date
 
 
+def get_all_last_load_dates():
+    """
+    Retrieve every last_load_date from the USAspending database in one query as a dictionary keyed by the keys in
+    EXTERNAL_DATA_TYPE_DICT. Keys without a last_load_date are left out.
+    """
+    return {
+        lookups.EXTERNAL_DATA_TYPE_DICT_ID[external_data_type_id]: last_load_date
+        for external_data_type_id, last_load_date in ExternalDataLoadDate.objects.values_list(
+            "external_data_type_id", "last_load_date"
+        )
+        if external_data_type_id in lookups.EXTERNAL_DATA_TYPE_DICT_ID
+    }
+
+
 def update_last_load_date(key, last_load_date):
     """
     Save the provided last_load_date to the database as UTC (which is our standard timezone).
@@ -2,17 +2,25 @@ import logging
 import psycopg2
 import re
 
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from django.core.management.base import BaseCommand
+from multiprocessing import Pool
 from typing import IO, List, AnyStr, Optional
 
 from usaspending_api.broker.helpers.last_load_date import get_last_load_date, update_last_load_date
 from usaspending_api.common.helpers.date_helper import datetime_command_line_argument_type
 from usaspending_api.common.helpers.etl_helpers import update_c_to_d_linkages
-from usaspending_api.common.helpers.sql_helpers import get_database_dsn_string
+from usaspending_api.common.helpers.sql_helpers import close_all_django_db_conns, get_database_dsn_string
 from usaspending_api.common.retrieve_file_from_uri import RetrieveFileFromUri
 from usaspending_api.etl.award_helpers import update_awards, update_procurement_awards, prune_empty_awards
-from usaspending_api.etl.transaction_loaders.fpds_loader import load_fpds_transactions, failed_ids, delete_stale_fpds
+from usaspending_api.etl.transaction_loaders.fpds_loader import (
+    delete_stale_fpds,
+    failed_ids,
+    load_fpds_transactions,
+    load_fpds_transactions_in_worker,
+    partition_by_award,
+)
 from usaspending_api.transactions.transaction_delete_journal_helpers import retrieve_deleted_fpds_transactions
 
 logger = logging.getLogger("script")
@@ -26,6 +34,9 @@ class Command(BaseCommand):
     help = "Sync USAspending DB FPDS data using source transaction for new or modified records and S3 for deleted IDs"
 
     modified_award_ids = []
+    bulk_upsert = False
+    processes = 1
+    pool = None
 
     @staticmethod
     def get_cursor_for_date_query(connection, date, count=False):
@@ -65,10 +76,38 @@ class Command(BaseCommand):
                 if len(id_list) == 0:
                     break
                 logger.info("Loading batch (size: {}) from date query...".format(len(id_list)))
-                self.modified_award_ids.extend(load_fpds_transactions([row[0] for row in id_list]))
+                self.load_chunk([row[0] for row in id_list])
                 records_processed = records_processed + len(id_list)
                 logger.info("{} out of {} processed".format(records_processed, total_records))
 
+    def load_chunk(self, id_list: List[int]) -> None:
+        if self.pool is None:
+            self.modified_award_ids.extend(load_fpds_transactions(id_list, self.bulk_upsert))
+            return
+
+        # Partitions of a chunk are loaded at the same time; the next chunk waits for all of them to finish so that
+        # the same award is never loaded by two processes at once
+        partitions = partition_by_award(id_list, self.processes)
+        logger.info(f"Loading chunk in {len(partitions)} partitions by award")
+        results = self.pool.starmap(
+            load_fpds_transactions_in_worker, [(partition, self.bulk_upsert) for partition in partitions]
+        )
+        for award_ids, partition_failed_ids in results:
+            self.modified_award_ids.extend(award_ids)
+            failed_ids.extend(partition_failed_ids)
+
+    @contextmanager
+    def worker_pool(self):
+        if self.processes <= 1:
+            yield
+            return
+
+        # Forked processes would otherwise share this process's database connections
+        close_all_django_db_conns()
+        with Pool(self.processes) as self.pool:
+            yield
+        self.pool = None
+
     @staticmethod
     def gen_read_file_for_ids(file: IO[AnyStr], chunk_size: int = CHUNK_SIZE) -> List[str]:
         """ """
@@ -88,7 +127,7 @@ class Command(BaseCommand):
                 id_list = [int(re.search(r"\d+", x).group()) for x in next_batch]
                 total_count += len(id_list)
                 logger.info(f"Loading next batch (size: {len(id_list)}, ids {id_list[0]}-{id_list[-1]})...")
-                self.modified_award_ids.extend(load_fpds_transactions(id_list))
+                self.load_chunk(id_list)
 
         logger.info(f"Total transaction IDs in file: {total_count}")
 
@@ -139,29 +178,45 @@ class Command(BaseCommand):
             action="store_true",
             help="Script will load or reload all FPDS records in source tables, from all time. This does NOT clear the USAspending database first",
         )
+        parser.add_argument(
+            "--bulk-upsert",
+            action="store_true",
+            help="Load each chunk of transactions with a handful of set-based statements instead of one transaction at a "
+            "time. Chunks that fail are retried one transaction at a time to find the failing IDs.",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Number of processes loading each chunk at the same time, each with its own database connection. "
+            "Chunks are partitioned by unique_award_key so that two processes never create the same award.",
+        )
 
     def handle(self, *args, **options):
 
         # Record script execution start time to update the FPDS last updated date in DB as appropriate
         update_time = datetime.now(timezone.utc)
+        self.bulk_upsert = options["bulk_upsert"]
+        self.processes = options["processes"]
 
-        if options["reload_all"]:
-            self.load_fpds_incrementally(None)
+        with self.worker_pool():
+            if options["reload_all"]:
+                self.load_fpds_incrementally(None)
 
-        elif options["date"]:
-            self.load_fpds_incrementally(options["date"])
+            elif options["date"]:
+                self.load_fpds_incrementally(options["date"])
 
-        elif options["ids"]:
-            self.modified_award_ids.extend(load_fpds_transactions(options["ids"]))
+            elif options["ids"]:
+                self.load_chunk(options["ids"])
 
-        elif options["file"]:
-            self.load_fpds_from_file(options["file"])
+            elif options["file"]:
+                self.load_fpds_from_file(options["file"])
 
-        elif options["since_last_load"]:
-            last_load = get_last_load_date("fpds")
-            if not last_load:
-                raise ValueError("No last load date for FPDS stored in the database")
-            self.load_fpds_incrementally(last_load)
+            elif options["since_last_load"]:
+                last_load = get_last_load_date("fpds")
+                if not last_load:
+                    raise ValueError("No last load date for FPDS stored in the database")
+                self.load_fpds_incrementally(last_load)
 
         self.update_award_records(awards=self.modified_award_ids, skip_cd_linkage=False)
 
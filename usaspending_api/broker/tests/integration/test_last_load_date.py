@@ -5,6 +5,7 @@ from datetime import datetime
 from model_bakery import baker
 
 from usaspending_api.broker.helpers.last_load_date import (
+    get_all_last_load_dates,
     get_earliest_load_date,
     get_latest_load_date,
     get_last_load_date,
@@ -43,3 +44,11 @@ def test_earliest_load_date_happy(client, load_dates):
 def test_latest_load_date_happy(client, load_dates):
     load_date = get_latest_load_date(["fpds", "fabs", "es_deletes"])
     assert load_date == datetime(2020, 8, 1, tzinfo=pytz.UTC)
+
+
+@pytest.mark.django_db
+def test_all_last_load_dates(client, load_dates):
+    assert get_all_last_load_dates() == {
+        "fpds": datetime(2020, 3, 1, tzinfo=pytz.UTC),
+        "fabs": datetime(2020, 8, 1, tzinfo=pytz.UTC),
+    }
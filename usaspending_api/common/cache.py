@@ -1,10 +1,29 @@
-import hashlib
-import json
+import logging
 
+from django.conf import settings
+from django.db.models import Max
 from rest_framework_extensions.key_constructor import bits
 from rest_framework_extensions.key_constructor.constructors import DefaultKeyConstructor
+from time import monotonic
 
-from usaspending_api.common.helpers.dict_helpers import order_nested_object
+from usaspending_api.broker.helpers.last_load_date import get_all_last_load_dates
+from usaspending_api.common.helpers.dict_helpers import hash_nested_object
+from usaspending_api.submissions.models import SubmissionAttributes
+
+logger = logging.getLogger("console")
+
+# Data version of agency submissions (File A, B and C), which aren't tracked by the external data load dates
+SUBMISSIONS_DATA_VERSION = "submissions"
+
+# Data types (see get_data_versions) for the "cache_data_types" of views, by where the views read their data from
+AWARDS_DATA_TYPES = ["fpds", "fabs"]  # Awards and transactions, and the recipient and subaward tables built with them
+ES_AWARDS_DATA_TYPES = ["es_awards", "es_deletes"]
+ES_TRANSACTIONS_DATA_TYPES = ["es_transactions", "es_deletes"]
+SUBMISSIONS_DATA_TYPES = [SUBMISSIONS_DATA_VERSION]  # File A, B and C, and the tables built from them
+UNVERSIONED_DATA_TYPES = []  # Data that none of the tracked data loads change, such as reference data
+
+# (expiration time, {<data type>: <data version>}) swapped out as a whole when it is reloaded
+_data_versions = (0.0, {})
 
 
 class PathKeyBit(bits.QueryParamsKeyBit):
@@ -38,7 +57,53 @@ class GetPostQueryParamsKeyBit(bits.QueryParamsKeyBit):
 
         if "auditTrail" in params:
             del params["auditTrail"]
-        return {"request": json.dumps(order_nested_object(params))}
+        return {"request": hash_nested_object(params)}
+
+
+def get_data_versions() -> dict:
+    """
+    Returns the current version of every dataset an API response can depend on, keyed by the names in
+    EXTERNAL_DATA_TYPE_DICT plus SUBMISSIONS_DATA_VERSION. A version is the time the dataset was last loaded, so it
+    changes whenever new data lands. Kept in memory for CACHE_DATA_VERSION_TIMEOUT seconds to spare a query per request.
+    """
+    global _data_versions
+
+    expires, data_versions = _data_versions
+    if monotonic() >= expires:
+        try:
+            data_versions = {key: value.isoformat() for key, value in get_all_last_load_dates().items()}
+            last_submission_update = SubmissionAttributes.objects.aggregate(Max("update_date"))["update_date__max"]
+        except Exception:
+            # Responses can still be served, just not cached for the current data versions. Keep the last known
+            # versions until the next scheduled reload rather than failing (and logging) on every request
+            logger.exception("Problem while retrieving the data versions for cache keys")
+            _data_versions = (monotonic() + settings.CACHE_DATA_VERSION_TIMEOUT, data_versions)
+            return data_versions
+        if last_submission_update is not None:
+            data_versions[SUBMISSIONS_DATA_VERSION] = last_submission_update.isoformat()
+        _data_versions = (monotonic() + settings.CACHE_DATA_VERSION_TIMEOUT, data_versions)
+    return data_versions
+
+
+def clear_data_versions() -> None:
+    global _data_versions
+    _data_versions = (0.0, {})
+
+
+class DataVersionKeyBit(bits.KeyBitBase):
+    """
+    Adds the version of the datasets a view depends on to the cache key so that its cached responses are replaced
+    once new data is loaded for any of them, while other responses stay cached. Views list the datasets they read
+    (see get_data_versions and the *_DATA_TYPES lists above) in "cache_data_types"; views without the list depend on
+    every dataset.
+    """
+
+    def get_data(self, params, view_instance, view_method, request, args, kwargs):
+        data_versions = get_data_versions()
+        data_types = getattr(view_instance, "cache_data_types", None)
+        if data_types is None:
+            return data_versions
+        return {data_type: data_versions.get(data_type) for data_type in data_types}
 
 
 class USAspendingKeyConstructor(DefaultKeyConstructor):
@@ -49,12 +114,12 @@ class USAspendingKeyConstructor(DefaultKeyConstructor):
 
     path_bit = PathKeyBit()
     request_params = GetPostQueryParamsKeyBit()
+    data_version = DataVersionKeyBit()
 
     def prepare_key(self, key_dict):
-        # Order the key_dict using the order_nested_object function to make sure cache keys are always exactly the same
-        ordered_key_dict = json.dumps(order_nested_object(key_dict))
-        key_hex = hashlib.md5(ordered_key_dict.encode("utf-8")).hexdigest()
-        return key_hex
+        # Hash the key_dict regardless of the order of its keys and lists to make sure cache keys are always exactly the
+        # same; the request params are already hashed by GetPostQueryParamsKeyBit so this only hashes a small dict
+        return hash_nested_object(key_dict)
 
 
 usaspending_key_func = USAspendingKeyConstructor()
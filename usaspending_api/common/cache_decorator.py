@@ -1,15 +1,23 @@
 # -*- coding: utf-8 -*-
 import logging
+import threading
 
+from collections import OrderedDict
 from collections.abc import Iterable
 from django.conf import settings
 from django.db.models import QuerySet
+from django.http import HttpResponse
+from django.http.response import HttpResponseBase
 from rest_framework_extensions.cache.decorators import CacheResponse
-from typing import Any
+from time import monotonic, sleep
+from typing import Any, Optional, Tuple
 from usaspending_api.common.experimental_api_flags import is_experimental_elasticsearch_api
 
 logger = logging.getLogger("console")
 
+# Headers describing how a single request was served; never stored with a cached response
+UNCACHED_HEADERS = ("Cache-Trace", "key")
+
 
 def contains_queryset(data: Any) -> bool:
     """Traverse a complex object and return True if a Queryset exists anywhere"""
@@ -26,7 +34,107 @@ def contains_queryset(data: Any) -> bool:
         return False
 
 
+class LocalResponseCache:
+    """
+    Least recently used cache of rendered responses kept in the memory of a single process. Its size is bounded by
+    the total bytes of the cached content and entries expire after a short timeout, since unlike the shared cache
+    this one can't be cleared for every process at once.
+    """
+
+    def __init__(self, max_bytes: int, timeout: int):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expiration time, size, cached response)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key: str, cached_response: tuple) -> None:
+        size = len(cached_response[0])
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._size + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+            self._entries[key] = (monotonic() + self.timeout, size, cached_response)
+            self._size += size
+
+    def _remove(self, key: str) -> None:
+        self._size -= self._entries.pop(key)[1]
+
+
+_local_response_cache = None
+
+
+def get_local_response_cache() -> Optional[LocalResponseCache]:
+    """Returns this process's LocalResponseCache or None if RESPONSE_LOCAL_CACHE_MAX_BYTES disables it"""
+    global _local_response_cache
+    if settings.RESPONSE_LOCAL_CACHE_MAX_BYTES <= 0:
+        return None
+    if _local_response_cache is None:
+        _local_response_cache = LocalResponseCache(
+            settings.RESPONSE_LOCAL_CACHE_MAX_BYTES, settings.RESPONSE_LOCAL_CACHE_TIMEOUT
+        )
+    return _local_response_cache
+
+
+def to_cached_response(response) -> Tuple[bytes, int, list]:
+    """Keeps only what is needed to rebuild a rendered response; cheaper to store than the pickled Response"""
+    headers = [(header, value) for header, value in response.items() if header not in UNCACHED_HEADERS]
+    return response.content, response.status_code, headers
+
+
+def from_cached_response(cached_response) -> HttpResponseBase:
+    # Responses cached before they were stored as tuples are still pickled Response objects
+    if isinstance(cached_response, HttpResponseBase):
+        return cached_response
+    content, status, headers = cached_response
+    response = HttpResponse(content=content, status=status)
+    for header, value in headers:
+        response[header] = value
+    return response
+
+
 class CustomCacheResponse(CacheResponse):
+    """
+    Caches rendered responses in the shared cache configured by REST_FRAMEWORK_EXTENSIONS. Views that are requested
+    often enough to benefit can opt in to a LocalResponseCache in front of it with cache_response(local_cache=True).
+
+    Identical requests that miss the cache at the same time are coalesced: the first one takes a short lived lock in
+    the shared cache and builds the response while the others poll the shared cache for it, so the response is only
+    built once across all processes.
+    """
+
+    # Hits and misses of the shared cache in this process, reported in the Cache-Trace header
+    shared_hits = 0
+    shared_misses = 0
+
+    def __init__(self, *args, local_cache: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.local_cache = local_cache
+
+    def __call__(self, func):
+        cached_func = super().__call__(func)
+        # Marks the view methods whose responses are cached, e.g. for warm_usaspending_cache to find them
+        cached_func.is_response_cached = True
+        return cached_func
+
     def process_cache_response(self, view_instance, view_method, request, args, kwargs):
         if is_experimental_elasticsearch_api(request):
             # bypass cache altogether
@@ -37,50 +145,139 @@ class CustomCacheResponse(CacheResponse):
         key = self.calculate_key(
             view_instance=view_instance, view_method=view_method, request=request, args=args, kwargs=kwargs
         )
-        response = None
-        try:
-            response = self.cache.get(key)
-        except Exception:
-            msg = "Problem while retrieving key [{k}] from cache for path:'{p}'"
-            logger.exception(msg.format(k=key, p=str(request.path)))
+        local_cache = get_local_response_cache() if self.local_cache else None
+        cached_response = None
+        cache_tier = None
 
-        if not response:
-            response = view_method(view_instance, request, *args, **kwargs)
-            response = view_instance.finalize_response(request, response, *args, **kwargs)
+        if local_cache is not None:
+            cached_response = local_cache.get(key)
+            cache_tier = "local"
 
-            # While returning a Queryset is functional most of the time, it isn't
-            # fully supported by Django Rest Framework. This check was inserted
-            # in local mode to catch if a Queryset is being returned by the view
-            # which could cause an exception when setting the cache
-            if settings.IS_LOCAL and response and not response.is_rendered:
-                if contains_queryset(response.data):
-                    raise RuntimeError(
-                        "Your view is returning a QuerySet. QuerySets are not"
-                        " really designed to be pickled and can cause caching"
-                        " issues. Please materialize the QuerySet using a List"
-                        " or some other more primitive data structure."
-                    )
+        lock_acquired = False
+        if not cached_response:
+            cached_response = self._get_from_shared_cache(key, request)
+            cache_tier = "shared"
+            self._count_shared_cache_lookup(bool(cached_response))
+            if not cached_response:
+                lock_acquired = self._acquire_lock(key, request)
+                if not lock_acquired:
+                    cached_response = self._wait_for_shared_cache(key, request)
+                    cache_tier = "coalesced"
+            if cached_response and local_cache is not None:
+                local_cache.set(key, to_cached_response(from_cached_response(cached_response)))
 
-            response["Cache-Trace"] = "no-cache"
-            response.render()  # should be rendered, before pickling while storing to cache
-
-            if not response.status_code >= 400 or self.cache_errors:
-                if self.cache_errors:
-                    logger.error(self.cache_errors)
-                try:
-                    self.cache.set(key, response, self.timeout)
-                    response["Cache-Trace"] = "set-cache"
-                except Exception:
-                    msg = "Problem while writing to cache: path:'{p}' data:'{d}'"
-                    logger.exception(msg.format(p=str(request.path), d=str(request.data)))
+        if not cached_response:
+            try:
+                response, cache_trace = self._build_response(
+                    view_instance, view_method, request, args, kwargs, key, local_cache
+                )
+            finally:
+                if lock_acquired:
+                    self._release_lock(key, request)
         else:
-            response["Cache-Trace"] = "hit-cache"
+            response = from_cached_response(cached_response)
+            cache_trace = f"hit-cache; tier={cache_tier}"
 
         if not hasattr(response, "_closable_objects"):
             response._closable_objects = []
 
+        response["Cache-Trace"] = self._build_cache_trace(cache_trace, local_cache)
         response["key"] = key
         return response
 
+    def _build_response(self, view_instance, view_method, request, args, kwargs, key, local_cache):
+        response = view_method(view_instance, request, *args, **kwargs)
+        response = view_instance.finalize_response(request, response, *args, **kwargs)
+
+        # While returning a Queryset is functional most of the time, it isn't
+        # fully supported by Django Rest Framework. This check was inserted
+        # in local mode to catch if a Queryset is being returned by the view
+        # which could cause an exception when setting the cache
+        if settings.IS_LOCAL and response and not response.is_rendered:
+            if contains_queryset(response.data):
+                raise RuntimeError(
+                    "Your view is returning a QuerySet. QuerySets are not"
+                    " really designed to be pickled and can cause caching"
+                    " issues. Please materialize the QuerySet using a List"
+                    " or some other more primitive data structure."
+                )
+
+        cache_trace = "no-cache"
+        response.render()  # should be rendered, before storing to cache
+
+        if not response.status_code >= 400 or self.cache_errors:
+            if self.cache_errors:
+                logger.error(self.cache_errors)
+            cached_response = to_cached_response(response)
+            try:
+                self.cache.set(key, cached_response, self.timeout)
+                cache_trace = "set-cache"
+            except Exception:
+                msg = "Problem while writing to cache: path:'{p}' data:'{d}'"
+                logger.exception(msg.format(p=str(request.path), d=str(request.data)))
+            if local_cache is not None:
+                local_cache.set(key, cached_response)
+
+        return response, cache_trace
+
+    def _get_from_shared_cache(self, key, request):
+        try:
+            return self.cache.get(key)
+        except Exception:
+            msg = "Problem while retrieving key [{k}] from cache for path:'{p}'"
+            logger.exception(msg.format(k=key, p=str(request.path)))
+            return None
+
+    def _acquire_lock(self, key, request) -> bool:
+        """Returns False if another request is already building the response for this key"""
+        try:
+            return self.cache.add(f"{key}:lock", True, settings.CACHE_COALESCING_LOCK_TIMEOUT)
+        except Exception:
+            msg = "Problem while locking key [{k}] in cache for path:'{p}'"
+            logger.exception(msg.format(k=key, p=str(request.path)))
+            return True
+
+    def _release_lock(self, key, request) -> None:
+        try:
+            self.cache.delete(f"{key}:lock")
+        except Exception:
+            msg = "Problem while unlocking key [{k}] in cache for path:'{p}'"
+            logger.exception(msg.format(k=key, p=str(request.path)))
+
+    def _wait_for_shared_cache(self, key, request):
+        """
+        Polls the shared cache for the response of the request holding the lock. Gives up, leaving this request to
+        build the response itself, once the lock is gone without a response being cached (e.g. an error response) or
+        after CACHE_COALESCING_MAX_WAIT seconds.
+        """
+        lock_key = f"{key}:lock"
+        give_up_at = monotonic() + settings.CACHE_COALESCING_MAX_WAIT
+        while monotonic() < give_up_at:
+            sleep(settings.CACHE_COALESCING_POLL_INTERVAL)
+            try:
+                cached = self.cache.get_many([key, lock_key])
+            except Exception:
+                msg = "Problem while waiting for key [{k}] in cache for path:'{p}'"
+                logger.exception(msg.format(k=key, p=str(request.path)))
+                return None
+            if cached.get(key):
+                return cached[key]
+            if lock_key not in cached:
+                return None
+        return None
+
+    @classmethod
+    def _count_shared_cache_lookup(cls, hit: bool) -> None:
+        if hit:
+            cls.shared_hits += 1
+        else:
+            cls.shared_misses += 1
+
+    @classmethod
+    def _build_cache_trace(cls, cache_trace: str, local_cache: Optional[LocalResponseCache]) -> str:
+        if local_cache is not None:
+            cache_trace += f"; local-hits={local_cache.hits}; local-misses={local_cache.misses}"
+        return f"{cache_trace}; shared-hits={cls.shared_hits}; shared-misses={cls.shared_misses}"
+
 
 cache_response = CustomCacheResponse
@@ -1,7 +1,9 @@
-from typing import Union, Optional
+from typing import Callable, Union, Optional
 
 import certifi
 import logging
+import os
+import threading
 
 from django.conf import settings
 from elasticsearch import Elasticsearch
@@ -16,7 +18,19 @@ ElasticsearchResponse = Optional[Union[dict, Response]]
 
 
 def instantiate_elasticsearch_client() -> Elasticsearch:
-    es_kwargs = {"timeout": 300}
+    """Client for long-running ETL requests, shared by everything in the current process"""
+    return _get_shared_client("etl", _build_etl_client)
+
+
+def create_es_client() -> Elasticsearch:
+    """Client for API queries, shared by everything in the current process"""
+    global CLIENT
+    CLIENT = _get_shared_client("api", _build_api_client)
+    return CLIENT
+
+
+def _build_etl_client() -> Elasticsearch:
+    es_kwargs = {"timeout": 300, **_connection_pool_config()}
 
     if "https" in settings.ES_HOSTNAME:
         es_kwargs.update({"use_ssl": True, "verify_certs": True, "ca_certs": certifi.where()})
@@ -24,11 +38,10 @@ def instantiate_elasticsearch_client() -> Elasticsearch:
     return Elasticsearch(settings.ES_HOSTNAME, **es_kwargs)
 
 
-def create_es_client() -> Elasticsearch:
+def _build_api_client() -> Optional[Elasticsearch]:
     if settings.ES_HOSTNAME is None or settings.ES_HOSTNAME == "":
         logger.error("env var 'ES_HOSTNAME' needs to be set for Elasticsearch connection")
-    global CLIENT
-    es_config = {"hosts": [settings.ES_HOSTNAME], "timeout": settings.ES_TIMEOUT}
+    es_config = {"hosts": [settings.ES_HOSTNAME], "timeout": settings.ES_TIMEOUT, **_connection_pool_config()}
     try:
         # If the connection string is using SSL with localhost, disable verifying
         # the certificates to allow testing in a development environment
@@ -43,6 +56,51 @@ def create_es_client() -> Elasticsearch:
             ssl_context.verify_mode = CERT_NONE
             es_config["ssl_context"] = ssl_context
 
-        CLIENT = Elasticsearch(**es_config)
+        return Elasticsearch(**es_config)
     except Exception as e:
         logger.error("Error creating the elasticsearch client: {}".format(e))
+
+
+def _connection_pool_config() -> dict:
+    config = {"maxsize": settings.ES_CLIENT_MAX_CONNECTIONS}
+    if settings.ES_CLIENT_SNIFF:
+        config.update(
+            {
+                "sniff_on_start": True,
+                "sniff_on_connection_fail": True,
+                "sniffer_timeout": settings.ES_CLIENT_SNIFFER_TIMEOUT,
+            }
+        )
+    return config
+
+
+def _get_shared_client(client_type: str, build_client: Callable[[], Optional[Elasticsearch]]) -> Elasticsearch:
+    """
+    Building an Elasticsearch client creates a new connection pool, so every query made with a fresh client pays for
+    new TCP (and TLS) connections. Instead, clients are built on first use and then reused for the life of the
+    process; their connections are kept alive between requests and are safe to share between threads.
+    """
+    key = (client_type, settings.ES_HOSTNAME)
+    client = _shared_clients.get(key)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = build_client()
+                if client is not None:
+                    _shared_clients[key] = client
+    return client
+
+
+def _reset_shared_clients() -> None:
+    """A forked process must not use the connections of its parent's clients, so it starts without any"""
+    global _shared_clients, _shared_clients_lock, CLIENT
+    _shared_clients = {}
+    _shared_clients_lock = threading.Lock()
+    CLIENT = None
+
+
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_clients)
@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+from ddtrace import tracer
+from django.conf import settings
+from django.db import close_old_connections, connections
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+# Worker threads, by number of workers, shared by the API requests of this process. The threads live as long as the
+# process so their database connections are reused across requests, for up to CONN_MAX_AGE like any other connection
+_executors: Dict[int, ThreadPoolExecutor] = {}
+_executors_lock = Lock()
+
+
+def run_concurrently(queries: Dict[str, Callable[[], Any]], max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Runs the independent Elasticsearch and Postgres queries of one API request at the same time so that the request
+    takes as long as its slowest query rather than all of them added up.
+
+        results = run_concurrently({"totals": lambda: get_totals(filters), "location": lambda: get_location(id)})
+
+    Args:
+        queries: callables, by name, that each run a query and return its result
+        max_workers: number of worker threads, shared by all requests, that run the queries; defaults to
+            API_CONCURRENT_QUERIES_MAX_WORKERS
+    Returns:
+        the result of each callable, by name. If any raise, the exception of the first one (in the order given) is
+        raised once they have all finished
+    """
+    max_workers = max_workers or settings.API_CONCURRENT_QUERIES_MAX_WORKERS
+
+    # Worker threads use their own database connections, which can't see the uncommitted changes of a transaction on
+    # this thread's connections (e.g. within tests)
+    if min(max_workers, len(queries)) <= 1 or any(connection.in_atomic_block for connection in connections.all()):
+        return {name: _run_query(name, query) for name, query in queries.items()}
+
+    executor = _get_executor(max_workers)
+    futures = {name: executor.submit(_run_query_in_worker_thread, name, query) for name, query in queries.items()}
+    # Wait for all of them before raising so that no query is left running for a request that already failed
+    for future in futures.values():
+        future.exception()
+    return {name: future.result() for name, future in futures.items()}
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"concurrent-query-{max_workers}"
+            )
+        return _executors[max_workers]
+
+
+def _run_query(name: str, query: Callable[[], Any]) -> Any:
+    # The futures integration of ddtrace carries the request's trace over to the worker threads
+    with tracer.trace("api.concurrent_query", resource=name):
+        return query()
+
+
+def _run_query_in_worker_thread(name: str, query: Callable[[], Any]) -> Any:
+    # Worker threads don't get Django's request_started and request_finished signals, which close the connections
+    # that are broken or older than CONN_MAX_AGE, so do the same around each query
+    close_old_connections()
+    try:
+        return _run_query(name, query)
+    finally:
+        close_old_connections()
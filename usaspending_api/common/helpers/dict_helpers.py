@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 from collections import OrderedDict
 from typing import List
 
@@ -90,3 +93,43 @@ def update_list_of_dictionaries(to_update: List[dict], update_with: List[dict],
     update_with = {val[common_term]: val for val in update_with}
     to_update.update(update_with)
     return [val for val in to_update.values()]
+
+
+# Filters whose filter tree values are positional; see order_nested_filter_tree_object
+FILTER_TREE_KEYS = (NaicsCodes.underscore_name, PSCCodesMixin.underscore_name, TasCodes.underscore_name)
+
+
+def hash_nested_object(nested_object) -> str:
+    """
+    Returns a hex digest of the item that is the same for any two items that order_nested_object would make equal.
+    Faster than dumping the result of order_nested_object to JSON since lists are sorted in place of building ordered
+    copies of every dict, and the keys of dicts are left for json.dumps to sort in a single pass.
+    """
+    canonical_json = json.dumps(_sort_nested_lists(nested_object), sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical_json.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _sort_nested_lists(nested_object, filter_tree: bool = False):
+    if isinstance(nested_object, dict):
+        return {
+            key: sorted(value)
+            # Only the outer list of a filter tree is sorted since the position of the values in the inner lists is
+            # important
+            if filter_tree and key in ("require", "exclude") and isinstance(value, list)
+            else _sort_nested_lists(value, key in FILTER_TREE_KEYS and isinstance(value, dict))
+            for key, value in nested_object.items()
+        }
+    elif isinstance(nested_object, list):
+        if len(nested_object) > 0 and not isinstance(nested_object[0], (dict, list)):
+            try:
+                return sorted(nested_object)
+            except TypeError:
+                # Values of different types (e.g. numbers and strings) can't be compared; sorted by their JSON below
+                pass
+        return sorted((_sort_nested_lists(item) for item in nested_object), key=_sort_key)
+    else:
+        return nested_object
+
+
+def _sort_key(item) -> str:
+    return json.dumps(item, sort_keys=True)
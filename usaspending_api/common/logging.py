@@ -32,6 +32,7 @@ class LoggingMiddleware(MiddlewareMixin):
       "status": "INFO", (Level name of log)
       "method": "POST", (Request method type)
       "path": "/api/v2/download/count/", (Path request was made from)
+      "query_string": "page=1", (Query string of the request, without the leading "?")
       "status_code": "200", (Status response)
       "remote_addr": "127.0.0.1", (IP address where request came from)
       "host": "localhost:8000", (Host name or IP address)
@@ -62,6 +63,7 @@ class LoggingMiddleware(MiddlewareMixin):
 
         self.log = {
             "path": request.path,
+            "query_string": request.META.get("QUERY_STRING", ""),
             "remote_addr": get_remote_addr(request),
             "host": request.get_host(),
             "method": request.method,
@@ -0,0 +1,92 @@
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from time import perf_counter
+
+from usaspending_api.common.helpers.dict_helpers import hash_nested_object, order_nested_object
+
+logger = logging.getLogger("script")
+
+CONTRACTS_PATH = settings.APP_DIR / "api_contracts" / "contracts" / "v2" / "search"
+
+# Example requests of the busiest cached search endpoints, taken from their API contracts
+CONTRACT_ENDPOINTS = [
+    "spending_by_award",
+    "spending_by_award_count",
+    "spending_by_category",
+    "spending_by_geography",
+    "spending_over_time",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Micro-benchmark of building API cache keys with order_nested_object, json.dumps and MD5 versus "
+        "hash_nested_object, on the example requests from the search API contracts with their filters enlarged."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--filter-values",
+            type=int,
+            default=5000,
+            help="Number of TAS codes, recipient ids and other filter values added to each example request",
+        )
+        parser.add_argument("--runs", type=int, default=20, help="Number of timed runs; the best run is reported")
+
+    def handle(self, *args, **options):
+        requests = [
+            enlarge_filters(load_contract_request(endpoint), options["filter_values"])
+            for endpoint in CONTRACT_ENDPOINTS
+        ]
+
+        for endpoint, request in zip(CONTRACT_ENDPOINTS, requests):
+            key_dict = {"path": {"path": f"/api/v2/search/{endpoint}/"}}
+            baseline = min(time_cache_key(ordered_json_md5_key, key_dict, request) for _ in range(options["runs"]))
+            hashed = min(time_cache_key(hashed_key, key_dict, request) for _ in range(options["runs"]))
+            logger.info(
+                f"{endpoint} ({len(json.dumps(request)):,} bytes): order_nested_object + json.dumps + MD5 "
+                f"{baseline * 1000:.2f}ms, hash_nested_object {hashed * 1000:.2f}ms ({baseline / hashed:.1f}x)"
+            )
+
+
+def ordered_json_md5_key(key_dict: dict, request: dict) -> str:
+    """How cache keys were built before hash_nested_object"""
+    key_dict = {**key_dict, "request": {"request": json.dumps(order_nested_object(request))}}
+    return hashlib.md5(json.dumps(order_nested_object(key_dict)).encode("utf-8")).hexdigest()
+
+
+def hashed_key(key_dict: dict, request: dict) -> str:
+    return hash_nested_object({**key_dict, "request": {"request": hash_nested_object(request)}})
+
+
+def time_cache_key(key_function, key_dict: dict, request: dict) -> float:
+    start = perf_counter()
+    key_function(key_dict, request)
+    return perf_counter() - start
+
+
+def load_contract_request(endpoint: str) -> dict:
+    """Returns the first request body in the API contract of the endpoint"""
+    contract = (CONTRACTS_PATH / f"{endpoint}.md").read_text()
+    body = contract[contract.index("+ Body", contract.index("+ Request")) + len("+ Body") :]
+    request, _ = json.JSONDecoder().raw_decode(body.lstrip())
+    return request
+
+
+def enlarge_filters(request: dict, filter_value_count: int) -> dict:
+    """Adds the kinds of long filter lists that make cache keys expensive to build"""
+    filters = dict(request.get("filters", {}))
+    filters["tas_codes"] = {
+        "require": [["091", f"091-{i:04}", f"091-{i:04}-000"] for i in range(filter_value_count)],
+        "exclude": [["012", f"012-{i:04}"] for i in range(filter_value_count // 10)],
+    }
+    filters["recipient_search_text"] = [f"{i:09}" for i in reversed(range(filter_value_count))]
+    filters["place_of_performance_locations"] = [
+        {"country": "USA", "state": f"S{i % 56}", "county": f"{i % 1000:03}"} for i in range(filter_value_count // 10)
+    ]
+    filters["award_ids"] = [f"AWARD-{i}" for i in reversed(range(filter_value_count))]
+    return {**request, "filters": filters}
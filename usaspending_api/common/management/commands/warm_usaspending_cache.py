@@ -0,0 +1,145 @@
+import json
+import logging
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.urls import Resolver404, resolve
+from time import perf_counter
+from urllib.parse import urlsplit
+
+from usaspending_api.common.helpers.dict_helpers import hash_nested_object
+
+logger = logging.getLogger("script")
+
+
+class Command(BaseCommand):
+    """
+    This command will replay API requests to populate the usaspending-cache (useful after a load or a cache clear
+    so that the first users of the most popular requests don't wait on the slow Elasticsearch and Postgres queries
+    behind them)
+    """
+
+    help = "Replays popular API requests from server logs or a request file to populate the usaspending-cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--server-log",
+            nargs="+",
+            default=[],
+            help="Server log files written by the LoggingMiddleware; their most popular successful requests are replayed",
+        )
+        parser.add_argument(
+            "--request-file",
+            nargs="+",
+            default=[],
+            help='JSON lines files of requests to replay, e.g. {"method": "POST", "path": "/api/v2/...", "request": {}}',
+        )
+        parser.add_argument(
+            "--top", type=int, default=200, help="Number of the most popular requests from the server logs to replay"
+        )
+        parser.add_argument("--concurrency", type=int, default=4, help="Number of requests replayed at the same time")
+        parser.add_argument(
+            "--time-budget",
+            type=int,
+            default=900,
+            help="Seconds after which no more requests are started; requests already running are allowed to finish",
+        )
+
+    def handle(self, *args, **options):
+        if not options["server_log"] and not options["request_file"]:
+            raise CommandError("Provide --server-log and/or --request-file with the requests to replay")
+
+        requests = read_requests(options["request_file"]) + most_popular_requests(
+            read_requests(options["server_log"], server_log=True), options["top"]
+        )
+        logger.info(f"Replaying {len(requests):,} requests with a concurrency of {options['concurrency']}")
+
+        give_up_at = perf_counter() + options["time_budget"]
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            results = list(executor.map(lambda request: replay_request(request, give_up_at), requests))
+
+        cache_traces = Counter(result.split(";")[0] for result in results)
+        logger.info(", ".join(f"{cache_trace}: {count:,}" for cache_trace, count in sorted(cache_traces.items())))
+
+
+def read_requests(file_paths: list, server_log: bool = False) -> list:
+    """
+    Reads requests from JSON lines files, either of the LoggingMiddleware's log entries (server_log) or in the same
+    shape. Only requests to views with cached responses are kept; others wouldn't warm the cache and could have side
+    effects, such as queueing a download.
+    """
+    requests = []
+    for file_path in file_paths:
+        with open(file_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                method, path = entry.get("method"), entry.get("path", "")
+                if method not in ("GET", "POST") or not is_response_cached(method, path):
+                    continue
+                if server_log:
+                    if not 200 <= int(entry.get("status_code") or 0) < 300:
+                        continue
+                    if method == "GET":
+                        if "query_string" not in entry:
+                            # Logged before query strings were, so the request can't be replayed as it was made
+                            continue
+                        if entry["query_string"]:
+                            path = f"{path}?{entry['query_string']}"
+                body = entry.get("request") or {}
+                if isinstance(body, str):
+                    try:
+                        body = json.loads(body)
+                    except ValueError:
+                        continue
+                requests.append({"method": method, "path": path, "request": body})
+    return requests
+
+
+def is_response_cached(method: str, path: str) -> bool:
+    """Whether the view that handles the request caches its response"""
+    try:
+        view = resolve(urlsplit(path).path).func
+    except Resolver404:
+        return False
+    # ViewSets map the request methods to their actions
+    actions = getattr(view, "actions", None) or {}
+    handler = getattr(getattr(view, "cls", None), actions.get(method.lower(), method.lower()), None)
+    return getattr(handler, "is_response_cached", False)
+
+
+def most_popular_requests(requests: list, top: int) -> list:
+    popularity = Counter()
+    requests_by_key = {}
+    for request in requests:
+        key = hash_nested_object(request)
+        popularity[key] += 1
+        requests_by_key.setdefault(key, request)
+    return [requests_by_key[key] for key, _ in popularity.most_common(top)]
+
+
+def replay_request(request: dict, give_up_at: float) -> str:
+    """Returns the Cache-Trace of the response, describing whether it was cached"""
+    if perf_counter() >= give_up_at:
+        return "skipped"
+
+    client = Client(raise_request_exception=False)
+    start = perf_counter()
+    try:
+        if request["method"] == "POST":
+            response = client.post(
+                request["path"], data=json.dumps(request["request"]), content_type="application/json"
+            )
+        else:
+            response = client.get(request["path"], data=request["request"])
+    finally:
+        # Each thread opens its own database connections
+        connections.close_all()
+
+    cache_trace = response.get("Cache-Trace", f"status-{response.status_code}")
+    logger.info(f"{request['method']} {request['path']} {response.status_code} in {perf_counter() - start:.2f}s")
+    return cache_trace
@@ -1,10 +1,15 @@
 import copy
+import json
 import logging
+import threading
 
+from collections import OrderedDict
 from django.conf import settings
 from elasticsearch_dsl import Q as ES_Q
-from typing import List, Tuple
+from time import monotonic, perf_counter
+from typing import Callable, List, Tuple
 from usaspending_api.common.exceptions import InvalidParameterException
+from usaspending_api.common.helpers.dict_helpers import hash_nested_object
 from usaspending_api.references.models import DisasterEmergencyFundCode
 from usaspending_api.search.filters.elasticsearch.filter import _Filter, _QueryType
 from usaspending_api.search.filters.elasticsearch.naics import NaicsCodes
@@ -501,7 +506,54 @@ class _NonzeroFields(_Filter):
         return ES_Q("bool", should=non_zero_queries, minimum_should_match=1)
 
 
+class CompiledQueryCache:
+    """
+    Least recently used cache of the Elasticsearch queries compiled from filters, so that the sibling requests a
+    search page sends with the same filters only compile them once per process. Queries are stored as JSON so every
+    caller gets its own ES_Q to modify, and they expire after QUERY_WITH_FILTERS_CACHE_TIMEOUT seconds since some
+    filters look up reference data (e.g. DEF Codes) while compiling.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.compile_seconds = 0.0
+        self._entries = OrderedDict()  # key -> (expiration time, query as JSON)
+        self._lock = threading.Lock()
+
+    def get_or_compile(self, key: str, compile_query: Callable[[], ES_Q]) -> ES_Q:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return ES_Q(json.loads(entry[1]))
+
+        start = perf_counter()
+        query = compile_query()
+        compile_seconds = perf_counter() - start
+
+        with self._lock:
+            self.misses += 1
+            self.compile_seconds += compile_seconds
+            self._entries[key] = (monotonic() + settings.QUERY_WITH_FILTERS_CACHE_TIMEOUT, json.dumps(query.to_dict()))
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.QUERY_WITH_FILTERS_CACHE_SIZE:
+                self._entries.popitem(last=False)
+            logger.debug(
+                f"Compiled Elasticsearch query in {compile_seconds * 1000:.1f}ms; "
+                f"{self.hits:,} hits and {self.misses:,} misses with {self.compile_seconds:.2f}s spent compiling"
+            )
+        return query
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class QueryWithFilters:
+    compiled_query_cache = CompiledQueryCache()
+
     filter_lookup = {
         _Keywords.underscore_name: _Keywords,
         _KeywordSearch.underscore_name: _KeywordSearch,
@@ -538,6 +590,19 @@ class QueryWithFilters:
 
     @classmethod
     def _generate_elasticsearch_query(cls, filters: dict, query_type: _QueryType, **options) -> ES_Q:
+        if settings.QUERY_WITH_FILTERS_CACHE_SIZE <= 0:
+            return cls._compile_elasticsearch_query(filters, query_type, **options)
+        try:
+            key = hash_nested_object({"filters": filters, "query_type": query_type.value, "options": options})
+        except TypeError:
+            # Filters that aren't JSON serializable can't be cached
+            return cls._compile_elasticsearch_query(filters, query_type, **options)
+        return cls.compiled_query_cache.get_or_compile(
+            key, lambda: cls._compile_elasticsearch_query(filters, query_type, **options)
+        )
+
+    @classmethod
+    def _compile_elasticsearch_query(cls, filters: dict, query_type: _QueryType, **options) -> ES_Q:
         nested_path = options.pop("nested_path", "")
 
         must_queries = []
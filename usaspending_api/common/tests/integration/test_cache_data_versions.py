@@ -0,0 +1,48 @@
+import pytest
+
+from model_bakery import baker
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from usaspending_api.broker.models import ExternalDataLoadDate
+from usaspending_api.common.cache import clear_data_versions, usaspending_key_func
+
+
+class AllDataView:
+    def get(self, request):
+        pass
+
+
+class FpdsView(AllDataView):
+    cache_data_types = ["fpds"]
+
+
+@pytest.fixture
+def load_dates(db):
+    clear_data_versions()
+    baker.make("broker.ExternalDataType", name="fpds", external_data_type_id=1)
+    baker.make("broker.ExternalDataType", name="fabs", external_data_type_id=2)
+    baker.make("broker.ExternalDataLoadDate", last_load_date="2020-03-01", external_data_type_id=1)
+    baker.make("broker.ExternalDataLoadDate", last_load_date="2020-08-01", external_data_type_id=2)
+    yield
+    clear_data_versions()
+
+
+def calculate_key(view_instance):
+    request = Request(APIRequestFactory().get("/api/v2/test/"))
+    request.accepted_renderer = JSONRenderer()
+    return usaspending_key_func(
+        view_instance=view_instance, view_method=view_instance.get, request=request, args=(), kwargs={}
+    )
+
+
+def test_key_changes_with_data_version(load_dates):
+    all_data_key = calculate_key(AllDataView())
+    fpds_key = calculate_key(FpdsView())
+
+    ExternalDataLoadDate.objects.filter(external_data_type_id=2).update(last_load_date="2020-08-02")
+    clear_data_versions()
+
+    assert calculate_key(AllDataView()) != all_data_key
+    assert calculate_key(FpdsView()) == fpds_key
@@ -0,0 +1,42 @@
+import pytest
+
+from django.db import connection, connections
+from model_bakery import baker
+from threading import Barrier, current_thread
+
+from usaspending_api.common.helpers.concurrency_helpers import run_concurrently
+
+
+@pytest.fixture
+def close_worker_thread_connections():
+    yield
+    # The worker threads outlive the test, so close their connections to let the test database be dropped
+    barrier = Barrier(2, timeout=5)
+
+    def close_connections():
+        barrier.wait()
+        connections.close_all()
+
+    run_concurrently({"first": close_connections, "second": close_connections}, max_workers=2)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_concurrently_queries_database_in_worker_threads(close_worker_thread_connections):
+    # Committed, unlike in a test within a transaction, so that the worker threads' connections can see it
+    baker.make("references.RefCountryCode", country_code="USA", country_name="UNITED STATES")
+    barrier = Barrier(2, timeout=5)
+
+    def query():
+        # Both worker threads run one of the queries
+        barrier.wait()
+        with connection.cursor() as cursor:
+            cursor.execute("select pg_backend_pid(), country_name from ref_country_code")
+            return current_thread().name, cursor.fetchone()
+
+    first = run_concurrently({"first": query, "second": query}, max_workers=2)
+    second = run_concurrently({"first": query, "second": query}, max_workers=2)
+
+    assert {country_name for _, (_, country_name) in list(first.values()) + list(second.values())} == {"UNITED STATES"}
+    # Each worker thread reuses its database connection
+    assert len(dict(first.values())) == 2
+    assert dict(first.values()) == dict(second.values())
@@ -0,0 +1,23 @@
+from unittest.mock import patch
+
+from usaspending_api.common import cache
+from usaspending_api.common.cache import clear_data_versions, get_data_versions
+
+
+def test_failed_data_version_lookup_is_retried_after_timeout(settings):
+    settings.CACHE_DATA_VERSION_TIMEOUT = 60
+    clear_data_versions()
+    with patch.object(cache, "get_all_last_load_dates", side_effect=Exception("no database")) as lookup, patch.object(
+        cache.logger, "exception"
+    ) as log_exception:
+        with patch.object(cache, "monotonic", return_value=100):
+            assert get_data_versions() == {}
+            assert get_data_versions() == {}
+        assert lookup.call_count == 1
+        assert log_exception.call_count == 1
+
+        with patch.object(cache, "monotonic", return_value=161):
+            assert get_data_versions() == {}
+        assert lookup.call_count == 2
+        assert log_exception.call_count == 2
+    clear_data_versions()
@@ -0,0 +1,105 @@
+import pytest
+
+from django.core.cache import caches
+from threading import Timer
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from unittest.mock import patch
+
+from usaspending_api.common import cache_decorator
+from usaspending_api.common.cache_decorator import LocalResponseCache, cache_response
+
+
+@pytest.fixture
+def local_cache(settings):
+    settings.RESPONSE_LOCAL_CACHE_MAX_BYTES = 1000
+    settings.RESPONSE_LOCAL_CACHE_TIMEOUT = 30
+    caches["default"].clear()
+    with patch.object(cache_decorator, "_local_response_cache", None), patch(
+        "usaspending_api.common.cache.get_data_versions", return_value={}
+    ):
+        yield
+
+
+class CountingView(APIView):
+    calls = 0
+
+    @cache_response(local_cache=True, cache="default")
+    def get(self, request):
+        CountingView.calls += 1
+        return Response({"calls": CountingView.calls})
+
+
+def test_local_response_cache_evicts_least_recently_used():
+    cache = LocalResponseCache(max_bytes=10, timeout=30)
+    cache.set("a", (b"aaaa", 200, []))
+    cache.set("b", (b"bbbb", 200, []))
+    assert cache.get("a") == (b"aaaa", 200, [])
+
+    cache.set("c", (b"cccc", 200, []))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_local_response_cache_skips_oversized_and_expired_responses():
+    cache = LocalResponseCache(max_bytes=10, timeout=30)
+    cache.set("big", (b"x" * 11, 200, []))
+    assert cache.get("big") is None
+
+    with patch.object(cache_decorator, "monotonic", return_value=0):
+        cache.set("a", (b"aaaa", 200, []))
+    with patch.object(cache_decorator, "monotonic", return_value=31):
+        assert cache.get("a") is None
+
+
+def test_cache_response_serves_from_local_then_shared_cache(local_cache):
+    CountingView.calls = 0
+    view = CountingView.as_view()
+
+    first = view(APIRequestFactory().get("/api/v2/test/"))
+    assert first.status_code == 200
+    assert first["Cache-Trace"].startswith("set-cache;")
+
+    second = view(APIRequestFactory().get("/api/v2/test/"))
+    assert second["Cache-Trace"].startswith("hit-cache; tier=local;")
+    assert second.content == first.content
+    assert second["Content-Type"] == first["Content-Type"]
+
+    with patch.object(cache_decorator, "_local_response_cache", None):
+        third = view(APIRequestFactory().get("/api/v2/test/"))
+    assert third["Cache-Trace"].startswith("hit-cache; tier=shared;")
+    assert third.content == first.content
+    assert CountingView.calls == 1
+
+
+def test_cache_response_waits_for_identical_request_in_progress(local_cache, settings):
+    settings.CACHE_COALESCING_POLL_INTERVAL = 0.01
+    CountingView.calls = 0
+    view = CountingView.as_view()
+    first = view(APIRequestFactory().get("/api/v2/test/"))
+    key = first["key"]
+
+    # Another request is building the response and caches it shortly
+    shared_cache = caches["default"]
+    cached_response = shared_cache.get(key)
+    shared_cache.delete(key)
+    shared_cache.add(f"{key}:lock", True)
+    Timer(0.05, shared_cache.set, (key, cached_response)).start()
+
+    with patch.object(cache_decorator, "_local_response_cache", None):
+        coalesced = view(APIRequestFactory().get("/api/v2/test/"))
+    assert coalesced["Cache-Trace"].startswith("hit-cache; tier=coalesced;")
+    assert coalesced.content == first.content
+    assert CountingView.calls == 1
+
+    # Another request held the lock but didn't cache its response
+    shared_cache.delete(key)
+    Timer(0.05, shared_cache.delete, (f"{key}:lock",)).start()
+
+    with patch.object(cache_decorator, "_local_response_cache", None):
+        rebuilt = view(APIRequestFactory().get("/api/v2/test/"))
+    assert rebuilt["Cache-Trace"].startswith("set-cache;")
+    assert CountingView.calls == 2
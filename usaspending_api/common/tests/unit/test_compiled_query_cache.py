@@ -0,0 +1,45 @@
+from elasticsearch_dsl import Q as ES_Q
+from unittest.mock import Mock, patch
+
+from usaspending_api.common import query_with_filters
+from usaspending_api.common.query_with_filters import CompiledQueryCache
+
+
+def test_compiled_query_cache_reuses_queries_until_they_expire(settings):
+    settings.QUERY_WITH_FILTERS_CACHE_SIZE = 10
+    settings.QUERY_WITH_FILTERS_CACHE_TIMEOUT = 300
+    cache = CompiledQueryCache()
+    compile_query = Mock(return_value=ES_Q("bool", must=[ES_Q("match", award_id="A")]))
+
+    with patch.object(query_with_filters, "monotonic", return_value=0):
+        first = cache.get_or_compile("a", compile_query)
+        second = cache.get_or_compile("a", compile_query)
+    assert compile_query.call_count == 1
+    assert second == first
+
+    # Callers modify the queries they get, which mustn't change the cached query
+    second.must.append(ES_Q("match", award_id="B"))
+    with patch.object(query_with_filters, "monotonic", return_value=0):
+        assert cache.get_or_compile("a", compile_query) == first
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    with patch.object(query_with_filters, "monotonic", return_value=301):
+        cache.get_or_compile("a", compile_query)
+    assert compile_query.call_count == 2
+
+
+def test_compiled_query_cache_evicts_least_recently_used(settings):
+    settings.QUERY_WITH_FILTERS_CACHE_SIZE = 2
+    cache = CompiledQueryCache()
+    compile_query = Mock(side_effect=lambda: ES_Q("match_all"))
+
+    cache.get_or_compile("a", compile_query)
+    cache.get_or_compile("b", compile_query)
+    cache.get_or_compile("a", compile_query)
+    cache.get_or_compile("c", compile_query)
+    assert compile_query.call_count == 3
+
+    cache.get_or_compile("a", compile_query)
+    assert compile_query.call_count == 3
+    cache.get_or_compile("b", compile_query)
+    assert compile_query.call_count == 4
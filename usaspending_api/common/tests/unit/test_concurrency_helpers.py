@@ -0,0 +1,53 @@
+import pytest
+
+from threading import Barrier, current_thread, main_thread
+
+from usaspending_api.common.helpers.concurrency_helpers import run_concurrently
+
+
+def test_run_concurrently_runs_queries_at_the_same_time():
+    # Each query waits for the other, which only returns if they are running at the same time
+    barrier = Barrier(2, timeout=5)
+
+    def query(result):
+        barrier.wait()
+        return result
+
+    results = run_concurrently({"first": lambda: query("a"), "second": lambda: query("b")})
+    assert results == {"first": "a", "second": "b"}
+
+
+def test_run_concurrently_runs_queries_one_after_another_with_one_worker():
+    results = run_concurrently({"first": current_thread, "second": current_thread}, max_workers=1)
+    assert results == {"first": main_thread(), "second": main_thread()}
+
+
+def test_run_concurrently_raises_first_exception_after_all_queries_finish():
+    finished = []
+
+    def fail(message):
+        raise ValueError(message)
+
+    with pytest.raises(ValueError, match="first"):
+        run_concurrently(
+            {
+                "first": lambda: fail("first"),
+                "second": lambda: fail("second"),
+                "third": lambda: finished.append("third"),
+            }
+        )
+    assert finished == ["third"]
+
+
+def test_run_concurrently_reuses_worker_threads():
+    barrier = Barrier(2, timeout=5)
+
+    def query():
+        barrier.wait()
+        return current_thread()
+
+    first = run_concurrently({"first": query, "second": query}, max_workers=2)
+    second = run_concurrently({"first": query, "second": query}, max_workers=2)
+    assert len(set(first.values())) == 2
+    assert set(first.values()) == set(second.values())
+    assert main_thread() not in first.values()
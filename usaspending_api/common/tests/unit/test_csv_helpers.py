@@ -0,0 +1,68 @@
+import os
+
+from io import BytesIO
+from tempfile import TemporaryDirectory
+
+from usaspending_api.common.csv_helpers import (
+    DelimitedRowCounter,
+    _iter_delimited_row_boundaries,
+    iter_delimited_rows,
+    partition_large_delimited_file,
+)
+
+TEST_DATA = b'id,description\n1,simple\n2,"has ""quotes"""\n3,"spans\nmultiple\nlines"\n4,"comma, and ""\nnewline"""\n'
+
+
+def test_iter_delimited_rows():
+    rows = list(iter_delimited_rows(BytesIO(TEST_DATA)))
+
+    assert rows == [
+        b"id,description\n",
+        b"1,simple\n",
+        b'2,"has ""quotes"""\n',
+        b'3,"spans\nmultiple\nlines"\n',
+        b'4,"comma, and ""\nnewline"""\n',
+    ]
+    assert b"".join(rows) == TEST_DATA
+
+
+def test_iter_delimited_rows_without_trailing_newline():
+    assert list(iter_delimited_rows(BytesIO(b'a\n"b\nc"'))) == [b"a\n", b'"b\nc"']
+
+
+def test_delimited_row_counter():
+    for chunk_size in (1, 2, 3, 7, len(TEST_DATA)):
+        row_counter = DelimitedRowCounter()
+        for i in range(0, len(TEST_DATA), chunk_size):
+            row_counter.update(TEST_DATA[i : i + chunk_size])
+        assert row_counter.row_count == 5
+
+
+def test_iter_delimited_row_boundaries():
+    row_ends = [sum(len(row) for row in list(iter_delimited_rows(BytesIO(TEST_DATA)))[:i]) for i in range(1, 6)]
+
+    for chunk_size in (1, 2, 3, 7, len(TEST_DATA)):
+        assert list(_iter_delimited_row_boundaries(TEST_DATA, 0, 1, chunk_size=chunk_size)) == row_ends
+        assert list(_iter_delimited_row_boundaries(TEST_DATA, 0, 2, chunk_size=chunk_size)) == row_ends[1::2]
+        assert list(_iter_delimited_row_boundaries(TEST_DATA, row_ends[0], 2, chunk_size=chunk_size)) == row_ends[2::2]
+
+
+def test_partition_large_delimited_file():
+    with TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "source.csv")
+        with open(file_path, "wb") as f:
+            f.write(TEST_DATA)
+
+        partitions = partition_large_delimited_file(None, file_path, row_limit=3, output_name_template="part_%s.csv")
+
+        assert partitions == [os.path.join(temp_dir, "part_1.csv"), os.path.join(temp_dir, "part_2.csv")]
+        with open(partitions[0], "rb") as f:
+            assert f.read() == b'id,description\n1,simple\n2,"has ""quotes"""\n3,"spans\nmultiple\nlines"\n'
+        with open(partitions[1], "rb") as f:
+            assert f.read() == b'id,description\n4,"comma, and ""\nnewline"""\n'
+
+        partitions = partition_large_delimited_file(None, file_path, row_limit=4, output_name_template="all_%s.csv")
+
+        assert partitions == [os.path.join(temp_dir, "all_1.csv")]
+        with open(partitions[0], "rb") as f:
+            assert f.read() == TEST_DATA
@@ -0,0 +1,62 @@
+import os
+import pytest
+
+from usaspending_api.common.elasticsearch import client
+from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch, TransactionSearch
+
+
+@pytest.fixture
+def shared_clients(settings):
+    settings.ES_HOSTNAME = "http://localhost:9200"
+    client._reset_shared_clients()
+    yield
+    client._reset_shared_clients()
+
+
+def test_clients_are_shared(shared_clients):
+    api_client = client.create_es_client()
+    assert client.create_es_client() is api_client
+    assert TransactionSearch()._using is api_client
+    assert AwardSearch()._using is api_client
+
+    etl_client = client.instantiate_elasticsearch_client()
+    assert client.instantiate_elasticsearch_client() is etl_client
+    assert etl_client is not api_client
+
+
+def test_clients_follow_hostname(shared_clients, settings):
+    api_client = client.create_es_client()
+    settings.ES_HOSTNAME = "http://other-host:9200"
+    assert client.create_es_client() is not api_client
+
+
+def test_connection_pool_settings(shared_clients, settings):
+    settings.ES_CLIENT_MAX_CONNECTIONS = 25
+    settings.ES_CLIENT_SNIFF = False
+    assert client._connection_pool_config() == {"maxsize": 25}
+
+    settings.ES_CLIENT_SNIFF = True
+    settings.ES_CLIENT_SNIFFER_TIMEOUT = 30
+    assert client._connection_pool_config() == {
+        "maxsize": 25,
+        "sniff_on_start": True,
+        "sniff_on_connection_fail": True,
+        "sniffer_timeout": 30,
+    }
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+def test_forked_process_gets_new_client(shared_clients):
+    api_client = client.create_es_client()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        is_new_client = client.create_es_client() is not api_client and client.create_es_client() is not None
+        os.write(write_fd, b"1" if is_new_client else b"0")
+        os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b"1"
+    os.close(read_fd)
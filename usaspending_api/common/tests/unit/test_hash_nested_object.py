@@ -0,0 +1,41 @@
+import json
+
+from itertools import combinations
+
+from usaspending_api.common.helpers.dict_helpers import hash_nested_object, order_nested_object
+
+
+FILTERS = {
+    "keywords": ["b", "a"],
+    "time_period": [{"start_date": "2019-10-01", "end_date": "2020-09-30"}, {"end_date": "2019-09-30"}],
+    "tas_codes": {"require": [["091", "091-0800"], ["012"]], "exclude": [["091", "091-0800", "091-0800-000"]]},
+    "award_amounts": [{"lower_bound": 1000000.0}],
+}
+
+
+def test_hash_nested_object_ignores_order():
+    reordered_filters = {
+        "award_amounts": [{"lower_bound": 1000000.0}],
+        "tas_codes": {"exclude": [["091", "091-0800", "091-0800-000"]], "require": [["012"], ["091", "091-0800"]]},
+        "time_period": [{"end_date": "2019-09-30"}, {"end_date": "2020-09-30", "start_date": "2019-10-01"}],
+        "keywords": ["a", "b"],
+    }
+    assert hash_nested_object(reordered_filters) == hash_nested_object(FILTERS)
+    assert hash_nested_object({"keywords": [1, "a", None]}) == hash_nested_object({"keywords": ["a", None, 1]})
+
+
+def test_hash_nested_object_matches_order_nested_object():
+    variations = [
+        FILTERS,
+        {**FILTERS, "keywords": ["a"]},
+        {**FILTERS, "keywords": ["a", "b", "c"]},
+        {**FILTERS, "tas_codes": {"require": [["091-0800", "091"], ["012"]]}},
+        {**FILTERS, "tas_codes": ["091-0800", "091"]},
+        {**FILTERS, "tas_codes": ["091", "091-0800"]},
+        {**FILTERS, "award_amounts": [{"lower_bound": 1000000}]},
+        {**FILTERS, "award_amounts": [{"lower_bound": "1000000.0"}]},
+        {**FILTERS, "limit": 10},
+    ]
+    for first, second in combinations(variations, 2):
+        ordered_equal = json.dumps(order_nested_object(first)) == json.dumps(order_nested_object(second))
+        assert (hash_nested_object(first) == hash_nested_object(second)) == ordered_equal
@@ -0,0 +1,73 @@
+import json
+
+from usaspending_api.common.management.commands.warm_usaspending_cache import most_popular_requests, read_requests
+
+
+def write_lines(path, entries):
+    path.write_text("\n".join(json.dumps(entry) for entry in entries) + "\n")
+    return str(path)
+
+
+def test_read_requests_from_server_log(tmp_path):
+    server_log = write_lines(
+        tmp_path / "server.log",
+        [
+            {"method": "POST", "path": "/api/v2/search/spending_by_award/", "status_code": 200, "request": '{"a": 1}'},
+            {"method": "POST", "path": "/api/v2/search/spending_by_award/", "status_code": 400, "request": '{"b": 1}'},
+            {
+                "method": "GET",
+                "path": "/api/v2/references/toptier_agencies/",
+                "query_string": "",
+                "status_code": 200,
+                "request": "",
+            },
+            {
+                "method": "GET",
+                "path": "/api/v2/references/glossary/",
+                "query_string": "page=2&limit=10",
+                "status_code": 200,
+                "request": "",
+            },
+            # Logged without the query string, which can't be told apart from a request without one
+            {"method": "GET", "path": "/api/v2/references/glossary/", "status_code": 200, "request": ""},
+            {"method": "GET", "path": "/docs/", "query_string": "", "status_code": 200, "request": ""},
+        ],
+    )
+
+    assert read_requests([server_log], server_log=True) == [
+        {"method": "POST", "path": "/api/v2/search/spending_by_award/", "request": {"a": 1}},
+        {"method": "GET", "path": "/api/v2/references/toptier_agencies/", "request": {}},
+        {"method": "GET", "path": "/api/v2/references/glossary/?page=2&limit=10", "request": {}},
+    ]
+
+
+def test_read_requests_skips_views_without_cached_responses(tmp_path):
+    download = {"method": "POST", "path": "/api/v2/download/awards/", "request": {"filters": {"keywords": ["a"]}}}
+    bulk_download = {"method": "POST", "path": "/api/v2/bulk_download/awards/", "request": {"filters": {}}}
+    download_count = {"method": "POST", "path": "/api/v2/download/count/", "request": {"filters": {}}}
+    server_log = write_lines(
+        tmp_path / "server.log",
+        [
+            {**download, "status_code": 200, "request": json.dumps(download["request"])},
+            {**bulk_download, "status_code": 200, "request": json.dumps(bulk_download["request"])},
+            {**download_count, "status_code": 200, "request": json.dumps(download_count["request"])},
+        ],
+    )
+    request_file = write_lines(tmp_path / "requests.jsonl", [download, bulk_download, download_count])
+
+    assert read_requests([server_log], server_log=True) == [download_count]
+    assert read_requests([request_file]) == [download_count]
+
+
+def test_most_popular_requests():
+    award = {"method": "POST", "path": "/api/v2/search/spending_by_award/", "request": {"filters": {"a": [1, 2]}}}
+    reordered_award = {
+        "method": "POST",
+        "path": "/api/v2/search/spending_by_award/",
+        "request": {"filters": {"a": [2, 1]}},
+    }
+    agencies = {"method": "GET", "path": "/api/v2/references/toptier_agencies/", "request": {}}
+    glossary = {"method": "GET", "path": "/api/v2/references/glossary/", "request": {}}
+
+    requests = [agencies, award, glossary, reordered_award, agencies, award]
+    assert most_popular_requests(requests, 2) == [award, agencies]
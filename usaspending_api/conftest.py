@@ -23,6 +23,8 @@ from usaspending_api.common.sqs.sqs_handler import (
 )
 from usaspending_api.common.helpers.generic_helper import generate_matviews
 from usaspending_api.common.helpers.sql_helpers import get_database_dsn_string
+from usaspending_api.common.query_with_filters import QueryWithFilters
+from usaspending_api.references.helpers import clear_toptier_agency_lookup
 
 # Compose other supporting conftest_*.py files
 from usaspending_api.conftest_helpers import (
@@ -72,6 +74,22 @@ def add_view_protection():
         pass
 
 
+@pytest.fixture(autouse=True)
+def toptier_agency_lookup():
+    """The in-memory toptier agency lookup would otherwise carry agencies over from earlier tests"""
+    clear_toptier_agency_lookup()
+    yield
+    clear_toptier_agency_lookup()
+
+
+@pytest.fixture(autouse=True)
+def compiled_query_cache():
+    """Compiled Elasticsearch queries would otherwise carry reference data (e.g. DEF Codes) over from earlier tests"""
+    QueryWithFilters.compiled_query_cache.clear()
+    yield
+    QueryWithFilters.compiled_query_cache.clear()
+
+
 @pytest.fixture(scope="session")
 def local(request):
     return request.config.getoption("--local")
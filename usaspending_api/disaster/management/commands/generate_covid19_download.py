@@ -10,7 +10,6 @@ from django.core.management.base import BaseCommand
 from django.utils.functional import cached_property
 from pathlib import Path
 
-from usaspending_api.common.csv_helpers import count_rows_in_delimited_file
 from usaspending_api.common.helpers.s3_helpers import upload_download_file_to_s3
 from usaspending_api.download.filestreaming.download_generation import (
     split_and_zip_data_files,
@@ -164,24 +163,16 @@ class Command(BaseCommand):
         try:
             temp_file, temp_file_path = generate_export_query_temp_file(export_query, None, self.working_dir_path)
             # Create a separate process to run the PSQL command; wait
+            count = multiprocessing.Value("Q", 0)
             psql_process = multiprocessing.Process(
-                target=execute_psql, args=(temp_file_path, intermediate_data_filename, None)
+                target=execute_psql, args=(temp_file_path, intermediate_data_filename, None, count)
             )
             psql_process.start()
             wait_for_process(psql_process, start_time, None)
 
-            delim = FILE_FORMATS[self.file_format]["delimiter"]
-
-            # Log how many rows we have
-            logger.info(f"Counting rows in delimited text file {intermediate_data_filename}")
-            try:
-                count = count_rows_in_delimited_file(
-                    filename=intermediate_data_filename, has_header=True, delimiter=delim
-                )
-                logger.info(f"{destination_path} contains {count:,} rows of data")
-                self.total_download_count += count
-            except Exception:
-                logger.exception("Unable to obtain delimited text file line count")
+            # Log how many rows we have; counted while psql was writing the file
+            logger.info(f"{destination_path} contains {count.value:,} rows of data")
+            self.total_download_count += count.value
 
             start_time = time.perf_counter()
             zip_process = multiprocessing.Process(
@@ -4,6 +4,7 @@ from elasticsearch_dsl import Q as ES_Q, A
 from rest_framework.response import Response
 
 from usaspending_api.awards.v2.lookups.lookups import loan_type_mapping
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.aggregation_helpers import create_count_aggregation
 from usaspending_api.common.elasticsearch.search_wrappers import AccountSearch
@@ -18,6 +19,7 @@ class AmountViewSet(AwardTypeMixin, FabaOutlayMixin, DisasterBase):
     """Returns aggregated values of obligation, outlay, and count of Award records"""
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/disaster/award/amount.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES + AWARDS_DATA_TYPES
     count_only = False
 
     @cache_response()
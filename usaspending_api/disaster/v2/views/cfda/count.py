@@ -2,6 +2,7 @@ from elasticsearch_dsl import Q as ES_Q
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from usaspending_api.common.cache import ES_AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.disaster.v2.views.disaster_base import DisasterBase
@@ -15,6 +16,7 @@ class CfdaCountViewSet(DisasterBase):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/disaster/cfda/count.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES + ES_AWARDS_DATA_TYPES
 
     required_filters = ["def_codes", "_assistance_award_type_codes"]
 
@@ -12,6 +12,7 @@ from typing import List
 
 from usaspending_api.awards.models.financial_accounts_by_awards import FinancialAccountsByAwards
 from usaspending_api.awards.v2.lookups.lookups import award_type_mapping, loan_type_mapping, assistance_type_mapping
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.containers import Bunch
 from usaspending_api.common.data_classes import Pagination
 from usaspending_api.common.helpers.date_helper import now
@@ -88,6 +89,8 @@ def final_submissions_for_all_fy() -> List[tuple]:
 
 
 class DisasterBase(APIView):
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     required_filters = ["def_codes"]
 
     @classmethod
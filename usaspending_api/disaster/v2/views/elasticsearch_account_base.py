@@ -4,6 +4,7 @@ from typing import List, Optional, Dict
 from elasticsearch_dsl import Q as ES_Q, A
 from rest_framework.response import Response
 
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.data_classes import Pagination
 from usaspending_api.common.elasticsearch.search_wrappers import AccountSearch
@@ -14,6 +15,8 @@ from usaspending_api.disaster.v2.views.disaster_base import DisasterBase
 
 
 class ElasticsearchAccountDisasterBase(DisasterBase):
+    cache_data_types = SUBMISSIONS_DATA_TYPES + AWARDS_DATA_TYPES
+
     agg_group_name: str = "group_by_agg_key"  # name used for the tier-1 aggregation group
     agg_key: str
     bucket_count: int
@@ -7,6 +7,7 @@ from elasticsearch_dsl import Q as ES_Q, A
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from usaspending_api.common.cache import ES_AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.data_classes import Pagination
 from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch
@@ -59,6 +60,8 @@ class ElasticsearchLoansPaginationMixin(_BasePaginationMixin):
 
 class ElasticsearchDisasterBase(DisasterBase):
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES + ES_AWARDS_DATA_TYPES
+
     query_fields: List[str]
     agg_key: str
     agg_group_name: str = "group_by_agg_key"  # name used for the tier-1 aggregation group
@@ -6,6 +6,7 @@ from rest_framework.response import Response
 
 from usaspending_api.awards.models.financial_accounts_by_awards import FinancialAccountsByAwards
 from usaspending_api.common.cache_decorator import cache_response
+from usaspending_api.common.helpers.concurrency_helpers import run_concurrently
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.disaster.v2.views.disaster_base import (
     DisasterBase,
@@ -28,14 +29,27 @@ class OverviewViewSet(DisasterBase):
 
         request_values = self._parse_and_validate(request.GET)
         self.defc = request_values["def_codes"].split(",")
-        funding, self.total_budget_authority = self.funding()
+        queries = {
+            "funding": self.funding,
+            "award_obligations": self.award_obligations,
+            "award_outlays": self.award_outlays,
+            "totals": self.totals,
+        }
+        if self.defc == ["V"]:
+            queries["additional"] = self.additional_totals
+        results = run_concurrently(queries)
+        funding, self.total_budget_authority = results["funding"]
 
         return Response(
             {
                 "funding": funding,
                 "total_budget_authority": self.total_budget_authority,
-                "spending": self.spending(),
-                "additional": self.additional_totals() if self.defc == ["V"] else None,
+                "spending": {
+                    "award_obligations": results["award_obligations"],
+                    "award_outlays": results["award_outlays"],
+                    **results["totals"],
+                },
+                "additional": results.get("additional"),
             }
         )
 
@@ -77,9 +91,6 @@ class OverviewViewSet(DisasterBase):
 
         return funding, total_budget_authority
 
-    def spending(self):
-        return {"award_obligations": self.award_obligations(), "award_outlays": self.award_outlays(), **self.totals()}
-
     def award_obligations(self):
         return (
             FinancialAccountsByAwards.objects.filter(
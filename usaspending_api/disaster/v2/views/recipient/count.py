@@ -2,6 +2,7 @@ from elasticsearch_dsl import Q
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from usaspending_api.common.cache import ES_AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.aggregation_helpers import create_count_aggregation
 from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch
@@ -17,6 +18,7 @@ class RecipientCountViewSet(FabaOutlayMixin, AwardTypeMixin, DisasterBase):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/disaster/recipient/count.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES + ES_AWARDS_DATA_TYPES
 
     required_filters = ["def_codes", "award_type_codes"]
 
@@ -8,6 +8,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from elasticsearch_dsl import A, Q as ES_Q
 
+from usaspending_api.common.cache import ES_AWARDS_DATA_TYPES, SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch
 from usaspending_api.common.exceptions import UnprocessableEntityException
@@ -16,7 +17,9 @@ from usaspending_api.common.validator import TinyShield
 from usaspending_api.disaster.v2.views.disaster_base import DisasterBase
 from usaspending_api.references.abbreviations import code_to_state
 from usaspending_api.search.v2.elasticsearch_helper import (
-    get_number_of_unique_terms_for_awards,
+    add_unique_terms_count_aggregation,
+    execute_sized_to_unique_terms,
+    get_unique_terms_count,
 )
 
 
@@ -30,6 +33,7 @@ class SpendingByGeographyViewSet(DisasterBase):
     """Spending by Recipient Location"""
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/disaster/spending_by_geography.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES + ES_AWARDS_DATA_TYPES
 
     required_filters = ["def_codes", "award_type_codes"]
 
@@ -127,18 +131,13 @@ class SpendingByGeographyViewSet(DisasterBase):
             }
         )
 
-    def build_elasticsearch_search_with_aggregation(self, filter_query: ES_Q) -> Optional[AwardSearch]:
+    def build_elasticsearch_search_with_aggregation(self, filter_query: ES_Q, bucket_count: int) -> AwardSearch:
         # Create the initial search using filters
         search = AwardSearch().filter(filter_query)
 
-        # Check number of unique terms (buckets) for performance and restrictions on maximum buckets allowed
-        bucket_count = get_number_of_unique_terms_for_awards(filter_query, f"{self.agg_key}.hash")
-
-        if bucket_count == 0:
-            return None
-        else:
-            # Add 1 to handle null case since murmur3 doesn't support "null_value" property
-            bucket_count += 1
+        # Count the unique terms (buckets) in the same request for performance and restrictions on maximum buckets
+        # allowed (see query_elasticsearch)
+        add_unique_terms_count_aggregation(search, f"{self.agg_key}.hash")
 
         # Add 100 to make sure that we consider enough records in each shard for accurate results
         group_by_agg_key = A("terms", field=self.agg_key, size=bucket_count, shard_size=bucket_count + 100)
@@ -207,11 +206,14 @@ class SpendingByGeographyViewSet(DisasterBase):
         return results
 
     def query_elasticsearch(self, filter_query: ES_Q) -> list:
-        search = self.build_elasticsearch_search_with_aggregation(filter_query)
-        if search is None:
+        # Add 1 to handle null case since murmur3 doesn't support "null_value" property
+        response_dict = execute_sized_to_unique_terms(
+            lambda bucket_count: self.build_elasticsearch_search_with_aggregation(filter_query, bucket_count),
+            extra_buckets=1,
+        )
+        if get_unique_terms_count(response_dict) == 0:
             return []
-        response = search.handle_execute()
-        results_dict = self.build_elasticsearch_result(response.aggs.to_dict())
+        results_dict = self.build_elasticsearch_result(response_dict)
 
         if self.geo_layer_filters:
             filtered_shape_codes = set(self.geo_layer_filters) & set(results_dict.keys())
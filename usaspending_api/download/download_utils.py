@@ -1,4 +1,8 @@
+import hashlib
+import json
+
 from datetime import datetime, timezone
+from typing import Optional
 
 from django.conf import settings
 
@@ -95,3 +99,15 @@ def construct_data_date_range(provided_filters: dict) -> str:
         if provided_filters.get("quarter") != 1:
             string += f"-Q{provided_filters.get('quarter')}"
     return string
+
+
+def build_download_request_hash(json_request: dict, data_watermark: Optional[datetime]) -> Optional[str]:
+    """
+    Content address of a download: a hash of the normalized request and the time of the most recent data load that
+    affects its results. Two jobs with the same hash produce the same archive. Without a watermark there is no way to
+    tell when the data changed, so no hash is built.
+    """
+    if data_watermark is None:
+        return None
+    canonical_request = json.dumps(json_request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{canonical_request}|{data_watermark.isoformat()}".encode()).hexdigest()
@@ -0,0 +1,202 @@
+import os
+import shutil
+import time
+import zipfile
+
+from django.conf import settings
+from typing import Optional
+
+from usaspending_api.download.helpers import write_to_download_log as write_to_log
+from usaspending_api.download.models.download_job import DownloadJob
+
+EXPORTED = "exported"
+ZIPPED = "zipped"
+
+# Names of the files a download leaves in CSV_LOCAL_PATH besides its working directory
+DOWNLOAD_FILE_SUFFIXES = (".zip", ".zip.checkpoint", ".zip.checkpoint.tmp")
+
+
+class DownloadCheckpoints:
+    """
+    Tracks the progress of a DownloadJob on the job itself so that a retried job (e.g. after the worker was killed) can
+    skip the sources it already finished instead of generating the whole download again.
+
+    Each source is checkpointed when its psql export is written ("exported") and again once its partitions are in the
+    zip file ("zipped"). Appending to a zip file overwrites its central directory, so a job that dies mid-append leaves
+    an unreadable zip. To recover from that, a copy of the central directory is kept next to the zip file every time a
+    source is zipped; restoring a checkpoint truncates whatever was partially appended and puts the copy back.
+
+    Checkpointed files live on the worker's local disk, so a retry can only resume if it finds them there. Any
+    checkpoint that can't be verified against the files on disk is discarded and the download starts over. The
+    working directory holding the exported files is kept while any source is exported but not yet zipped and the job
+    can still be retried, and is removed along with the checkpoints when they are discarded. Files left behind for a
+    retry that never comes are removed by remove_stale_download_files.
+
+    Shape of DownloadJob.checkpoints:
+        {
+            "sources": {<checkpoint key>: {"stage": "exported" or "zipped", "file_name": str, "number_of_rows": int,
+                                           "file_size": int (exported only)}},
+            "zip": {"central_directory_offset": int, "size": int, "members": [str]} or None,
+        }
+    """
+
+    def __init__(self, download_job: DownloadJob, zip_file_path: str):
+        self.download_job = download_job
+        self.zip_file_path = zip_file_path
+        self.central_directory_path = f"{zip_file_path}.checkpoint"
+        self.working_dir = os.path.splitext(zip_file_path)[0]
+
+    @staticmethod
+    def build_key(source_index, source) -> str:
+        return f"{source_index}_{source.source_type}_{source.file_type}"
+
+    def restore(self) -> bool:
+        """Returns True if there is progress to resume from; otherwise any stale checkpoints are discarded"""
+        checkpoints = self.download_job.checkpoints
+        if not checkpoints or not checkpoints.get("sources"):
+            self.discard()
+            return False
+
+        if checkpoints.get("zip") is None:
+            # Nothing was successfully added to the zip file yet; anything there is from an interrupted append
+            if os.path.exists(self.zip_file_path):
+                os.remove(self.zip_file_path)
+        elif not self._restore_zip_file(checkpoints["zip"]):
+            write_to_log(
+                message="Unable to restore the zip file from its checkpoint; starting the download over",
+                download_job=self.download_job,
+            )
+            if os.path.exists(self.zip_file_path):
+                os.remove(self.zip_file_path)
+            self.discard()
+            return False
+
+        write_to_log(
+            message=f"Resuming download from checkpoints: {', '.join(checkpoints['sources'])}",
+            download_job=self.download_job,
+        )
+        return True
+
+    def get_source(self, checkpoint_key: str) -> Optional[dict]:
+        if not self.download_job.checkpoints:
+            return None
+        return self.download_job.checkpoints["sources"].get(checkpoint_key)
+
+    def is_export_intact(self, checkpoint_key: str, source_path: str) -> bool:
+        source_checkpoint = self.get_source(checkpoint_key)
+        return (
+            source_checkpoint is not None
+            and source_checkpoint["stage"] == EXPORTED
+            and os.path.exists(source_path)
+            and os.path.getsize(source_path) == source_checkpoint["file_size"]
+        )
+
+    def has_unfinished_sources(self) -> bool:
+        """Whether a retry could resume from an exported file in the working directory"""
+        checkpoints = self.download_job.checkpoints
+        return bool(checkpoints) and any(
+            source_checkpoint["stage"] == EXPORTED for source_checkpoint in checkpoints["sources"].values()
+        )
+
+    def record_export(self, checkpoint_key: str, file_name: str, source_path: str, number_of_rows: int) -> None:
+        self._record_source(
+            checkpoint_key,
+            {
+                "stage": EXPORTED,
+                "file_name": file_name,
+                "number_of_rows": number_of_rows,
+                "file_size": os.path.getsize(source_path),
+            },
+        )
+
+    def record_zip(self, checkpoint_key: str, file_name: str, number_of_rows: int) -> None:
+        with zipfile.ZipFile(self.zip_file_path, "r") as zip_file:
+            central_directory_offset = zip_file.start_dir
+            members = zip_file.namelist()
+
+        # Written to a temporary file first so that an interruption never leaves a partial copy behind
+        temp_central_directory_path = f"{self.central_directory_path}.tmp"
+        with open(self.zip_file_path, "rb") as zip_file, open(temp_central_directory_path, "wb") as central_directory:
+            zip_file.seek(central_directory_offset)
+            central_directory.write(zip_file.read())
+            size = zip_file.tell()
+        os.replace(temp_central_directory_path, self.central_directory_path)
+
+        self._checkpoints["zip"] = {
+            "central_directory_offset": central_directory_offset,
+            "size": size,
+            "members": members,
+        }
+        self._record_source(checkpoint_key, {"stage": ZIPPED, "file_name": file_name, "number_of_rows": number_of_rows})
+
+    def discard(self) -> None:
+        if os.path.exists(self.central_directory_path):
+            os.remove(self.central_directory_path)
+        if os.path.exists(self.working_dir):
+            shutil.rmtree(self.working_dir)
+        if self.download_job.checkpoints is not None:
+            self.download_job.checkpoints = None
+            self.download_job.save()
+
+    @property
+    def _checkpoints(self) -> dict:
+        if not self.download_job.checkpoints:
+            self.download_job.checkpoints = {"sources": {}, "zip": None}
+        return self.download_job.checkpoints
+
+    def _record_source(self, checkpoint_key: str, source_checkpoint: dict) -> None:
+        self._checkpoints["sources"][checkpoint_key] = source_checkpoint
+        self.download_job.save()
+
+    def _restore_zip_file(self, zip_checkpoint: dict) -> bool:
+        central_directory_offset = zip_checkpoint["central_directory_offset"]
+        try:
+            if os.path.getsize(self.zip_file_path) < central_directory_offset:
+                return False
+            with open(self.central_directory_path, "rb") as f:
+                central_directory = f.read()
+            if central_directory_offset + len(central_directory) != zip_checkpoint["size"]:
+                return False
+
+            with open(self.zip_file_path, "r+b") as zip_file:
+                zip_file.truncate(central_directory_offset)
+                zip_file.seek(central_directory_offset)
+                zip_file.write(central_directory)
+
+            with zipfile.ZipFile(self.zip_file_path, "r") as zip_file:
+                return zip_file.namelist() == zip_checkpoint["members"]
+        except (OSError, zipfile.BadZipFile):
+            return False
+
+
+def remove_stale_download_files(max_age_seconds: float) -> int:
+    """
+    Removes the working directories and zip files in CSV_LOCAL_PATH that haven't changed in max_age_seconds, such as
+    those kept for a retry that was never delivered to this worker. Returns the number removed.
+    """
+    if not os.path.isdir(settings.CSV_LOCAL_PATH):
+        return 0
+
+    cutoff = time.time() - max_age_seconds
+    removed_count = 0
+    for entry in os.scandir(settings.CSV_LOCAL_PATH):
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if not is_dir and not entry.name.endswith(DOWNLOAD_FILE_SUFFIXES):
+            continue
+        if _last_modified(entry.path) >= cutoff:
+            continue
+        if is_dir:
+            shutil.rmtree(entry.path)
+        else:
+            os.remove(entry.path)
+        removed_count += 1
+    return removed_count
+
+
+def _last_modified(path: str) -> float:
+    """Most recent modification time of the path or, for a directory, anything in it"""
+    last_modified = os.path.getmtime(path)
+    for dir_path, _, file_names in os.walk(path):
+        for file_name in file_names:
+            last_modified = max(last_modified, os.path.getmtime(os.path.join(dir_path, file_name)))
+    return last_modified
@@ -14,6 +14,7 @@ import tempfile
 import time
 import traceback
 
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from ddtrace import tracer
 from ddtrace.ext import SpanTypes
@@ -22,18 +23,27 @@ from django.conf import settings
 from usaspending_api.download.models.download_job_lookup import DownloadJobLookup
 from usaspending_api.settings import MAX_DOWNLOAD_LIMIT
 from usaspending_api.awards.v2.lookups.lookups import contract_type_mapping, assistance_type_mapping, idv_type_mapping
-from usaspending_api.common.csv_helpers import count_rows_in_delimited_file, partition_large_delimited_file
+from usaspending_api.common.csv_helpers import (
+    DelimitedRowCounter,
+    iter_delimited_rows,
+    partition_large_delimited_file,
+)
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.orm_helpers import generate_raw_quoted_query
-from usaspending_api.common.helpers.s3_helpers import multipart_upload
+from usaspending_api.common.helpers.s3_helpers import copy_s3_object, multipart_upload
 from usaspending_api.common.helpers.text_helpers import slugify_text_for_file_names
 from usaspending_api.common.retrieve_file_from_uri import RetrieveFileFromUri
 from usaspending_api.common.tracing import SubprocessTrace
 from usaspending_api.download.download_utils import construct_data_date_range
 from usaspending_api.download.filestreaming import NAMING_CONFLICT_DISCRIMINATOR
+from usaspending_api.download.filestreaming.download_checkpoints import ZIPPED, DownloadCheckpoints
 from usaspending_api.download.filestreaming.download_source import DownloadSource
 from usaspending_api.download.filestreaming.file_description import build_file_description, save_file_description
-from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file
+from usaspending_api.download.filestreaming.zip_file import (
+    append_files_to_zip_file,
+    append_files_to_zip_file_in_parallel,
+    append_rows_to_zip_file,
+)
 from usaspending_api.download.helpers import verify_requested_columns_available, write_to_download_log as write_to_log
 from usaspending_api.download.lookups import JOB_STATUS_DICT, VALUE_MAPPINGS, FILE_FORMATS
 from usaspending_api.download.models.download_job import DownloadJob
@@ -42,13 +52,17 @@ DOWNLOAD_VISIBILITY_TIMEOUT = 60 * 10
 MAX_VISIBILITY_TIMEOUT = 60 * 60 * settings.DOWNLOAD_DB_TIMEOUT_IN_HOURS
 EXCEL_ROW_LIMIT = 1000000
 WAIT_FOR_PROCESS_SLEEP = 5
+PSQL_OUTPUT_CHUNK_SIZE = 1024 * 1024
 JOB_TYPE = "USAspendingDownloader"
 
 logger = logging.getLogger(__name__)
 
 
-def generate_download(download_job: DownloadJob, origination: Optional[str] = None):
-    """Create data archive files from the download job object"""
+def generate_download(download_job: DownloadJob, origination: Optional[str] = None, can_be_retried: bool = False):
+    """
+    Create data archive files from the download job object. If the job can be retried after this attempt fails (e.g.
+    SQS will deliver its message again), the files of its checkpoints are kept for the retry to resume from.
+    """
 
     # Parse data from download_job
     json_request = json.loads(download_job.json_request)
@@ -64,8 +78,12 @@ def generate_download(download_job: DownloadJob, origination: Optional[str] = No
     if span and request_type:
         span.resource = request_type
 
+    if reuse_existing_download(download_job):
+        return finish_download(download_job)
+
     file_name = start_download(download_job)
     working_dir = None
+    checkpoints = None
     try:
         if limit is not None and limit > MAX_DOWNLOAD_LIMIT:
             raise Exception(
@@ -73,10 +91,11 @@ def generate_download(download_job: DownloadJob, origination: Optional[str] = No
             )
         # Create temporary files and working directory
         zip_file_path = settings.CSV_LOCAL_PATH + file_name
-        if not settings.IS_LOCAL and os.path.exists(zip_file_path):
+        checkpoints = DownloadCheckpoints(download_job, zip_file_path)
+        if not checkpoints.restore() and not settings.IS_LOCAL and os.path.exists(zip_file_path):
             # Clean up a zip file that might exist from a prior attempt at this download
             os.remove(zip_file_path)
-        working_dir = os.path.splitext(zip_file_path)[0]
+        working_dir = checkpoints.working_dir
         if not os.path.exists(working_dir):
             os.mkdir(working_dir)
 
@@ -84,9 +103,25 @@ def generate_download(download_job: DownloadJob, origination: Optional[str] = No
 
         # Generate sources from the JSON request object
         sources = get_download_sources(json_request, download_job, origination)
-        for source in sources:
-            # Parse and write data to the file; if there are no matching columns for a source then add an empty file
+        if settings.DOWNLOAD_MAX_CONCURRENT_SOURCES > 1 and not settings.DOWNLOAD_STREAMING_PIPELINE:
+            # Sources exported here are checkpointed, so below they are only added to the zip file, in order
+            export_sources_concurrently(
+                sources, columns, download_job, working_dir, piid, assistance_id, limit, file_format, checkpoints
+            )
+        for source_index, source in enumerate(sources):
+            checkpoint_key = DownloadCheckpoints.build_key(source_index, source)
+            source_checkpoint = checkpoints.get_source(checkpoint_key)
             source_column_count = len(source.columns(columns))
+            if source_checkpoint and source_checkpoint["stage"] == ZIPPED:
+                # Already added to the zip file by a previous attempt at this download
+                source.file_name = source_checkpoint["file_name"]
+                download_job.number_of_columns += source_column_count
+                download_job.number_of_rows += source_checkpoint["number_of_rows"]
+                write_to_log(message=f"Skipping {source.file_name}; found in checkpoint", download_job=download_job)
+                continue
+
+            # Parse and write data to the file; if there are no matching columns for a source then add an empty file
+            number_of_rows = download_job.number_of_rows
             if source_column_count == 0:
                 create_empty_data_file(
                     source, download_job, working_dir, piid, assistance_id, zip_file_path, file_format
@@ -94,8 +129,19 @@ def generate_download(download_job: DownloadJob, origination: Optional[str] = No
             else:
                 download_job.number_of_columns += source_column_count
                 parse_source(
-                    source, columns, download_job, working_dir, piid, assistance_id, zip_file_path, limit, file_format
+                    source,
+                    columns,
+                    download_job,
+                    working_dir,
+                    piid,
+                    assistance_id,
+                    zip_file_path,
+                    limit,
+                    file_format,
+                    checkpoints,
+                    checkpoint_key,
                 )
+            checkpoints.record_zip(checkpoint_key, source.file_name, download_job.number_of_rows - number_of_rows)
         include_data_dictionary = json_request.get("include_data_dictionary")
         if include_data_dictionary:
             add_data_dictionary_to_zip(working_dir, zip_file_path)
@@ -109,18 +155,27 @@ def generate_download(download_job: DownloadJob, origination: Optional[str] = No
             )
             append_files_to_zip_file([file_description_path], zip_file_path)
         download_job.file_size = os.stat(zip_file_path).st_size
+        checkpoints.discard()
     except InvalidParameterException as e:
         exc_msg = "InvalidParameterException was raised while attempting to process the DownloadJob"
         fail_download(download_job, e, exc_msg)
+        if checkpoints:
+            # Retrying the same request won't succeed, so there is nothing to resume
+            checkpoints.discard()
         raise InvalidParameterException(e)
     except Exception as e:
         # Set error message; job_status_id will be set in download_sqs_worker.handle()
         exc_msg = "An exception was raised while attempting to process the DownloadJob"
+        if checkpoints and not can_be_retried:
+            # Nothing will resume from the checkpoints, so don't leave their files on the worker's disk
+            checkpoints.discard()
+            if os.path.exists(checkpoints.zip_file_path):
+                os.remove(checkpoints.zip_file_path)
         fail_download(download_job, e, exc_msg)
         raise Exception(download_job.error_message) from e
     finally:
-        # Remove working directory
-        if working_dir and os.path.exists(working_dir):
+        # Remove working directory, unless a retry can resume from the exported files in it
+        if working_dir and os.path.exists(working_dir) and not checkpoints.has_unfinished_sources():
             shutil.rmtree(working_dir)
         _kill_spawned_processes(download_job)
         DownloadJobLookup.objects.filter(download_job_id=download_job.download_job_id).delete()
@@ -309,10 +364,27 @@ def build_data_file_name(source, download_job, piid, assistance_id):
     return file_name_pattern.format(**file_name_values)
 
 
-def parse_source(source, columns, download_job, working_dir, piid, assistance_id, zip_file_path, limit, file_format):
+def parse_source(
+    source,
+    columns,
+    download_job,
+    working_dir,
+    piid,
+    assistance_id,
+    zip_file_path,
+    limit,
+    file_format,
+    checkpoints: Optional[DownloadCheckpoints] = None,
+    checkpoint_key: Optional[str] = None,
+):
     """Write to delimited text file(s) and zip file(s) using the source data"""
 
-    data_file_name = build_data_file_name(source, download_job, piid, assistance_id)
+    source_checkpoint = checkpoints.get_source(checkpoint_key) if checkpoints else None
+    if source_checkpoint:
+        # File names contain a timestamp; keep the one used by the previous attempt at this download
+        data_file_name = strip_file_extension(source_checkpoint["file_name"])
+    else:
+        data_file_name = build_data_file_name(source, download_job, piid, assistance_id)
 
     source_query = source.row_emitter(columns)
     extension = FILE_FORMATS[file_format]["extension"]
@@ -327,25 +399,45 @@ def parse_source(source, columns, download_job, working_dir, piid, assistance_id
 
     start_time = time.perf_counter()
     try:
-        # Create a separate process to run the PSQL command; wait
-        psql_process = multiprocessing.Process(target=execute_psql, args=(temp_file_path, source_path, download_job))
-        write_to_log(message=f"Running {source.file_name} using psql", download_job=download_job)
-        psql_process.start()
-        wait_for_process(psql_process, start_time, download_job)
+        if settings.DOWNLOAD_STREAMING_PIPELINE:
+            # Create a separate process to stream the PSQL output directly into the zip file; wait
+            number_of_rows = multiprocessing.Value("Q", 0)
+            stream_process = multiprocessing.Process(
+                target=stream_psql_to_zip_file,
+                args=(temp_file_path, zip_file_path, data_file_name, file_format, number_of_rows, download_job),
+            )
+            write_to_log(message=f"Streaming {source.file_name} using psql", download_job=download_job)
+            stream_process.start()
+            wait_for_process(stream_process, start_time, download_job)
 
-        delim = FILE_FORMATS[file_format]["delimiter"]
+            download_job.number_of_rows += number_of_rows.value
+            write_to_log(message=f"Number of rows streamed: {number_of_rows.value}", download_job=download_job)
+            download_job.save()
+            return
 
-        # Log how many rows we have
-        write_to_log(message="Counting rows in delimited text file", download_job=download_job)
-        try:
-            number_of_rows = count_rows_in_delimited_file(filename=source_path, has_header=True, delimiter=delim)
-            download_job.number_of_rows += number_of_rows
-            write_to_log(message=f"Number of rows in text file: {number_of_rows}", download_job=download_job)
-        except Exception:
+        if checkpoints and checkpoints.is_export_intact(checkpoint_key, source_path):
+            # The previous attempt at this download already wrote the complete file
             write_to_log(
-                message="Unable to obtain delimited text file line count", is_error=True, download_job=download_job
+                message=f"Skipping psql for {source.file_name}; found in checkpoint", download_job=download_job
             )
-        download_job.save()
+            download_job.number_of_rows += source_checkpoint["number_of_rows"]
+            download_job.save()
+        else:
+            # Create a separate process to run the PSQL command; wait
+            number_of_rows = multiprocessing.Value("Q", 0)
+            psql_process = multiprocessing.Process(
+                target=execute_psql, args=(temp_file_path, source_path, download_job, number_of_rows)
+            )
+            write_to_log(message=f"Running {source.file_name} using psql", download_job=download_job)
+            psql_process.start()
+            wait_for_process(psql_process, start_time, download_job)
+
+            # Log how many rows we have; counted while psql was writing the file
+            download_job.number_of_rows += number_of_rows.value
+            write_to_log(message=f"Number of rows in text file: {number_of_rows.value}", download_job=download_job)
+            if checkpoints:
+                checkpoints.record_export(checkpoint_key, source.file_name, source_path, number_of_rows.value)
+            download_job.save()
 
         # Create a separate process to split the large data files into smaller file and write to zip; wait
         zip_process = multiprocessing.Process(
@@ -363,6 +455,95 @@ def parse_source(source, columns, download_job, working_dir, piid, assistance_id
         os.remove(temp_file_path)
 
 
+def export_sources_concurrently(
+    sources, columns, download_job, working_dir, piid, assistance_id, limit, file_format, checkpoints
+):
+    """
+    Run the psql exports of independent sources in parallel, at most DOWNLOAD_MAX_CONCURRENT_SOURCES at a time.
+
+    Each finished export is recorded as a checkpoint, which `parse_source` then picks up instead of running psql
+    again; zipping is left to `parse_source` so that the files are always added to the zip file in source order.
+    """
+    extension = FILE_FORMATS[file_format]["extension"]
+    pending_exports = []
+    for source_index, source in enumerate(sources):
+        checkpoint_key = DownloadCheckpoints.build_key(source_index, source)
+        source_checkpoint = checkpoints.get_source(checkpoint_key)
+        if len(source.columns(columns)) == 0 or (source_checkpoint and source_checkpoint["stage"] == ZIPPED):
+            continue
+        if source_checkpoint:
+            file_name = source_checkpoint["file_name"]
+            if checkpoints.is_export_intact(checkpoint_key, os.path.join(working_dir, file_name)):
+                continue
+        else:
+            file_name = f"{build_data_file_name(source, download_job, piid, assistance_id)}.{extension}"
+
+        export_query = generate_export_query(source.row_emitter(columns), limit, source, columns, file_format)
+        temp_file, temp_file_path = generate_export_query_temp_file(export_query, download_job)
+        pending_exports.append(
+            {
+                "checkpoint_key": checkpoint_key,
+                "file_name": file_name,
+                "source_path": os.path.join(working_dir, file_name),
+                "temp_file": temp_file,
+                "temp_file_path": temp_file_path,
+                "number_of_rows": multiprocessing.Value("Q", 0),
+                "process": None,
+            }
+        )
+
+    write_to_log(
+        message=f"Exporting {len(pending_exports)} sources using up to {settings.DOWNLOAD_MAX_CONCURRENT_SOURCES} "
+        f"concurrent psql processes",
+        download_job=download_job,
+    )
+    all_exports = list(pending_exports)
+    running_exports = []
+    start_time = time.perf_counter()
+    try:
+        while pending_exports or running_exports:
+            while pending_exports and len(running_exports) < settings.DOWNLOAD_MAX_CONCURRENT_SOURCES:
+                export = pending_exports.pop(0)
+                export["process"] = multiprocessing.Process(
+                    target=execute_psql,
+                    args=(export["temp_file_path"], export["source_path"], download_job, export["number_of_rows"]),
+                )
+                write_to_log(message=f"Running {export['file_name']} using psql", download_job=download_job)
+                export["process"].start()
+                running_exports.append(export)
+
+            time.sleep(WAIT_FOR_PROCESS_SLEEP / 5)
+
+            for export in [export for export in running_exports if not export["process"].is_alive()]:
+                running_exports.remove(export)
+                if export["process"].exitcode != 0:
+                    raise Exception("Command failed. Please see the logs for details.")
+                checkpoints.record_export(
+                    export["checkpoint_key"],
+                    export["file_name"],
+                    export["source_path"],
+                    export["number_of_rows"].value,
+                )
+
+            over_time = (time.perf_counter() - start_time) > MAX_VISIBILITY_TIMEOUT
+            if running_exports and not download_job.monthly_download and over_time:
+                raise TimeoutError(
+                    f"DownloadJob {download_job.download_job_id} lasted longer than {MAX_VISIBILITY_TIMEOUT / 3600} hours"
+                )
+    finally:
+        for export in running_exports:
+            if export["process"].is_alive():
+                write_to_log(
+                    message=f"Attempting to terminate process (pid {export['process'].pid})",
+                    download_job=download_job,
+                    is_error=True,
+                )
+                export["process"].terminate()
+        for export in all_exports:
+            os.close(export["temp_file"])
+            os.remove(export["temp_file_path"])
+
+
 def split_and_zip_data_files(zip_file_path, source_path, data_file_name, file_format, download_job=None):
     with SubprocessTrace(
         name=f"job.{JOB_TYPE}.download.zip",
@@ -395,7 +576,15 @@ def split_and_zip_data_files(zip_file_path, source_path, data_file_name, file_fo
             # Zip the split files into one zipfile
             write_to_log(message="Beginning zipping and compression", download_job=download_job)
             log_time = time.perf_counter()
-            append_files_to_zip_file(list_of_files, zip_file_path)
+            if settings.DOWNLOAD_ZIP_WORKERS > 1:
+                append_files_to_zip_file_in_parallel(
+                    list_of_files,
+                    zip_file_path,
+                    max_workers=settings.DOWNLOAD_ZIP_WORKERS,
+                    compression_level=settings.DOWNLOAD_ZIP_COMPRESSION_LEVEL,
+                )
+            else:
+                append_files_to_zip_file(list_of_files, zip_file_path)
 
             write_to_log(
                 message=f"Writing to zipfile took {time.perf_counter() - log_time:.4f}s", download_job=download_job
@@ -409,9 +598,60 @@ def split_and_zip_data_files(zip_file_path, source_path, data_file_name, file_fo
             raise e
 
 
+def reuse_existing_download(download_job):
+    """
+    Copy the archive of a finished job with the same request hash to this job's file_name instead of generating it
+    again. The hash includes the time of the latest relevant data load, so a matching archive was built from the same
+    data. The copy is made in S3 so that the file_url already returned for this job's file_name is valid.
+    """
+    if not download_job.request_hash or settings.IS_LOCAL:
+        return False
+
+    existing_download_job = (
+        DownloadJob.objects.filter(
+            request_hash=download_job.request_hash,
+            job_status_id=JOB_STATUS_DICT["finished"],
+            reused_download_job__isnull=True,
+            file_size__gt=0,
+        )
+        .exclude(download_job_id=download_job.download_job_id)
+        .order_by("-update_date")
+        .first()
+    )
+    if existing_download_job is None:
+        return False
+
+    try:
+        copy_s3_object(
+            settings.BULK_DOWNLOAD_S3_BUCKET_NAME,
+            settings.USASPENDING_AWS_REGION,
+            existing_download_job.file_name,
+            download_job.file_name,
+        )
+    except Exception:
+        # E.g. the archive expired from the bucket; generate the download instead
+        logger.exception(f"Unable to copy {existing_download_job.file_name} to {download_job.file_name}")
+        return False
+
+    download_job.reused_download_job = existing_download_job
+    download_job.file_size = existing_download_job.file_size
+    download_job.number_of_rows = existing_download_job.number_of_rows
+    download_job.number_of_columns = existing_download_job.number_of_columns
+    download_job.error_message = None
+    download_job.save()
+
+    write_to_log(
+        message=f"Copied {existing_download_job.file_name} from identical DownloadJob "
+        f"{existing_download_job.download_job_id}",
+        download_job=download_job,
+    )
+    return True
+
+
 def start_download(download_job):
     # Update job attributes
     download_job.job_status_id = JOB_STATUS_DICT["running"]
+    download_job.reused_download_job = None
     download_job.number_of_rows = 0
     download_job.number_of_columns = 0
     download_job.file_size = 0
@@ -597,8 +837,11 @@ def _top_level_split(sql, splitter):
     raise Exception(f"SQL string ${sql} cannot be split on ${splitter}")
 
 
-def execute_psql(temp_sql_file_path, source_path, download_job):
-    """Executes a single PSQL command within its own Subprocess"""
+def execute_psql(temp_sql_file_path, source_path, download_job, row_count=None):
+    """
+    Executes a single PSQL command within its own Subprocess. The output is counted as it is written to source_path,
+    so the number of data rows (header excluded) can be handed back through the shared `row_count` value.
+    """
     download_sql = Path(temp_sql_file_path).read_text()
     if download_sql.startswith("\\COPY"):
         # Trace library parses the SQL, but cannot understand the psql-specific \COPY command. Use standard COPY here.
@@ -620,21 +863,14 @@ def execute_psql(temp_sql_file_path, source_path, download_job):
     ):
         try:
             log_time = time.perf_counter()
-            temp_env = os.environ.copy()
-            if download_job and not download_job.monthly_download:
-                # Since terminating the process isn't guaranteed to end the DB statement, add timeout to client connection
-                temp_env["PGOPTIONS"] = (
-                    f"--statement-timeout={settings.DOWNLOAD_DB_TIMEOUT_IN_HOURS}h "
-                    f"--work-mem={settings.DOWNLOAD_DB_WORK_MEM_IN_MB}MB"
-                )
+            row_counter = DelimitedRowCounter()
+            with _psql_output(temp_sql_file_path, download_job) as psql_output, open(source_path, "wb") as source_file:
+                for chunk in iter(lambda: psql_output.read(PSQL_OUTPUT_CHUNK_SIZE), b""):
+                    row_counter.update(chunk)
+                    source_file.write(chunk)
 
-            cat_command = subprocess.Popen(["cat", temp_sql_file_path], stdout=subprocess.PIPE)
-            subprocess.check_output(
-                ["psql", "-q", "-o", source_path, retrieve_db_string(), "-v", "ON_ERROR_STOP=1"],
-                stdin=cat_command.stdout,
-                stderr=subprocess.STDOUT,
-                env=temp_env,
-            )
+            if row_count is not None:
+                row_count.value = max(row_counter.row_count - 1, 0)  # Header row is not a data row
 
             duration = time.perf_counter() - log_time
             write_to_log(
@@ -653,6 +889,95 @@ def execute_psql(temp_sql_file_path, source_path, download_job):
             raise e
 
 
+def stream_psql_to_zip_file(temp_sql_file_path, zip_file_path, data_file_name, file_format, row_count, download_job):
+    """
+    Executes a single PSQL command within its own Subprocess, streaming the COPY output directly into partitioned
+    members of the zip file instead of writing it to disk first. The number of data rows written is stored in the
+    shared `row_count` value so that the parent process can read it.
+    """
+    download_sql = Path(temp_sql_file_path).read_text()
+    if download_sql.startswith("\\COPY"):
+        # Trace library parses the SQL, but cannot understand the psql-specific \COPY command. Use standard COPY here.
+        download_sql = download_sql[1:]
+    # Stack 3 context managers: (1) psql code, (2) Download replica query, (3) (same) Postgres query
+    with SubprocessTrace(
+        name=f"job.{JOB_TYPE}.download.stream",
+        service="bulk-download",
+        resource=download_sql,
+        span_type=SpanTypes.SQL,
+        zip_file_path=zip_file_path,
+    ) as span, tracer.trace(
+        name="postgres.query",
+        service=f"{settings.DOWNLOAD_DATABASE_ALIAS}db",
+        resource=download_sql,
+        span_type=SpanTypes.SQL,
+    ), tracer.trace(
+        name="postgres.query", service="postgres", resource=download_sql, span_type=SpanTypes.SQL
+    ):
+        try:
+            log_time = time.perf_counter()
+            extension = FILE_FORMATS[file_format]["extension"]
+            with _psql_output(temp_sql_file_path, download_job) as psql_output:
+                list_of_files, row_count.value = append_rows_to_zip_file(
+                    rows=iter_delimited_rows(psql_output),
+                    zip_file_path=zip_file_path,
+                    archive_name_template=f"{data_file_name}_%s.{extension}",
+                    row_limit=EXCEL_ROW_LIMIT,
+                )
+
+            span.set_tag("file_parts", len(list_of_files))
+            duration = time.perf_counter() - log_time
+            write_to_log(
+                message=f"Streamed {len(list_of_files)} file(s) into {os.path.basename(zip_file_path)}, took "
+                f"{duration:.4f} seconds",
+                download_job=download_job,
+            )
+        except subprocess.CalledProcessError as e:
+            write_to_log(message=f"PSQL Error: {e.output.decode()}", is_error=True, download_job=download_job)
+            raise e
+        except Exception as e:
+            if not settings.IS_LOCAL:
+                # Not logging the command as it can contain the database connection string
+                e.cmd = "[redacted psql command]"
+            write_to_log(message=e, is_error=True, download_job=download_job)
+            sql = subprocess.check_output(["cat", temp_sql_file_path]).decode()
+            write_to_log(message=f"Faulty SQL: {sql}", is_error=True, download_job=download_job)
+            raise e
+
+
+@contextmanager
+def _psql_output(temp_sql_file_path, download_job):
+    """Runs psql on the SQL file and yields its stdout; raises CalledProcessError with psql's stderr if psql fails"""
+    with open(temp_sql_file_path, "r") as sql_file, tempfile.TemporaryFile() as psql_errors:
+        psql_process = subprocess.Popen(
+            ["psql", "-q", retrieve_db_string(), "-v", "ON_ERROR_STOP=1"],
+            stdin=sql_file,
+            stdout=subprocess.PIPE,
+            stderr=psql_errors,
+            env=_build_psql_env(download_job),
+        )
+        try:
+            yield psql_process.stdout
+        finally:
+            psql_process.stdout.close()
+            return_code = psql_process.wait()
+
+        if return_code != 0:
+            psql_errors.seek(0)
+            raise subprocess.CalledProcessError(return_code, psql_process.args, output=psql_errors.read())
+
+
+def _build_psql_env(download_job):
+    temp_env = os.environ.copy()
+    if download_job and not download_job.monthly_download:
+        # Since terminating the process isn't guaranteed to end the DB statement, add timeout to client connection
+        temp_env["PGOPTIONS"] = (
+            f"--statement-timeout={settings.DOWNLOAD_DB_TIMEOUT_IN_HOURS}h "
+            f"--work-mem={settings.DOWNLOAD_DB_WORK_MEM_IN_MB}MB"
+        )
+    return temp_env
+
+
 def retrieve_db_string():
     """It is necessary for this to be a function so the test suite can mock the connection string"""
     return settings.DOWNLOAD_DATABASE_URL
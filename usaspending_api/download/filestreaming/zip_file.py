@@ -1,5 +1,21 @@
 import os
+import shutil
+import time
 import zipfile
+import zlib
+
+from functools import partial
+from multiprocessing import Pool
+from typing import Iterator, List, NamedTuple, Tuple
+
+DEFLATE_CHUNK_SIZE = 1024 * 1024
+
+
+class DeflatedFile(NamedTuple):
+    deflated_file_path: str
+    crc: int
+    file_size: int
+    compress_size: int
 
 
 def append_files_to_zip_file(file_paths, zip_file_path):
@@ -17,3 +33,136 @@ def append_files_to_zip_file(file_paths, zip_file_path):
         for file_path in file_paths:
             archive_name = os.path.basename(file_path)
             zip_file.write(file_path, archive_name)
+
+
+def append_files_to_zip_file_in_parallel(
+    file_paths: List[str],
+    zip_file_path: str,
+    max_workers: int,
+    compression_level: int = zlib.Z_DEFAULT_COMPRESSION,
+):
+    """
+    Same result as `append_files_to_zip_file`, but each file is deflated independently on a pool of up to
+    `max_workers` processes. The compressed members are then stitched into the (ZIP64) archive in the order given,
+    as soon as each one is ready, so the archive is written while the remaining files are still being compressed.
+
+    Falls back to `append_files_to_zip_file` if the running Python's zipfile can't take already compressed members.
+    """
+    with zipfile.ZipFile(zip_file_path, "a", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zip_file:
+        if not _raw_member_writes_supported(zip_file):
+            for file_path in file_paths:
+                zip_file.write(file_path, os.path.basename(file_path))
+            return
+
+        compress_file = partial(_deflate_file, compression_level=compression_level)
+        with Pool(processes=max(1, min(max_workers, len(file_paths)))) as pool:
+            for file_path, deflated_file in zip(file_paths, pool.imap(compress_file, file_paths)):
+                try:
+                    zip_info = zipfile.ZipInfo.from_file(file_path, os.path.basename(file_path))
+                    zip_info.compress_type = zipfile.ZIP_DEFLATED
+                    zip_info.CRC = deflated_file.crc
+                    zip_info.file_size = deflated_file.file_size
+                    zip_info.compress_size = deflated_file.compress_size
+                    _write_raw_member(zip_file, zip_info, deflated_file.deflated_file_path)
+                finally:
+                    os.remove(deflated_file.deflated_file_path)
+
+
+def append_rows_to_zip_file(
+    rows: Iterator[bytes],
+    zip_file_path: str,
+    archive_name_template: str,
+    row_limit: int,
+    keep_headers: bool = True,
+) -> Tuple[List[str], int]:
+    """
+    Write already-delimited rows into the zip archive at zip_file_path, starting a new archive member every
+    `row_limit` rows. Members are named using the %s-style `archive_name_template` (numbered from 1) and, when
+    `keep_headers` is set, the first row is treated as a header and repeated at the top of every member.
+
+    Mirrors `partition_large_delimited_file` + `append_files_to_zip_file` without ever writing the rows to disk
+    uncompressed. Like the partitioner, at least one member is always written, even when there are no data rows.
+
+    Returns the names of the archive members written and the number of data rows (headers excluded).
+    """
+    header = next(rows, b"") if keep_headers else b""
+    archive_names = []
+    row_count = 0
+
+    with zipfile.ZipFile(zip_file_path, "a", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zip_file:
+        member = None
+        try:
+            for row in rows:
+                if member is None or row_count % row_limit == 0:
+                    if member is not None:
+                        member.close()
+                    archive_names.append(archive_name_template % (len(archive_names) + 1))
+                    member = zip_file.open(_build_zip_info(archive_names[-1]), "w", force_zip64=True)
+                    member.write(header)
+                member.write(row)
+                row_count += 1
+
+            if member is None:
+                archive_names.append(archive_name_template % 1)
+                zip_file.writestr(_build_zip_info(archive_names[-1]), header)
+        finally:
+            if member is not None:
+                member.close()
+
+    return archive_names, row_count
+
+
+def _build_zip_info(archive_name: str) -> zipfile.ZipInfo:
+    """Archive members written from memory need the metadata that `ZipFile.write` would take from the file system"""
+    zip_info = zipfile.ZipInfo(archive_name, date_time=time.localtime(time.time())[:6])
+    zip_info.compress_type = zipfile.ZIP_DEFLATED
+    zip_info.external_attr = 0o644 << 16
+    return zip_info
+
+
+def _deflate_file(file_path: str, compression_level: int) -> DeflatedFile:
+    """Write the raw deflate stream of the file (what a ZIP_DEFLATED member contains) to a sibling file"""
+    deflated_file_path = f"{file_path}.deflated"
+    compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    crc = 0
+    file_size = 0
+    with open(file_path, "rb") as source, open(deflated_file_path, "wb") as destination:
+        chunk = source.read(DEFLATE_CHUNK_SIZE)
+        while chunk:
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            destination.write(compressor.compress(chunk))
+            chunk = source.read(DEFLATE_CHUNK_SIZE)
+        destination.write(compressor.flush())
+        compress_size = destination.tell()
+
+    return DeflatedFile(deflated_file_path, crc, file_size, compress_size)
+
+
+def _raw_member_writes_supported(zip_file: zipfile.ZipFile) -> bool:
+    """Whether the ZipFile has the internals `_write_raw_member` relies on and is free to write a member"""
+    return (
+        all(hasattr(zip_file, attribute) for attribute in ("fp", "start_dir", "filelist", "NameToInfo", "_didModify"))
+        and zip_file.mode in ("a", "w", "x")
+        and not getattr(zip_file, "_writing", False)
+    )
+
+
+def _write_raw_member(zip_file: zipfile.ZipFile, zip_info: zipfile.ZipInfo, data_file_path: str):
+    """
+    The zipfile module only supports compressing data itself, so an already compressed member is written the same
+    way `ZipFile.write` would write it: a local file header followed by the data, with the member registered so that
+    it is included in the central directory when the archive is closed. This is the only place that touches private
+    ZipFile internals; check `_raw_member_writes_supported` first.
+    """
+    zip_info.header_offset = zip_file.start_dir
+
+    zip_file.fp.seek(zip_file.start_dir)
+    zip_file.fp.write(zip_info.FileHeader())
+    with open(data_file_path, "rb") as data:
+        shutil.copyfileobj(data, zip_file.fp, DEFLATE_CHUNK_SIZE)
+    zip_file.start_dir = zip_file.fp.tell()
+
+    zip_file.filelist.append(zip_info)
+    zip_file.NameToInfo[zip_info.filename] = zip_info
+    zip_file._didModify = True
@@ -1,3 +1,4 @@
+import json
 import logging
 import time
 import traceback
@@ -5,6 +6,7 @@ from ddtrace import tracer
 from ddtrace.ext import SpanTypes
 from ddtrace.constants import ANALYTICS_SAMPLE_RATE_KEY
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 
 from usaspending_api.common.sqs.sqs_handler import get_sqs_queue
@@ -14,6 +16,7 @@ from usaspending_api.common.sqs.sqs_work_dispatcher import (
     QueueWorkDispatcherError,
 )
 from usaspending_api.common.tracing import DatadogEagerlyDropTraceFilter, SubprocessTrace
+from usaspending_api.download.filestreaming.download_checkpoints import remove_stale_download_files
 from usaspending_api.download.filestreaming.download_generation import generate_download
 from usaspending_api.common.sqs.sqs_job_logging import log_job_message
 from usaspending_api.download.helpers.monthly_helpers import download_job_to_log_dict
@@ -29,6 +32,13 @@ class Command(BaseCommand):
         # Configure Tracer to drop traces of polls of the queue that have been flagged as uninteresting
         DatadogEagerlyDropTraceFilter.activate()
 
+        # Files kept for retries of failed downloads are removed by the retry; remove those of retries that went to
+        # another worker or never came
+        removed_count = remove_stale_download_files(settings.DOWNLOAD_STALE_FILES_MAX_AGE_HOURS * 60 * 60)
+        log_job_message(
+            logger=logger, message=f"Removed {removed_count} stale download file(s) from disk", job_type=JOB_TYPE
+        )
+
         queue = get_sqs_queue()
         log_job_message(logger=logger, message="Starting SQS polling", job_type=JOB_TYPE)
 
@@ -52,7 +62,13 @@ class Command(BaseCommand):
                 try:
 
                     # Check the queue for work and hand it to the given processing function
-                    message_found = dispatcher.dispatch(download_service_app)
+                    message_found = dispatcher.dispatch(
+                        download_service_app,
+                        message_transformer=lambda message: {
+                            "download_job_id": message.body,
+                            "can_be_retried": _can_be_retried(queue, message),
+                        },
+                    )
 
                     # Mark the job as failed if: there was an error processing the download; retries after interrupt
                     # are not allowed; or all retries have been exhausted
@@ -62,8 +78,9 @@ class Command(BaseCommand):
                     # That is, if maxReceiveCount > 1 in the policy, then retries are allowed
                     # - if queue retries are allowed, the queue message will retry to the max allowed by the queue
                     # - As coded, no cleanup should be needed to retry a download
-                    #   - the psql -o will overwrite the output file
-                    #   - the zip will use 'w' write mode to create from scratch each time
+                    #   - sources checkpointed on the DownloadJob are resumed if their files are still on disk, which
+                    #     are only kept while the message has receives left
+                    #   - anything else is overwritten, and the zip is restored to its last checkpoint or recreated
                     # The worker function controls the maximum allowed runtime of the job
 
                 except (QueueWorkerProcessError, QueueWorkDispatcherError) as exc:
@@ -80,7 +97,7 @@ class Command(BaseCommand):
                 keep_polling = not dispatcher.is_exiting
 
 
-def download_service_app(download_job_id):
+def download_service_app(download_job_id, can_be_retried=False):
     with SubprocessTrace(
         name=f"job.{JOB_TYPE}.download",
         service="bulk-download",
@@ -96,7 +113,19 @@ def download_service_app(download_job_id):
             other_params=download_job_details,
         )
         span.set_tags(download_job_details)
-        generate_download(download_job=download_job)
+        generate_download(download_job=download_job, can_be_retried=can_be_retried)
+
+
+def _can_be_retried(queue, message):
+    """Whether SQS will deliver the message again if processing it fails, per the queue's RedrivePolicy"""
+    redrive_policy = queue.attributes.get("RedrivePolicy")
+    if not redrive_policy:
+        return True  # Messages in queues without a redrive policy basically have endless retries
+    max_receive_count = json.loads(redrive_policy).get("maxReceiveCount")
+    receive_count = message.attributes.get("ApproximateReceiveCount")
+    if max_receive_count is None or receive_count is None:
+        return False
+    return int(receive_count) < int(max_receive_count)
 
 
 def _retrieve_download_job_from_db(download_job_id):
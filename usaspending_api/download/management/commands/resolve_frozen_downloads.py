@@ -63,6 +63,12 @@ class Command(BaseCommand):
             default=False,
             help="If true: include and restart monthly download jobs",
         )
+        parser.add_argument(
+            "--discard-checkpoints",
+            dest="discard_checkpoints",
+            action="store_true",
+            help="Generate the whole downloads again instead of resuming from the DownloadJobs' checkpoints",
+        )
 
     def handle(self, *args, **options):  # used by parent class
         logger.info("Beginning management command")
@@ -77,7 +83,7 @@ class Command(BaseCommand):
 
             download = DownloadAdministrator()
             download.search_for_a_download(download_job_id=download_job_id)
-            download.restart_download_operation()
+            download.restart_download_operation(discard_checkpoints=options["discard_checkpoints"])
 
     def parse_arguments_to_queryset_filter(self, **kwargs):
         filter_set = Q(job_status=JOB_STATUS_DICT[kwargs["status"]])
@@ -39,6 +39,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Throw caution into the wind and force that DownloadJob file generation to restart!",
         )
+        parser.add_argument(
+            "--discard-checkpoints",
+            action="store_true",
+            help="Generate the whole download again instead of resuming from the DownloadJob's checkpoints",
+        )
 
     def handle(self, *args, **options):  # used by parent class
         logger.info("Beginning management command")
@@ -48,7 +53,7 @@ class Command(BaseCommand):
         self.download.search_for_a_download(**self.get_custom_arguments(**options))
         if not options["force"]:
             self.validate_download_job()
-        self.download.restart_download_operation()
+        self.download.restart_download_operation(discard_checkpoints=options["discard_checkpoints"])
         logger.info("OK")
 
     @staticmethod
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('download', '0005_downloadjoblookup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='downloadjob',
+            name='checkpoints',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
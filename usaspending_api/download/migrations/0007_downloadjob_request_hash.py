@@ -0,0 +1,24 @@
+# Generated by Django 3.2.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('download', '0006_downloadjob_checkpoints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='downloadjob',
+            name='request_hash',
+            field=models.TextField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='downloadjob',
+            name='reused_download_job',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='download.downloadjob'),
+        ),
+    ]
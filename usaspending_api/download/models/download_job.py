@@ -26,6 +26,9 @@ class DownloadJob(models.Model):
     update_date = models.DateTimeField(auto_now=True, null=True)
     monthly_download = models.BooleanField(default=False)
     json_request = models.TextField(blank=True, null=True)
+    checkpoints = models.JSONField(blank=True, null=True)
+    request_hash = models.TextField(blank=True, null=True, db_index=True)
+    reused_download_job = models.ForeignKey("self", models.DO_NOTHING, blank=True, null=True)
 
     class Meta:
         managed = True
@@ -0,0 +1,172 @@
+import json
+import os
+import pytest
+import time
+import zipfile
+
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock
+
+from usaspending_api.download.filestreaming import download_generation
+from usaspending_api.download.filestreaming.download_checkpoints import (
+    EXPORTED,
+    ZIPPED,
+    DownloadCheckpoints,
+    remove_stale_download_files,
+)
+from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file
+
+
+def _build_checkpoints(temp_dir, checkpoints=None):
+    download_job = MagicMock(checkpoints=checkpoints)
+    return DownloadCheckpoints(download_job, os.path.join(temp_dir, "download.zip"))
+
+
+def test_restore_without_checkpoints():
+    with TemporaryDirectory() as temp_dir:
+        checkpoints = _build_checkpoints(temp_dir)
+
+        assert checkpoints.restore() is False
+        assert checkpoints.get_source("0_awards_d1") is None
+
+
+def test_restore_zip_after_interrupted_append():
+    with TemporaryDirectory() as temp_dir:
+        checkpoints = _build_checkpoints(temp_dir)
+        with zipfile.ZipFile(checkpoints.zip_file_path, "a", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr("first_1.csv", b"a,b\n1,2\n")
+        checkpoints.record_zip("0_awards_d1", "first.csv", 1)
+
+        # Simulate the worker being killed while appending the next source
+        with open(checkpoints.zip_file_path, "r+b") as zip_file:
+            zip_file.seek(checkpoints.download_job.checkpoints["zip"]["central_directory_offset"])
+            zip_file.write(b"partially written member that overwrote the central directory")
+            zip_file.truncate()
+
+        restored = _build_checkpoints(temp_dir, checkpoints.download_job.checkpoints)
+        assert restored.restore() is True
+        assert restored.get_source("0_awards_d1") == {"stage": ZIPPED, "file_name": "first.csv", "number_of_rows": 1}
+        with zipfile.ZipFile(restored.zip_file_path, "a", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            assert zip_file.read("first_1.csv") == b"a,b\n1,2\n"
+            zip_file.writestr("second_1.csv", b"a,b\n3,4\n")
+        with zipfile.ZipFile(restored.zip_file_path, "r") as zip_file:
+            assert zip_file.testzip() is None
+            assert zip_file.namelist() == ["first_1.csv", "second_1.csv"]
+
+
+def test_restore_discards_checkpoints_when_zip_is_missing():
+    with TemporaryDirectory() as temp_dir:
+        checkpoints = _build_checkpoints(temp_dir)
+        with zipfile.ZipFile(checkpoints.zip_file_path, "a") as zip_file:
+            zip_file.writestr("first_1.csv", b"a,b\n")
+        checkpoints.record_zip("0_awards_d1", "first.csv", 0)
+        os.remove(checkpoints.zip_file_path)
+
+        assert checkpoints.restore() is False
+        assert checkpoints.download_job.checkpoints is None
+        assert not os.path.exists(checkpoints.central_directory_path)
+
+
+def test_exported_source():
+    with TemporaryDirectory() as temp_dir:
+        source_path = os.path.join(temp_dir, "second.csv")
+        with open(source_path, "w") as f:
+            f.write("a,b\n1,2\n3,4\n")
+        checkpoints = _build_checkpoints(temp_dir)
+        checkpoints.record_export("1_awards_d2", "second.csv", source_path, 2)
+
+        restored = _build_checkpoints(temp_dir, checkpoints.download_job.checkpoints)
+        assert restored.restore() is True
+        assert restored.get_source("1_awards_d2")["stage"] == EXPORTED
+        assert restored.is_export_intact("1_awards_d2", source_path) is True
+
+        with open(source_path, "a") as f:
+            f.write("5,6\n")
+        assert restored.is_export_intact("1_awards_d2", source_path) is False
+
+
+def _mock_download(settings, monkeypatch, temp_dir):
+    """Mocks a download of one source whose first attempt fails to zip, returning its DownloadJob"""
+    settings.CSV_LOCAL_PATH = f"{temp_dir}/"
+    settings.IS_LOCAL = True
+    settings.DOWNLOAD_MAX_CONCURRENT_SOURCES = 1
+    settings.DOWNLOAD_STREAMING_PIPELINE = False
+    psql_log_path = os.path.join(temp_dir, "psql.log")
+    zip_failed_path = os.path.join(temp_dir, "zip_failed")
+
+    def fake_psql(temp_sql_file_path, source_path, download_job, row_count=None):
+        with open(psql_log_path, "a") as f:
+            f.write(f"{source_path}\n")
+        with open(source_path, "w") as f:
+            f.write("a\n1\n2\n")
+        row_count.value = 2
+
+    def fake_split_and_zip(zip_file_path, source_path, data_file_name, file_format, download_job=None):
+        append_files_to_zip_file([source_path], zip_file_path)
+        if not os.path.exists(zip_failed_path):
+            open(zip_failed_path, "w").close()
+            raise Exception("Zipping failed")
+
+    source = MagicMock(source_type="awards", file_type="d1")
+    source.columns.return_value = ["a"]
+    monkeypatch.setattr(download_generation, "reuse_existing_download", lambda download_job: False)
+    monkeypatch.setattr(download_generation, "get_download_sources", lambda *args: [source])
+    monkeypatch.setattr(download_generation, "build_data_file_name", lambda *args: "data")
+    monkeypatch.setattr(download_generation, "generate_export_query", lambda *args: "COPY")
+    monkeypatch.setattr(download_generation, "execute_psql", fake_psql)
+    monkeypatch.setattr(download_generation, "split_and_zip_data_files", fake_split_and_zip)
+    monkeypatch.setattr(download_generation, "DownloadJobLookup", MagicMock())
+
+    return MagicMock(
+        checkpoints=None,
+        download_job_id=1,
+        error_message=None,
+        file_name="download.zip",
+        json_request=json.dumps({"download_types": ["awards"], "file_format": "csv"}),
+        monthly_download=False,
+    )
+
+
+def test_exception_retry_skips_exported_source(settings, monkeypatch):
+    with TemporaryDirectory() as temp_dir:
+        download_job = _mock_download(settings, monkeypatch, temp_dir)
+
+        with pytest.raises(Exception):
+            download_generation.generate_download(download_job, can_be_retried=True)
+        assert download_job.checkpoints["sources"]["0_awards_d1"]["stage"] == EXPORTED
+        assert os.path.exists(os.path.join(temp_dir, "download", "data.csv"))
+
+        download_generation.generate_download(download_job)
+        with open(os.path.join(temp_dir, "psql.log")) as f:
+            assert len(f.readlines()) == 1
+        assert download_job.number_of_rows == 2
+        assert download_job.checkpoints is None
+        assert not os.path.exists(os.path.join(temp_dir, "download"))
+        with zipfile.ZipFile(os.path.join(temp_dir, "download.zip"), "r") as zip_file:
+            assert zip_file.read("data.csv") == b"a\n1\n2\n"
+
+
+def test_exception_on_final_attempt_removes_files(settings, monkeypatch):
+    with TemporaryDirectory() as temp_dir:
+        download_job = _mock_download(settings, monkeypatch, temp_dir)
+
+        with pytest.raises(Exception):
+            download_generation.generate_download(download_job, can_be_retried=False)
+        assert download_job.checkpoints is None
+        assert sorted(os.listdir(temp_dir)) == ["psql.log", "zip_failed"]
+
+
+def test_remove_stale_download_files(settings):
+    with TemporaryDirectory() as temp_dir:
+        settings.CSV_LOCAL_PATH = f"{temp_dir}/"
+        old_time = time.time() - 2 * 60 * 60
+        for name in ("old", "recent", "old_with_recent_file"):
+            os.mkdir(os.path.join(temp_dir, name))
+            open(os.path.join(temp_dir, name, "data.csv"), "w").close()
+        for name in ("old.zip", "old.zip.checkpoint", "recent.zip", "README.md"):
+            open(os.path.join(temp_dir, name), "w").close()
+        for name in ("old", "old/data.csv", "old_with_recent_file", "old.zip", "old.zip.checkpoint", "README.md"):
+            os.utime(os.path.join(temp_dir, name), (old_time, old_time))
+
+        assert remove_stale_download_files(60 * 60) == 3
+        assert sorted(os.listdir(temp_dir)) == ["README.md", "old_with_recent_file", "recent", "recent.zip"]
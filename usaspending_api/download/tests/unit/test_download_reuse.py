@@ -0,0 +1,139 @@
+import pytest
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from model_bakery import baker
+from unittest.mock import patch
+
+from usaspending_api.download.download_utils import build_download_request_hash
+from usaspending_api.download.filestreaming import download_generation
+from usaspending_api.download.filestreaming.download_generation import reuse_existing_download
+from usaspending_api.download.lookups import JOB_STATUS, JOB_STATUS_DICT
+
+
+JSON_REQUEST = {"download_types": ["awards"], "filters": {"agencies": [{"name": "Agency", "tier": "toptier"}]}}
+WATERMARK = datetime(2021, 1, 17, 12, 0, 0, 0, timezone.utc)
+REQUEST_HASH = build_download_request_hash(JSON_REQUEST, WATERMARK)
+
+
+@pytest.fixture
+def job_statuses(db):
+    for js in JOB_STATUS:
+        baker.make("download.JobStatus", job_status_id=js.id, name=js.name, description=js.desc)
+
+
+@pytest.fixture
+def not_local(settings):
+    settings.IS_LOCAL = False
+    settings.BULK_DOWNLOAD_S3_BUCKET_NAME = "bucket"
+    settings.USASPENDING_AWS_REGION = "region"
+
+
+@pytest.fixture
+def copy_s3_object():
+    with patch.object(download_generation, "copy_s3_object") as mock_copy_s3_object:
+        yield mock_copy_s3_object
+
+
+def make_finished_download_job():
+    return baker.make(
+        "download.DownloadJob",
+        download_job_id=1,
+        file_name="original.zip",
+        job_status_id=JOB_STATUS_DICT["finished"],
+        request_hash=REQUEST_HASH,
+        file_size=100,
+        number_of_rows=10,
+        number_of_columns=5,
+    )
+
+
+def test_request_hash_ignores_key_order():
+    reordered_request = OrderedDict([("filters", JSON_REQUEST["filters"]), ("download_types", ["awards"])])
+    assert build_download_request_hash(reordered_request, WATERMARK) == REQUEST_HASH
+
+
+def test_request_hash_changes_with_request_and_watermark():
+    assert build_download_request_hash({**JSON_REQUEST, "limit": 10}, WATERMARK) != REQUEST_HASH
+    assert build_download_request_hash(JSON_REQUEST, datetime(2021, 1, 18, 0, 0, 0, 0, timezone.utc)) != REQUEST_HASH
+
+
+def test_request_hash_requires_watermark():
+    assert build_download_request_hash(JSON_REQUEST, None) is None
+
+
+def test_reuse_finished_download(job_statuses, not_local, copy_s3_object):
+    make_finished_download_job()
+    download_job = baker.make(
+        "download.DownloadJob",
+        download_job_id=2,
+        file_name="duplicate.zip",
+        job_status_id=JOB_STATUS_DICT["ready"],
+        request_hash=REQUEST_HASH,
+    )
+
+    assert reuse_existing_download(download_job) is True
+    assert download_job.reused_download_job_id == 1
+    assert download_job.file_name == "duplicate.zip"
+    assert (download_job.file_size, download_job.number_of_rows, download_job.number_of_columns) == (100, 10, 5)
+    # The file_url handed out for the new job's file_name points at a copy of the archive
+    copy_s3_object.assert_called_once_with("bucket", "region", "original.zip", "duplicate.zip")
+
+
+def test_no_reuse_when_archive_copy_fails(job_statuses, not_local, copy_s3_object):
+    make_finished_download_job()
+    download_job = baker.make(
+        "download.DownloadJob",
+        download_job_id=2,
+        file_name="duplicate.zip",
+        job_status_id=JOB_STATUS_DICT["ready"],
+        request_hash=REQUEST_HASH,
+    )
+    copy_s3_object.side_effect = Exception("NoSuchKey")
+
+    assert reuse_existing_download(download_job) is False
+    assert download_job.reused_download_job_id is None
+
+
+def test_no_reuse_of_unfinished_or_different_download(job_statuses, not_local, copy_s3_object):
+    baker.make(
+        "download.DownloadJob",
+        download_job_id=1,
+        file_name="running.zip",
+        job_status_id=JOB_STATUS_DICT["running"],
+        request_hash=REQUEST_HASH,
+    )
+    baker.make(
+        "download.DownloadJob",
+        download_job_id=2,
+        file_name="other_request.zip",
+        job_status_id=JOB_STATUS_DICT["finished"],
+        request_hash=build_download_request_hash({**JSON_REQUEST, "limit": 10}, WATERMARK),
+        file_size=100,
+    )
+    download_job = baker.make(
+        "download.DownloadJob",
+        download_job_id=3,
+        file_name="new.zip",
+        job_status_id=JOB_STATUS_DICT["ready"],
+        request_hash=REQUEST_HASH,
+    )
+
+    assert reuse_existing_download(download_job) is False
+    assert download_job.reused_download_job_id is None
+    copy_s3_object.assert_not_called()
+
+
+def test_no_reuse_without_request_hash(job_statuses, not_local, copy_s3_object):
+    baker.make(
+        "download.DownloadJob",
+        download_job_id=1,
+        file_name="original.zip",
+        job_status_id=JOB_STATUS_DICT["finished"],
+        file_size=100,
+    )
+    download_job = baker.make(
+        "download.DownloadJob", download_job_id=2, file_name="new.zip", job_status_id=JOB_STATUS_DICT["ready"]
+    )
+
+    assert reuse_existing_download(download_job) is False
@@ -0,0 +1,19 @@
+from unittest.mock import MagicMock
+
+from usaspending_api.download.management.commands.download_sqs_worker import _can_be_retried
+
+
+def _message(receive_count):
+    return MagicMock(attributes={"ApproximateReceiveCount": receive_count})
+
+
+def test_can_be_retried():
+    queue = MagicMock(attributes={"RedrivePolicy": '{"deadLetterTargetArn": "ARN", "maxReceiveCount": 3}'})
+    assert _can_be_retried(queue, _message("1"))
+    assert _can_be_retried(queue, _message("2"))
+    assert not _can_be_retried(queue, _message("3"))
+    assert not _can_be_retried(queue, MagicMock(attributes={}))
+
+
+def test_can_be_retried_without_redrive_policy():
+    assert _can_be_retried(MagicMock(attributes={}), _message("10"))
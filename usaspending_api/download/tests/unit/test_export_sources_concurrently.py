@@ -0,0 +1,217 @@
+import json
+import multiprocessing
+import os
+import pytest
+import signal
+import time
+import zipfile
+
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, patch
+
+from usaspending_api.download.filestreaming import download_generation
+from usaspending_api.download.filestreaming.download_checkpoints import EXPORTED, ZIPPED, DownloadCheckpoints
+from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file
+
+# How long each mocked psql export takes, by source
+EXPORT_SECONDS = {"slowest": 0.6, "slow": 0.4, "fast": 0.2, "quick": 0.2, "failing": 0.1, "hanging": 60}
+
+
+@pytest.fixture
+def temp_dir():
+    with TemporaryDirectory() as temp_dir:
+        yield temp_dir
+
+
+@pytest.fixture
+def exports(monkeypatch, temp_dir):
+    """Mocks the psql exports, returning the path of the log of when each one started and ended"""
+    log_path = os.path.join(temp_dir, "psql.log")
+
+    def fake_psql(temp_sql_file_path, source_path, download_job, row_count=None):
+        file_name = os.path.basename(source_path)
+        _log(log_path, f"start {file_name}")
+        time.sleep(EXPORT_SECONDS[file_name.split(".")[0]])
+        if file_name.startswith("failing"):
+            raise Exception("psql failed")
+        with open(source_path, "w") as f:
+            f.write(f"a\n{file_name}\n")
+        row_count.value = 1
+        _log(log_path, f"end {file_name}")
+
+    monkeypatch.setattr(download_generation, "execute_psql", fake_psql)
+    monkeypatch.setattr(download_generation, "generate_export_query", lambda *args: "COPY")
+    monkeypatch.setattr(download_generation, "build_data_file_name", lambda source, *args: source.source_type)
+    monkeypatch.setattr(download_generation, "WAIT_FOR_PROCESS_SLEEP", 0.05)
+    return log_path
+
+
+@pytest.fixture
+def temp_file_paths(monkeypatch):
+    """Records the query files created for the exports"""
+    temp_file_paths = []
+    generate_export_query_temp_file = download_generation.generate_export_query_temp_file
+
+    def recording_generate_export_query_temp_file(*args, **kwargs):
+        temp_file, temp_file_path = generate_export_query_temp_file(*args, **kwargs)
+        temp_file_paths.append(temp_file_path)
+        return temp_file, temp_file_path
+
+    monkeypatch.setattr(
+        download_generation, "generate_export_query_temp_file", recording_generate_export_query_temp_file
+    )
+    return temp_file_paths
+
+
+@pytest.fixture
+def processes(monkeypatch):
+    """Records the processes started for the exports"""
+    processes = []
+
+    class RecordingProcess(multiprocessing.Process):
+        def start(self):
+            processes.append(self)
+            super().start()
+
+    monkeypatch.setattr(download_generation.multiprocessing, "Process", RecordingProcess)
+    yield processes
+    for process in processes:
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+
+def _log(log_path, line):
+    with open(log_path, "a") as f:
+        f.write(f"{line}\n")
+
+
+def _read_log(log_path):
+    with open(log_path) as f:
+        return [line.split() for line in f.read().splitlines()]
+
+
+def _build_source(source_type):
+    source = MagicMock(source_type=source_type, file_type="d1")
+    source.columns.return_value = ["a"]
+    return source
+
+
+def _build_download_job(checkpoints=None):
+    return MagicMock(
+        checkpoints=checkpoints,
+        download_job_id=1,
+        error_message=None,
+        file_name="download.zip",
+        json_request=json.dumps({"download_types": ["awards"], "file_format": "csv"}),
+        monthly_download=False,
+    )
+
+
+def _export(sources, download_job, working_dir):
+    """Runs the exports, returning their checkpoints and the mock of the DownloadCheckpoints.record_export they called"""
+    checkpoints = DownloadCheckpoints(download_job, f"{working_dir}.zip")
+    os.makedirs(working_dir, exist_ok=True)
+    with patch.object(checkpoints, "record_export", wraps=checkpoints.record_export) as record_export:
+        download_generation.export_sources_concurrently(
+            sources, None, download_job, working_dir, None, None, None, "csv", checkpoints
+        )
+    return checkpoints, record_export
+
+
+def _started_exports(log_path):
+    return sorted(file_name for event, file_name in _read_log(log_path) if event == "start")
+
+
+def test_export_runs_at_most_max_concurrent_sources(settings, exports, temp_dir, temp_file_paths, processes):
+    settings.DOWNLOAD_MAX_CONCURRENT_SOURCES = 2
+    sources = [_build_source(source_type) for source_type in ("slowest", "fast", "slow", "quick")]
+
+    checkpoints, record_export = _export(sources, _build_download_job(), os.path.join(temp_dir, "download"))
+
+    running_count, max_running_count = 0, 0
+    for event, _ in _read_log(exports):
+        running_count += 1 if event == "start" else -1
+        max_running_count = max(max_running_count, running_count)
+    assert max_running_count == 2
+    assert len(processes) == 4
+    assert record_export.call_count == 4
+    for source_index, source in enumerate(sources):
+        source_checkpoint = checkpoints.get_source(f"{source_index}_{source.source_type}_d1")
+        assert source_checkpoint["stage"] == EXPORTED
+        assert source_checkpoint["file_name"] == f"{source.source_type}.csv"
+        assert source_checkpoint["number_of_rows"] == 1
+    assert len(temp_file_paths) == 4 and not any(os.path.exists(path) for path in temp_file_paths)
+
+
+def test_failed_export_terminates_running_exports(settings, exports, temp_dir, temp_file_paths, processes):
+    settings.DOWNLOAD_MAX_CONCURRENT_SOURCES = 2
+    sources = [_build_source(source_type) for source_type in ("hanging", "failing", "fast")]
+
+    with pytest.raises(Exception, match="Command failed"):
+        _export(sources, _build_download_job(), os.path.join(temp_dir, "download"))
+
+    # The last source never started, and the one still running was terminated
+    assert _started_exports(exports) == ["failing.csv", "hanging.csv"]
+    assert len(processes) == 2
+    processes[0].join(5)
+    assert processes[0].exitcode == -signal.SIGTERM
+    assert processes[1].exitcode == 1
+    assert len(temp_file_paths) == 3 and not any(os.path.exists(path) for path in temp_file_paths)
+
+
+def test_export_skips_finished_sources(settings, exports, temp_dir, temp_file_paths, processes):
+    settings.DOWNLOAD_MAX_CONCURRENT_SOURCES = 2
+    sources = [_build_source(source_type) for source_type in ("slowest", "slow", "fast", "quick")]
+    working_dir = os.path.join(temp_dir, "download")
+    os.mkdir(working_dir)
+    for file_name in ("slow.csv", "fast.csv"):
+        with open(os.path.join(working_dir, file_name), "w") as f:
+            f.write("a\nexported\n")
+    source_checkpoints = {
+        "0_slowest_d1": {"stage": ZIPPED, "file_name": "slowest.csv", "number_of_rows": 1},
+        "1_slow_d1": {"stage": EXPORTED, "file_name": "slow.csv", "number_of_rows": 1, "file_size": 11},
+        # Changed since it was exported, so it's exported again
+        "2_fast_d1": {"stage": EXPORTED, "file_name": "fast.csv", "number_of_rows": 1, "file_size": 5},
+    }
+
+    checkpoints, record_export = _export(
+        sources, _build_download_job({"sources": source_checkpoints, "zip": None}), working_dir
+    )
+
+    assert _started_exports(exports) == ["fast.csv", "quick.csv"]
+    assert sorted(call[0][0] for call in record_export.call_args_list) == ["2_fast_d1", "3_quick_d1"]
+    assert checkpoints.get_source("0_slowest_d1")["stage"] == ZIPPED
+    assert checkpoints.get_source("1_slow_d1")["file_size"] == 11
+    assert checkpoints.get_source("2_fast_d1")["file_size"] == os.path.getsize(os.path.join(working_dir, "fast.csv"))
+    assert checkpoints.get_source("3_quick_d1")["stage"] == EXPORTED
+    assert len(temp_file_paths) == 2 and not any(os.path.exists(path) for path in temp_file_paths)
+
+
+def test_concurrent_exports_are_zipped_in_source_order(settings, monkeypatch, exports, temp_dir):
+    settings.CSV_LOCAL_PATH = f"{temp_dir}/"
+    settings.IS_LOCAL = True
+    settings.DOWNLOAD_MAX_CONCURRENT_SOURCES = 3
+    settings.DOWNLOAD_STREAMING_PIPELINE = False
+    sources = [_build_source(source_type) for source_type in ("slowest", "slow", "fast")]
+
+    def fake_split_and_zip(zip_file_path, source_path, data_file_name, file_format, download_job=None):
+        append_files_to_zip_file([source_path], zip_file_path)
+
+    monkeypatch.setattr(download_generation, "reuse_existing_download", lambda download_job: False)
+    monkeypatch.setattr(download_generation, "get_download_sources", lambda *args: sources)
+    monkeypatch.setattr(download_generation, "split_and_zip_data_files", fake_split_and_zip)
+    monkeypatch.setattr(download_generation, "DownloadJobLookup", MagicMock())
+    download_job = _build_download_job()
+
+    download_generation.generate_download(download_job)
+
+    # Exported fastest first, but zipped in the order of the sources
+    assert [file_name for event, file_name in _read_log(exports) if event == "end"] == [
+        "fast.csv",
+        "slow.csv",
+        "slowest.csv",
+    ]
+    with zipfile.ZipFile(os.path.join(temp_dir, "download.zip"), "r") as zip_file:
+        assert zip_file.namelist() == ["slowest.csv", "slow.csv", "fast.csv"]
+    assert download_job.number_of_rows == 3
@@ -1,8 +1,14 @@
 import os
 import zipfile
+import zlib
 
-from tempfile import NamedTemporaryFile
-from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from usaspending_api.download.filestreaming import zip_file as zip_file_module
+from usaspending_api.download.filestreaming.zip_file import (
+    append_files_to_zip_file,
+    append_files_to_zip_file_in_parallel,
+    append_rows_to_zip_file,
+)
 
 
 def test_append_files_to_zip_file():
@@ -20,3 +26,100 @@ def test_append_files_to_zip_file():
                         os.path.basename(include_file_1.name),
                         os.path.basename(include_file_2.name),
                     ]
+
+
+def test_append_rows_to_zip_file():
+    rows = iter([b"a,b\n", b"1,2\n", b'3,"multi\nline"\n', b"5,6\n"])
+    with NamedTemporaryFile() as zip_file:
+        archive_names, row_count = append_rows_to_zip_file(rows, zip_file.name, "test_%s.csv", row_limit=2)
+
+        assert archive_names == ["test_1.csv", "test_2.csv"]
+        assert row_count == 3
+        with zipfile.ZipFile(zip_file.name, "r") as zf:
+            assert [z.filename for z in zf.filelist] == archive_names
+            assert zf.read("test_1.csv") == b'a,b\n1,2\n3,"multi\nline"\n'
+            assert zf.read("test_2.csv") == b"a,b\n5,6\n"
+
+
+def test_append_rows_to_zip_file_header_only():
+    with NamedTemporaryFile() as zip_file:
+        archive_names, row_count = append_rows_to_zip_file(iter([b"a,b\n"]), zip_file.name, "test_%s.csv", 2)
+
+        assert archive_names == ["test_1.csv"]
+        assert row_count == 0
+        with zipfile.ZipFile(zip_file.name, "r") as zf:
+            assert zf.read("test_1.csv") == b"a,b\n"
+
+
+def test_append_files_to_zip_file_in_parallel():
+    with TemporaryDirectory() as temp_dir:
+        zip_file_path = os.path.join(temp_dir, "test.zip")
+        append_files_to_zip_file([_write_file(temp_dir, "existing.txt", b"already zipped")], zip_file_path)
+
+        contents = {f"file_{i}.csv": os.urandom(1024) * (i + 1) + b"a,b,c\n" * 50000 for i in range(4)}
+        file_paths = [_write_file(temp_dir, name, data) for name, data in contents.items()]
+        append_files_to_zip_file_in_parallel(file_paths, zip_file_path, max_workers=2, compression_level=1)
+
+        with zipfile.ZipFile(zip_file_path, "r") as zf:
+            assert zf.testzip() is None
+            assert [z.filename for z in zf.filelist] == ["existing.txt", *contents]
+            assert zf.read("existing.txt") == b"already zipped"
+            for name, data in contents.items():
+                assert zf.read(name) == data
+                assert zf.getinfo(name).compress_size < len(data)
+        assert sorted(os.listdir(temp_dir)) == ["existing.txt", *contents, "test.zip"]
+
+
+def test_append_files_to_zip_file_in_parallel_without_raw_member_writes(monkeypatch):
+    monkeypatch.setattr(zip_file_module, "_raw_member_writes_supported", lambda zip_file: False)
+    with TemporaryDirectory() as temp_dir:
+        zip_file_path = os.path.join(temp_dir, "test.zip")
+        file_paths = [_write_file(temp_dir, f"file_{i}.csv", b"a,b,c\n" * (i + 1)) for i in range(2)]
+        append_files_to_zip_file_in_parallel(file_paths, zip_file_path, max_workers=2)
+
+        with zipfile.ZipFile(zip_file_path, "r") as zf:
+            assert zf.testzip() is None
+            assert zf.read("file_1.csv") == b"a,b,c\n" * 2
+        assert sorted(os.listdir(temp_dir)) == ["file_0.csv", "file_1.csv", "test.zip"]
+
+
+def test_write_raw_member_with_runtime_zipfile():
+    """
+    _write_raw_member relies on private ZipFile internals.  If a Python upgrade changes them this should fail rather
+    than downloads quietly falling back to serial compression or writing corrupt archives.
+    """
+    data = b"a,b,c\n" * 1000
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+    deflated = compressor.compress(data) + compressor.flush()
+
+    with TemporaryDirectory() as temp_dir:
+        zip_file_path = os.path.join(temp_dir, "test.zip")
+        data_file_path = _write_file(temp_dir, "raw.deflated", deflated)
+        with zipfile.ZipFile(zip_file_path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+            zf.writestr("before.txt", b"before")
+            assert zip_file_module._raw_member_writes_supported(zf)
+
+            zip_info = zipfile.ZipInfo("raw.csv", date_time=(2020, 1, 1, 0, 0, 0))
+            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            zip_info.CRC = zlib.crc32(data)
+            zip_info.file_size = len(data)
+            zip_info.compress_size = len(deflated)
+            zip_file_module._write_raw_member(zf, zip_info, data_file_path)
+
+            zf.writestr("after.txt", b"after")
+
+        with zipfile.ZipFile(zip_file_path, "a") as zf:
+            zf.writestr("appended.txt", b"appended")
+
+        with zipfile.ZipFile(zip_file_path, "r") as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == ["before.txt", "raw.csv", "after.txt", "appended.txt"]
+            assert zf.read("raw.csv") == data
+            assert zf.read("after.txt") == b"after"
+
+
+def _write_file(directory, name, data):
+    file_path = os.path.join(directory, name)
+    with open(file_path, "wb") as f:
+        f.write(data)
+    return file_path
@@ -15,7 +15,11 @@ from usaspending_api.broker.models import ExternalDataLoadDate
 from usaspending_api.common.api_versioning import api_transformations, API_TRANSFORM_FUNCTIONS
 from usaspending_api.common.helpers.dict_helpers import order_nested_object
 from usaspending_api.common.sqs.sqs_handler import get_sqs_queue
-from usaspending_api.download.download_utils import create_unique_filename, log_new_download_job
+from usaspending_api.download.download_utils import (
+    build_download_request_hash,
+    create_unique_filename,
+    log_new_download_job,
+)
 from usaspending_api.download.filestreaming import download_generation
 from usaspending_api.download.filestreaming.s3_handler import S3Handler
 from usaspending_api.download.helpers import write_to_download_log as write_to_log
@@ -53,7 +57,8 @@ class BaseDownloadViewSet(APIView):
 
         # Check if the same request has been called today
         ordered_json_request = json.dumps(json_request)
-        cached_download = self._get_cached_download(ordered_json_request, json_request.get("download_types", []))
+        data_watermark = self._get_data_watermark(json_request.get("download_types", []))
+        cached_download = self._find_cached_download(ordered_json_request, data_watermark)
 
         if cached_download and not settings.IS_LOCAL:
             # By returning the cached files, there should be no duplicates on a daily basis
@@ -63,7 +68,10 @@ class BaseDownloadViewSet(APIView):
 
         final_output_zip_name = create_unique_filename(json_request, origination=origination)
         download_job = DownloadJob.objects.create(
-            job_status_id=JOB_STATUS_DICT["ready"], file_name=final_output_zip_name, json_request=ordered_json_request
+            job_status_id=JOB_STATUS_DICT["ready"],
+            file_name=final_output_zip_name,
+            json_request=ordered_json_request,
+            request_hash=build_download_request_hash(json_request, data_watermark),
         )
 
         log_new_download_job(request, download_job)
@@ -122,6 +130,26 @@ class BaseDownloadViewSet(APIView):
     def _get_cached_download(
         ordered_json_request: str, download_types: Optional[List[str]] = None
     ) -> Optional[QuerySet]:
+        data_watermark = BaseDownloadViewSet._get_data_watermark(download_types)
+        return BaseDownloadViewSet._find_cached_download(ordered_json_request, data_watermark)
+
+    @staticmethod
+    def _find_cached_download(ordered_json_request: str, data_watermark: Optional[datetime]) -> Optional[QuerySet]:
+        # Conditional put in place for local development where the external dates may not be defined
+        cached_download = None
+        if data_watermark:
+            cached_download = (
+                DownloadJob.objects.filter(json_request=ordered_json_request, update_date__gte=data_watermark)
+                .order_by("-update_date")
+                .exclude(job_status_id=JOB_STATUS_DICT["failed"])
+                .values("download_job_id", "file_name")
+                .first()
+            )
+        return cached_download
+
+    @staticmethod
+    def _get_data_watermark(download_types: Optional[List[str]] = None) -> Optional[datetime]:
+        """Most recent time the data behind a download could have changed; None if the load dates aren't defined"""
         # External data types that directly affect download results
         if download_types and "elasticsearch_awards" in download_types:
             external_data_type_name_list = ["es_awards"]
@@ -138,24 +166,13 @@ class BaseDownloadViewSet(APIView):
         updated_date_timestamp = ExternalDataLoadDate.objects.filter(
             external_data_type_id__in=external_data_type_id_list
         ).aggregate(Max("last_load_date"))["last_load_date__max"]
+        if not updated_date_timestamp:
+            return None
 
-        # Conditional put in place for local development where the external dates may not be defined
-        cached_download = None
-        if updated_date_timestamp:
-            recent_submission_window_date = DABSSubmissionWindowSchedule.objects.filter(
-                submission_reveal_date__lt=datetime.max.replace(tzinfo=timezone.utc)
-            ).aggregate(Max("submission_reveal_date"))["submission_reveal_date__max"]
-            cached_download = (
-                DownloadJob.objects.filter(
-                    json_request=ordered_json_request,
-                    update_date__gte=max(updated_date_timestamp, recent_submission_window_date),
-                )
-                .order_by("-update_date")
-                .exclude(job_status_id=JOB_STATUS_DICT["failed"])
-                .values("download_job_id", "file_name")
-                .first()
-            )
-        return cached_download
+        recent_submission_window_date = DABSSubmissionWindowSchedule.objects.filter(
+            submission_reveal_date__lt=datetime.max.replace(tzinfo=timezone.utc)
+        ).aggregate(Max("submission_reveal_date"))["submission_reveal_date__max"]
+        return max(updated_date_timestamp, recent_submission_window_date)
 
 
 def get_file_path(file_name: str) -> str:
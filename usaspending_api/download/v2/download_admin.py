@@ -25,7 +25,8 @@ class DownloadAdministrator:
     def get_download_job(self, queryset_filter):
         self.download_job = query_database_for_record(queryset_filter)
 
-    def restart_download_operation(self):
+    def restart_download_operation(self, discard_checkpoints=False):
+        """Restarts the download; it resumes from the DownloadJob's checkpoints unless told to discard them"""
         self.update_download_job(
             error_message=None,
             file_size=0,
@@ -34,6 +35,8 @@ class DownloadAdministrator:
             number_of_rows=0,
             update_date=datetime.now(timezone.utc),
         )
+        if discard_checkpoints:
+            self.update_download_job(checkpoints=None)
 
         if process_is_local():
             download_generation.generate_download(download_job=self.download_job)
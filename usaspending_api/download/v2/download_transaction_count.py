@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.awards.v2.filters.sub_award import subaward_filter
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
 from usaspending_api.common.helpers.generic_helper import get_generic_filters_message
@@ -22,6 +23,7 @@ class DownloadTransactionCountViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/download/count.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     @cache_response()
     def post(self, request):
@@ -5,6 +5,7 @@ from usaspending_api.etl.elasticsearch_loader_helpers.delete_data import (
 )
 from usaspending_api.etl.elasticsearch_loader_helpers.extract_data import (
     count_of_records_to_process,
+    extract_record_batches,
     extract_records,
     obtain_extract_sql,
 )
@@ -17,7 +18,7 @@ from usaspending_api.etl.elasticsearch_loader_helpers.index_config import (
     toggle_refresh_on,
     check_new_index_name_is_ok,
 )
-from usaspending_api.etl.elasticsearch_loader_helpers.load_data import load_data
+from usaspending_api.etl.elasticsearch_loader_helpers.load_data import load_data, load_data_in_batches
 from usaspending_api.etl.elasticsearch_loader_helpers.transform_data import (
     transform_award_data,
     transform_covid19_faba_data,
@@ -28,6 +29,8 @@ from usaspending_api.etl.elasticsearch_loader_helpers.utilities import (
     execute_sql_statement,
     format_log,
     gen_random_name,
+    iterate_in_background,
+    stream_sql_statement,
     TaskSpec,
 )
 from usaspending_api.etl.elasticsearch_loader_helpers.controller import Controller
@@ -42,12 +45,16 @@ __all__ = [
     "delete_awards",
     "delete_transactions",
     "execute_sql_statement",
+    "extract_record_batches",
     "extract_records",
     "format_log",
     "gen_random_name",
+    "iterate_in_background",
     "load_data",
+    "load_data_in_batches",
     "obtain_extract_sql",
     "set_final_index_config",
+    "stream_sql_statement",
     "swap_aliases",
     "take_snapshot",
     "TaskSpec",
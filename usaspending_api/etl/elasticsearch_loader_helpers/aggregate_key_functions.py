@@ -1,11 +1,16 @@
 import json
 import logging
 
-from typing import Optional, List
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional
 
 
 logger = logging.getLogger("script")
 
+# Most agg keys are built from a handful of agency, location, NAICS or PSC values that repeat across many records
+AGG_KEY_CACHE_SIZE = 2**16
+
 
 def award_recipient_agg_key(record: dict) -> str:
     """Dictionary key order impacts Elasticsearch behavior!!!"""
@@ -192,3 +197,93 @@ def _country_agg_key(location_type, record: dict) -> Optional[str]:
             "country_name": record[f"{location_type}_country_name"],
         }
     )
+
+
+def _agency_agg_key_fields(agency_type: str, agency_tier: str) -> tuple:
+    return (
+        f"{agency_type}_{agency_tier}_agency_name",
+        f"{agency_type}_{agency_tier}_agency_abbreviation",
+        f"{agency_type}_{agency_tier}_agency_code",
+        f"{agency_type}_toptier_agency_id",
+    )
+
+
+def _county_agg_key_fields(location_type: str) -> tuple:
+    fields = ("state_code", "county_code", "country_code", "state_fips", "county_name", "county_population")
+    return tuple(f"{location_type}_{field}" for field in fields)
+
+
+def _congressional_agg_key_fields(location_type: str) -> tuple:
+    fields = ("state_code", "congressional_code", "country_code", "state_fips", "congressional_population")
+    return tuple(f"{location_type}_{field}" for field in fields)
+
+
+def _state_agg_key_fields(location_type: str) -> tuple:
+    fields = ("state_code", "country_code", "state_name", "state_population")
+    return tuple(f"{location_type}_{field}" for field in fields)
+
+
+def _country_agg_key_fields(location_type: str) -> tuple:
+    return (f"{location_type}_country_code", f"{location_type}_country_name")
+
+
+# The record fields each agg key function reads. The recipient functions aren't listed; their keys are nearly
+# unique per recipient (and depend on list values) so there is little to gain from caching them
+AGG_KEY_FUNCTION_FIELDS = {
+    awarding_subtier_agency_agg_key: _agency_agg_key_fields("awarding", "subtier"),
+    awarding_toptier_agency_agg_key: _agency_agg_key_fields("awarding", "toptier"),
+    funding_subtier_agency_agg_key: _agency_agg_key_fields("funding", "subtier"),
+    funding_toptier_agency_agg_key: _agency_agg_key_fields("funding", "toptier"),
+    naics_agg_key: ("naics_code", "naics_description"),
+    psc_agg_key: ("product_or_service_code", "product_or_service_description"),
+    pop_county_agg_key: _county_agg_key_fields("pop"),
+    recipient_location_county_agg_key: _county_agg_key_fields("recipient_location"),
+    pop_congressional_agg_key: _congressional_agg_key_fields("pop"),
+    recipient_location_congressional_agg_key: _congressional_agg_key_fields("recipient_location"),
+    pop_state_agg_key: _state_agg_key_fields("pop"),
+    recipient_location_state_agg_key: _state_agg_key_fields("recipient_location"),
+    pop_country_agg_key: _country_agg_key_fields("pop"),
+    recipient_location_country_agg_key: _country_agg_key_fields("recipient_location"),
+}
+
+_cached_agg_key_functions = {}
+
+
+def compile_agg_key_functions(agg_key_creations: Dict[str, Callable], record: dict) -> Dict[str, Callable]:
+    """
+    Swap each agg key function for one that memoizes its result on the values of the fields it reads. The field
+    values are pulled from a record in a single C-level `itemgetter` call and the original function only runs (to
+    build the identical key) for values it hasn't seen yet. The caches live for the life of the process, so they
+    carry over between the batches and partitions handled by an indexer worker.
+
+    `record` is a sample of the records the functions will be used on; some agg keys depend on which fields exist.
+    """
+    compiled = {}
+    for key, agg_key_function in agg_key_creations.items():
+        fields = tuple(field for field in AGG_KEY_FUNCTION_FIELDS.get(agg_key_function, ()) if field in record)
+        if not fields:
+            compiled[key] = agg_key_function
+            continue
+
+        cached_function = _cached_agg_key_functions.get((agg_key_function, fields))
+        if cached_function is None:
+            cached_function = lru_cache(maxsize=AGG_KEY_CACHE_SIZE)(_agg_key_from_values(agg_key_function, fields))
+            _cached_agg_key_functions[(agg_key_function, fields)] = cached_function
+        compiled[key] = _agg_key_from_record(cached_function, fields)
+    return compiled
+
+
+def _agg_key_from_values(agg_key_function: Callable, fields: tuple) -> Callable:
+    def agg_key_from_values(values: tuple) -> Optional[str]:
+        return agg_key_function(dict(zip(fields, values)))
+
+    return agg_key_from_values
+
+
+def _agg_key_from_record(cached_function: Callable, fields: tuple) -> Callable:
+    if len(fields) == 1:
+        field = fields[0]
+        return lambda record: cached_function((record[field],))
+
+    get_values = itemgetter(*fields)
+    return lambda record: cached_function(get_values(record))
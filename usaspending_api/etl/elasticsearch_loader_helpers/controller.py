@@ -13,10 +13,13 @@ from usaspending_api.etl.elasticsearch_loader_helpers import (
     create_index,
     delete_awards,
     delete_transactions,
+    extract_record_batches,
     extract_records,
     format_log,
     gen_random_name,
+    iterate_in_background,
     load_data,
+    load_data_in_batches,
     obtain_extract_sql,
     set_final_index_config,
     swap_aliases,
@@ -27,6 +30,9 @@ from usaspending_api.common.helpers.sql_helpers import close_all_django_db_conns
 
 logger = logging.getLogger("script")
 
+# How many extracted and transformed batches a pipelined worker may hold while waiting on Elasticsearch
+PIPELINE_BATCHES_AHEAD = 2
+
 total_doc_success = Value("i", 0, lock=True)
 total_doc_fail = Value("i", 0, lock=True)
 
@@ -137,6 +143,9 @@ class Controller:
             primary_key=self.config["primary_key"],
             field_for_es_id=self.config["field_for_es_id"],
             sql=sql_str,
+            stream_sql_func=self.config.get("stream_sql_func"),
+            fetch_size=self.config.get("fetch_size"),
+            transform_in_batches=self.config.get("transform_in_batches", False),
             transform_func=self.config["data_transform_func"],
             view=self.config["sql_view"],
         )
@@ -173,16 +182,19 @@ def extract_transform_load(task: TaskSpec) -> None:
 
     client = instantiate_elasticsearch_client()
     try:
-        records = task.transform_func(task, extract_records(task))
-        if abort.is_set():
-            f"Prematurely ending partition #{task.partition_number} due to error in another process"
-            logger.warning(format_log(msg, name=task.name))
-            return
-        if len(records) > 0:
-            success, fail = load_data(task, records, client)
+        if task.stream_sql_func and task.transform_in_batches:
+            success, fail = pipelined_extract_transform_load(task, client)
         else:
-            logger.info(format_log("No records to index", name=task.name))
-            success, fail = 0, 0
+            records = task.transform_func(task, extract_records(task))
+            if abort.is_set():
+                f"Prematurely ending partition #{task.partition_number} due to error in another process"
+                logger.warning(format_log(msg, name=task.name))
+                return
+            if len(records) > 0:
+                success, fail = load_data(task, records, client)
+            else:
+                logger.info(format_log("No records to index", name=task.name))
+                success, fail = 0, 0
         with total_doc_success.get_lock():
             total_doc_success.value += success
         with total_doc_fail.get_lock():
@@ -197,3 +209,26 @@ def extract_transform_load(task: TaskSpec) -> None:
     else:
         msg = f"Partition #{task.partition_number} was successfully processed in {perf_counter() - start:.2f}s"
         logger.info(format_log(msg, name=task.name))
+
+
+def pipelined_extract_transform_load(task: TaskSpec, client) -> Tuple[int, int]:
+    """
+    Stream the partition from the DB in batches, transforming each batch on a background thread while the batches
+    before it are bulk indexed. DB reads and ES writes overlap, and a worker only holds a few batches in memory rather
+    than the whole partition. Only usable when the transform works on each record independently.
+    """
+
+    def transformed_batches():
+        for records in extract_record_batches(task):
+            if abort.is_set():
+                raise RuntimeError(
+                    f"Prematurely ending partition #{task.partition_number} due to error in another process"
+                )
+            yield task.transform_func(task, records)
+
+    success, fail = load_data_in_batches(
+        task, iterate_in_background(transformed_batches(), PIPELINE_BATCHES_AHEAD), client
+    )
+    if success + fail == 0:
+        logger.info(format_log("No records to index", name=task.name))
+    return success, fail
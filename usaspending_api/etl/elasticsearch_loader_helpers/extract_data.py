@@ -1,12 +1,16 @@
 import logging
 
 from time import perf_counter
-from typing import List, Tuple
+from typing import Generator, Iterable, List, Tuple
 
 from usaspending_api.etl.elasticsearch_loader_helpers.utilities import TaskSpec, format_log, execute_sql_statement
 
 logger = logging.getLogger("script")
 
+# Default number of rows fetched from the DB per round trip when streaming a partition (see --fetch-size). Kept below
+# the partition size so that a partition is read in several batches, each one being indexed while the next is fetched
+EXTRACT_BATCH_SIZE = 2000
+
 EXTRACT_SQL = """
     SELECT *
     FROM "{sql_view}"
@@ -61,7 +65,14 @@ def count_of_records_to_process(config: dict) -> Tuple[int, int, int]:
     return count, min_id, max_id
 
 
-def extract_records(task: TaskSpec) -> List[dict]:
+def extract_records(task: TaskSpec) -> Iterable[dict]:
+    """
+    Records of the task's partition. When the task can stream its SQL, the records are produced lazily, `fetch_size`
+    at a time, instead of the whole partition being read into memory first.
+    """
+    if task.stream_sql_func:
+        return (record for records in extract_record_batches(task) for record in records)
+
     start = perf_counter()
     logger.info(format_log(f"Extracting data from source", name=task.name, action="Extract"))
 
@@ -74,3 +85,20 @@ def extract_records(task: TaskSpec) -> List[dict]:
     msg = f"{len(records):,} records extracted in {perf_counter() - start:.2f}s"
     logger.info(format_log(msg, name=task.name, action="Extract"))
     return records
+
+
+def extract_record_batches(task: TaskSpec) -> Generator[List[dict], None, None]:
+    start = perf_counter()
+    logger.info(format_log("Streaming data from source", name=task.name, action="Extract"))
+
+    record_count = 0
+    try:
+        for records in task.stream_sql_func(task.sql, task.fetch_size or EXTRACT_BATCH_SIZE):
+            record_count += len(records)
+            yield records
+    except Exception as e:
+        logger.exception(f"Failed on partition {task.name} with '{task.sql}'")
+        raise e
+
+    msg = f"{record_count:,} records extracted in {perf_counter() - start:.2f}s"
+    logger.info(format_log(msg, name=task.name, action="Extract"))
@@ -2,7 +2,7 @@ import logging
 
 from elasticsearch import Elasticsearch, helpers
 from time import perf_counter
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from usaspending_api.etl.elasticsearch_loader_helpers.delete_data import delete_docs_by_unique_key
 from usaspending_api.etl.elasticsearch_loader_helpers.utilities import TaskSpec, format_log
@@ -40,6 +40,19 @@ def load_data(worker: TaskSpec, records: List[dict], client: Elasticsearch) -> T
     return success, failed
 
 
+def load_data_in_batches(
+    worker: TaskSpec, record_batches: Iterable[List[dict]], client: Elasticsearch
+) -> Tuple[int, int]:
+    """Same as load_data, but the records can be provided as they become available instead of all at once"""
+    start = perf_counter()
+    logger.info(format_log("Starting Index operation", name=worker.name, action="Index"))
+    success, failed = streaming_post_batches_to_es(
+        client, record_batches, worker.index, worker.name, delete_before_index=worker.is_incremental
+    )
+    logger.info(format_log(f"Index operation took {perf_counter() - start:.2f}s", name=worker.name, action="Index"))
+    return success, failed
+
+
 def streaming_post_to_es(
     client: Elasticsearch,
     chunk: list,
@@ -72,21 +85,44 @@ def streaming_post_to_es(
     Returns: (succeeded, failed) tuple, which counts successful index doc writes vs. failed doc writes
     """
 
+    return streaming_post_batches_to_es(client, [chunk], index_name, job_name, delete_before_index, delete_key)
+
+
+def streaming_post_batches_to_es(
+    client: Elasticsearch,
+    chunks: Iterable[List[dict]],
+    index_name: str,
+    job_name: str = None,
+    delete_before_index: bool = True,
+    delete_key: str = "_id",
+) -> Tuple[int, int]:
+    """
+    Same as streaming_post_to_es, but feeds a single `streaming_bulk` from an iterable of chunks. Documents are
+    deleted (if delete_before_index) one chunk at a time, just before that chunk is indexed, so chunks can be produced
+    lazily while earlier ones are still being indexed.
+
+    Returns: (succeeded, failed) tuple, which counts successful index doc writes vs. failed doc writes
+    """
+
+    def actions():
+        for chunk in chunks:
+            if delete_before_index:
+                value_list = [doc[delete_key] for doc in chunk]
+                delete_docs_by_unique_key(
+                    client,
+                    delete_key,
+                    value_list,
+                    job_name,
+                    index_name,
+                    refresh_after=False,
+                )
+            yield from chunk
+
     success, failed = 0, 0
     try:
-        if delete_before_index:
-            value_list = [doc[delete_key] for doc in chunk]
-            delete_docs_by_unique_key(
-                client,
-                delete_key,
-                value_list,
-                job_name,
-                index_name,
-                refresh_after=False,
-            )
         for ok, item in helpers.streaming_bulk(
             client,
-            actions=chunk,
+            actions=actions(),
             chunk_size=ES_BATCH_ENTRIES,
             max_chunk_bytes=ES_MAX_BATCH_BYTES,
             max_retries=10,
@@ -2,7 +2,7 @@ import logging
 
 from django.conf import settings
 from time import perf_counter
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
 from usaspending_api.etl.elasticsearch_loader_helpers import aggregate_key_functions as funcs
 from usaspending_api.etl.elasticsearch_loader_helpers.utilities import (
@@ -83,12 +83,14 @@ def transform_transaction_data(worker: TaskSpec, records: List[dict]) -> List[di
     return transform_data(worker, records, converters, agg_key_creations, drop_fields, settings.ES_ROUTING_FIELD)
 
 
-def transform_covid19_faba_data(worker: TaskSpec, records: List[dict]) -> List[dict]:
+def transform_covid19_faba_data(worker: TaskSpec, records: Iterable[dict]) -> List[dict]:
     logger.info(format_log(f"Transforming data", name=worker.name, action="Transform"))
     start = perf_counter()
     results = {}
+    record_count = 0
 
     for record in records:
+        record_count += 1
         es_id_field = record[worker.field_for_es_id]
         disinct_award_key = record.pop("financial_account_distinct_award_key")
         award_id = record.pop("award_id")
@@ -119,8 +121,8 @@ def transform_covid19_faba_data(worker: TaskSpec, records: List[dict]) -> List[d
             results[temp_key]["outlay_sum"] += outlay_sum
         results[temp_key]["financial_accounts_by_award"].append(record)
 
-    if len(results) != len(records):
-        msg = f"Transformed {len(records)} database records into {len(results)} documents for ingest"
+    if len(results) != record_count:
+        msg = f"Transformed {record_count} database records into {len(results)} documents for ingest"
         logger.info(format_log(msg, name=worker.name, action="Transform"))
 
     msg = f"Transformation operation took {perf_counter() - start:.2f}s"
@@ -139,6 +141,8 @@ def transform_data(
     logger.info(format_log(f"Transforming data", name=worker.name, action="Transform"))
 
     start = perf_counter()
+    if records:
+        agg_key_creations = funcs.compile_agg_key_functions(agg_key_creations, records[0])
 
     for record in records:
         for field, converter in converters.items():
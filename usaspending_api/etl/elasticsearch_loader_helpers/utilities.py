@@ -1,14 +1,16 @@
 import json
 import logging
 import psycopg2
+import queue
 import re
+import threading
 
 from dataclasses import dataclass
 from django.conf import settings
 from elasticsearch import Elasticsearch
 from pathlib import Path
 from random import choice
-from typing import Any, Generator, List, Optional
+from typing import Any, Generator, Iterable, List, Optional
 
 from usaspending_api.common.helpers.sql_helpers import get_database_dsn_string
 
@@ -31,6 +33,9 @@ class TaskSpec:
     is_incremental: bool
     execute_sql_func: callable = None
     transform_func: callable = None
+    stream_sql_func: callable = None
+    fetch_size: int = None
+    transform_in_batches: bool = False
 
 
 def chunks(items: List[Any], size: int) -> List[Any]:
@@ -68,6 +73,75 @@ def execute_sql_statement(cmd: str, results: bool = False, verbose: bool = False
     return rows
 
 
+def stream_sql_statement(cmd: str, batch_size: int, verbose: bool = False) -> Generator[List[dict], None, None]:
+    """
+    Yield the results of a query in lists of up to `batch_size` dicts. Rows are read through a named (server-side)
+    cursor, so only the current batch is ever held in memory instead of the whole result set.
+    """
+    if verbose:
+        print(cmd)
+
+    connection = psycopg2.connect(dsn=get_database_dsn_string())
+    try:
+        # Named cursors only live inside of a transaction, so unlike execute_sql_statement this can't use autocommit
+        with connection, connection.cursor(name="stream_sql_statement") as cursor:
+            cursor.itersize = batch_size
+            cursor.execute(cmd)
+            rows = cursor.fetchmany(batch_size)
+            columns = [col[0] for col in cursor.description] if rows else []
+            while rows:
+                yield [dict(zip(columns, row)) for row in rows]
+                rows = cursor.fetchmany(batch_size)
+    finally:
+        connection.close()
+
+
+def iterate_in_background(items: Iterable, max_items_ahead: int) -> Generator[Any, None, None]:
+    """
+    Yield from `items` while a background thread keeps up to `max_items_ahead` of the following items ready, so that
+    producing the next item (e.g. a DB read) overlaps with whatever the caller does with the current one (e.g. an ES
+    write). Exceptions raised while producing items are re-raised to the caller.
+    """
+    end_of_items = object()
+    ready_items = queue.Queue(maxsize=max_items_ahead)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                ready_items.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((end_of_items, None))
+        except Exception as e:
+            put((None, e))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, exception = ready_items.get()
+            if exception is not None:
+                raise exception
+            if item is end_of_items:
+                return
+            yield item
+    finally:
+        # Also stops the producer when the caller quits early
+        stop.set()
+        producer.join()
+        if hasattr(items, "close"):
+            items.close()
+
+
 def db_rows_to_dict(cursor: psycopg2.extensions.cursor) -> List[dict]:
     """Return a dictionary of all row results from a database connection cursor"""
     columns = [col[0] for col in cursor.description]
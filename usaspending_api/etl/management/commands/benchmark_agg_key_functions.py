@@ -0,0 +1,53 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from time import perf_counter
+
+from usaspending_api.etl.elasticsearch_loader_helpers import aggregate_key_functions as funcs
+from usaspending_api.etl.tests.data.agg_key_records import TRANSACTION_AGG_KEY_CREATIONS, generate_records
+
+logger = logging.getLogger("script")
+
+
+class Command(BaseCommand):
+    help = (
+        "Micro-benchmark of building the Elasticsearch transaction agg keys with the plain agg key functions versus "
+        "the memoized ones from compile_agg_key_functions, on synthetic records. Also verifies the keys are identical."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--records", type=int, default=100000, help="Number of synthetic records per run")
+        parser.add_argument(
+            "--distinct-values",
+            type=int,
+            default=500,
+            help="Number of distinct agencies, locations, NAICS and PSC codes the records are drawn from",
+        )
+        parser.add_argument("--runs", type=int, default=3, help="Number of timed runs; the best run is reported")
+
+    def handle(self, *args, **options):
+        records = generate_records(options["records"], options["distinct_values"])
+
+        baseline = min(time_agg_keys(TRANSACTION_AGG_KEY_CREATIONS, records) for _ in range(options["runs"]))
+        compiled = min(
+            time_agg_keys(funcs.compile_agg_key_functions(TRANSACTION_AGG_KEY_CREATIONS, records[0]), records)
+            for _ in range(options["runs"])
+        )
+
+        compiled_functions = funcs.compile_agg_key_functions(TRANSACTION_AGG_KEY_CREATIONS, records[0])
+        for record in records:
+            for key, agg_key_function in TRANSACTION_AGG_KEY_CREATIONS.items():
+                if agg_key_function(record) != compiled_functions[key](record):
+                    raise RuntimeError(f"Compiled {key} differs for record {record}")
+
+        logger.info(f"Agg keys for {len(records):,} records, best of {options['runs']} runs:")
+        logger.info(f"    agg key functions:          {baseline:.3f}s")
+        logger.info(f"    compiled agg key functions: {compiled:.3f}s ({baseline / compiled:.1f}x)")
+
+
+def time_agg_keys(agg_key_creations: dict, records: list) -> float:
+    start = perf_counter()
+    for record in records:
+        for agg_key_function in agg_key_creations.values():
+            agg_key_function(record)
+    return perf_counter() - start
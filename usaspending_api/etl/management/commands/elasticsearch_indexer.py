@@ -13,12 +13,14 @@ from usaspending_api.etl.elasticsearch_loader_helpers import (
     Controller,
     execute_sql_statement,
     format_log,
+    stream_sql_statement,
     toggle_refresh_off,
     transform_award_data,
     transform_covid19_faba_data,
     transform_transaction_data,
     check_new_index_name_is_ok,
 )
+from usaspending_api.etl.elasticsearch_loader_helpers.extract_data import EXTRACT_BATCH_SIZE
 from usaspending_api.etl.elasticsearch_loader_helpers.index_config import (
     ES_AWARDS_UNIQUE_KEY_FIELD,
     ES_TRANSACTIONS_UNIQUE_KEY_FIELD,
@@ -101,6 +103,14 @@ class Command(BaseCommand):
             default=10000,
             metavar="(default: 10,000)",
         )
+        parser.add_argument(
+            "--fetch-size",
+            type=int,
+            help="Set the number of rows read from the DB per round trip. Partitions are streamed from the DB this "
+            "many rows at a time, so a worker's memory use is bounded by the fetch size rather than the partition size.",
+            default=EXTRACT_BATCH_SIZE,
+            metavar=f"(default: {EXTRACT_BATCH_SIZE:,})",
+        )
         parser.add_argument(
             "--drop-db-view",
             action="store_true",
@@ -160,6 +170,7 @@ def parse_cli_args(options: dict, es_client) -> dict:
         "partition_size",
         "process_deletes",
         "deletes_only",
+        "fetch_size",
         "processes",
         "skip_counts",
         "skip_delete_index",
@@ -226,6 +237,8 @@ def set_config(passthrough_values: list, arg_parse_options: dict) -> dict:
             "required_index_name": settings.ES_AWARDS_NAME_SUFFIX,
             "sql_view": settings.ES_AWARDS_ETL_VIEW_NAME,
             "stored_date_key": "es_awards",
+            "stream_sql_func": stream_sql_statement,
+            "transform_in_batches": True,
             "unique_key_field": ES_AWARDS_UNIQUE_KEY_FIELD,
             "write_alias": settings.ES_AWARDS_WRITE_ALIAS,
         }
@@ -247,6 +260,8 @@ def set_config(passthrough_values: list, arg_parse_options: dict) -> dict:
             "required_index_name": settings.ES_TRANSACTIONS_NAME_SUFFIX,
             "sql_view": settings.ES_TRANSACTIONS_ETL_VIEW_NAME,
             "stored_date_key": "es_transactions",
+            "stream_sql_func": stream_sql_statement,
+            "transform_in_batches": True,
             "unique_key_field": ES_TRANSACTIONS_UNIQUE_KEY_FIELD,
             "write_alias": settings.ES_TRANSACTIONS_WRITE_ALIAS,
         }
@@ -268,6 +283,9 @@ def set_config(passthrough_values: list, arg_parse_options: dict) -> dict:
             "required_index_name": settings.ES_COVID19_FABA_NAME_SUFFIX,
             "sql_view": settings.ES_COVID19_FABA_ETL_VIEW_NAME,
             "stored_date_key": ...,
+            "stream_sql_func": stream_sql_statement,
+            # Rows are combined into one document per award, so the whole partition is transformed at once
+            "transform_in_batches": False,
             "unique_key_field": ES_COVID19_FABA_UNIQUE_KEY_FIELD,
             "write_alias": settings.ES_COVID19_FABA_WRITE_ALIAS,
         }
@@ -3,10 +3,12 @@ import logging
 from datetime import timedelta
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connections, transaction
 from django.db.models import Max
 from django.utils.crypto import get_random_string
+from multiprocessing import Manager, Pool
 from usaspending_api.common.helpers.date_helper import now, datetime_command_line_argument_type
+from usaspending_api.common.helpers.sql_helpers import close_all_django_db_conns
 from usaspending_api.etl.submission_loader_helpers.final_of_fy import populate_final_of_fy
 from usaspending_api.etl.submission_loader_helpers.submission_ids import get_new_or_updated_submission_ids
 from usaspending_api.submissions import dabs_loader_queue_helpers as dlqh
@@ -38,6 +40,7 @@ class Command(BaseCommand):
     processor_id = None
     heartbeat_timer = None
     file_c_chunk_size = 100000
+    processes = 1
     do_not_retry = []
 
     def add_arguments(self, parser):
@@ -90,6 +93,18 @@ class Command(BaseCommand):
             ),
         )
 
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=self.processes,
+            help=(
+                "Number of worker processes claiming and loading submissions from the queue at the same "
+                "time, each with its own database connection and heartbeat.  Handy for catching up after "
+                "a DABS window closes.  final_of_fy is updated once, after all of them finish.  Default "
+                f"is {self.processes}."
+            ),
+        )
+
         parser.epilog = (
             "And to answer your next question, yes this can be run standalone.  The parallelization "
             "code is pretty minimal and should not add significant time to the overall run time of "
@@ -107,11 +122,14 @@ class Command(BaseCommand):
 
         if self.submission_ids:
             self.add_specific_submissions_to_queue()
-            processed_count = self.load_specific_submissions()
         else:
             since_datetime = self.start_datetime or self.calculate_load_submissions_since_datetime()
             self.add_submissions_since_datetime_to_queue(since_datetime)
-            processed_count = self.load_incremental_submissions()
+
+        if self.processes > 1:
+            processed_count = self.load_submissions_in_parallel()
+        else:
+            processed_count = self.load_submissions()
 
         ready, in_progress, abandoned, failed, unrecognized = dlqh.get_queue_status()
         failed_unrecognized_and_abandoned_count = len(failed) + len(unrecognized) + len(abandoned)
@@ -130,6 +148,7 @@ class Command(BaseCommand):
         self.start_datetime = options.get("start_datetime")
         self.report_queue_status_only = options.get("report_queue_status_only")
         self.file_c_chunk_size = options.get("file_c_chunk_size")
+        self.processes = options.get("processes") or 1
         self.processor_id = f"{now()}/{get_random_string(length=12)}"
 
         logger.info(f'processor_id = "{self.processor_id}"')
@@ -183,9 +202,38 @@ class Command(BaseCommand):
             f"added to the queue.  {count - added:,} already existed."
         )
 
+    def load_submissions(self):
+        if self.submission_ids:
+            return self.load_specific_submissions()
+        return self.load_incremental_submissions()
+
+    def load_submissions_in_parallel(self):
+        """
+        Each worker process drains the queue just like a standalone run would, under its own
+        processor_id so the queue shows which worker holds which submission.  The workers share
+        the list of submissions that failed so a failed submission isn't retried by every one of
+        them.  Returns the total count of submissions processed by all workers.
+        """
+        logger.info(f"Loading submissions in {self.processes:,} worker processes.")
+
+        # Forked processes would otherwise share this process's database connections
+        close_all_django_db_conns()
+        with Manager() as manager:
+            do_not_retry = manager.list(self.do_not_retry)
+            worker_args = [
+                (f"{self.processor_id}/{worker}", self.submission_ids, self.file_c_chunk_size, do_not_retry)
+                for worker in range(1, self.processes + 1)
+            ]
+            with Pool(self.processes) as pool:
+                processed_counts = pool.starmap(load_submissions_in_worker, worker_args)
+        return sum(processed_counts)
+
     def load_specific_submissions(self):
         processed_count = 0
         for submission_id in self.submission_ids:
+            if submission_id in self.do_not_retry:
+                logger.info(f"Submission {submission_id} already failed to load during this run.  Skipping.")
+                continue
             count = dlqh.start_processing(submission_id, self.processor_id)
             if count == 0:
                 logger.info(f"Submission {submission_id} has already been picked up by another processor.  Skipping.")
@@ -211,7 +259,9 @@ class Command(BaseCommand):
     def load_incremental_submissions(self):
         processed_count = 0
         while True:
-            submission_id, force_reload = dlqh.claim_next_available_submission(self.processor_id, self.do_not_retry)
+            submission_id, force_reload = dlqh.claim_next_available_submission(
+                self.processor_id, list(self.do_not_retry)
+            )
             if submission_id is None:
                 logger.info("No more available submissions in the queue.  Exiting.")
                 break
@@ -244,8 +294,9 @@ class Command(BaseCommand):
         except (Exception, SystemExit) as e:
             self.cancel_heartbeat_timer()
             logger.exception(f"Submission {submission_id} failed to load")
-            dlqh.fail_processing(submission_id, self.processor_id, e)
+            # Before the submission is released so no other worker can claim it in between
             self.do_not_retry.append(submission_id)
+            dlqh.fail_processing(submission_id, self.processor_id, e)
             self.report_queue_status()
             return False
         self.cancel_heartbeat_timer()
@@ -278,3 +329,21 @@ class Command(BaseCommand):
         logger.info("Updating final_of_fy")
         populate_final_of_fy()
         logger.info(f"Finished updating final_of_fy.")
+
+
+def load_submissions_in_worker(processor_id, submission_ids, file_c_chunk_size, do_not_retry):
+    """
+    Runs in a worker process of load_submissions_in_parallel.  Claims and loads submissions from
+    the queue until there are none left and returns the count of submissions processed.
+    do_not_retry is shared by all of the workers.
+    """
+    command = Command()
+    command.processor_id = processor_id
+    command.submission_ids = submission_ids
+    command.file_c_chunk_size = file_c_chunk_size
+    command.do_not_retry = do_not_retry
+    logger.info(f'processor_id = "{processor_id}"')
+    try:
+        return command.load_submissions()
+    finally:
+        connections.close_all()
@@ -6,7 +6,8 @@ import logging
 
 from decimal import Decimal
 from django.core.management.base import BaseCommand
-from django.db import connections
+from django.db import connections, models
+from django.utils import timezone
 from usaspending_api.common.long_to_terse import LONG_TO_TERSE_LABELS
 from usaspending_api.etl.broker_etl_helpers import PhonyCursor
 
@@ -133,6 +134,75 @@ def load_data_into_model(model_instance, data, **kwargs):
         return model_instance
 
 
+def get_model_row_loader(model, value_map_fields, data_fields, reverse=None):
+    """
+    Compiled form of load_data_into_model for streaming many rows with the same fields into a model's table: works out
+    once which value_map entry or data field, date parsing and sign reversal applies to each column instead of once per
+    row and field, and skips instantiating a model per row.
+
+    Returns the model's column names (less its auto-generated primary key) and a function of (data, value_map)
+    returning the row's values for those columns, as bulk_create would save them
+    """
+    columns = []
+    column_loaders = []
+    for field in model._meta.concrete_fields:
+        if isinstance(field, models.AutoField):
+            continue
+        columns.append(field.column)
+        column_loaders.append(_get_column_loader(field, value_map_fields, data_fields, reverse))
+
+    def load_row(data, value_map):
+        return [column_loader(data, value_map) for column_loader in column_loaders]
+
+    return columns, load_row
+
+
+def _get_column_loader(field, value_map_fields, data_fields, reverse):
+    if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+        return lambda data, value_map: timezone.now()
+
+    # Same precedence as load_data_into_model
+    broker_field = LONG_TO_TERSE_LABELS.get(field.name, field.name)
+    if broker_field in value_map_fields or field.name in value_map_fields:
+        source, key = "value_map", broker_field if broker_field in value_map_fields else field.name
+    elif broker_field in data_fields or field.name in data_fields:
+        source, key = "data", broker_field if broker_field in data_fields else field.name
+    elif field.name == "data_source":
+        source, key = None, "DBR"
+    else:
+        return lambda data, value_map: field.get_default()
+
+    parse_date = field.name.endswith("date")
+    reverse_sign = bool(reverse and reverse.search(field.name))
+
+    def load_column(data, value_map):
+        if source == "value_map":
+            value = value_map[key]
+        elif source == "data":
+            value = data[key]
+        else:
+            value = key
+
+        # Same as store_value
+        if parse_date and isinstance(value, str):
+            try:
+                value = dateutil.parser.parse(value).date()
+            except (TypeError, ValueError):
+                pass
+        if source == "value_map" and callable(value) and data:
+            value = value(data)
+        if reverse_sign:
+            try:
+                value = -1 * Decimal(value)
+            except TypeError:
+                pass
+        if isinstance(value, models.Model):
+            value = value.pk
+        return value
+
+    return load_column
+
+
 def store_value(model_instance_or_dict, field, value, reverse=None, data=None):
     # turn datetimes into dates
     if field.endswith("date") and isinstance(value, str):
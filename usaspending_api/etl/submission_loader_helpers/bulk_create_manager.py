@@ -1,14 +1,53 @@
+import io
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+from django.db import connection, connections, models
+from time import perf_counter
+
+from usaspending_api.etl.management.load_base import get_model_row_loader
+from usaspending_api.etl.transaction_loaders.data_load_helpers import format_value_for_copy
+
+
+logger = logging.getLogger("script")
+
+
 class BulkCreateManager:
-    """ Hide the ugliness of batching saves. """
+    """
+    Hide the ugliness of batching saves.
 
-    batch_size = 500  # This number tested well.
+    Batches are resized after every write so that each takes about target_batch_seconds and holds no more than
+    target_batch_bytes of rows. With use_copy, rows are written with COPY instead of bulk_create, which suits models
+    whose saved instances (e.g. their generated primary keys) aren't needed afterwards. With background, batches are
+    written on another thread while the caller keeps appending; since that thread has its own database connection,
+    batches are written on the caller's thread anyway when it is in a transaction.
+    """
 
-    def __init__(self, model):
+    initial_batch_size = 500  # This number tested well.
+    min_batch_size = 100
+    max_batch_size = 50000
+    target_batch_seconds = 1.0
+    target_batch_bytes = 16 * 1024 * 1024
+
+    def __init__(self, model, use_copy=False, background=False):
         self.model = model
+        self.use_copy = use_copy
+        self.background = background
+        self.batch_size = self.initial_batch_size
         self.instances = []
         self.count = 0
 
+        self.rows_written = 0
+        self.batches_written = 0
+        self.seconds_writing = 0.0
+
+        self._copy_fields = None
+        self._writer = None
+        self._pending_write = None
+
     def append(self, instance):
+        if self.use_copy:
+            instance = self._get_copy_values(instance)
         self.instances.append(instance)
         self.count += 1
         if self.count >= self.batch_size:
@@ -16,9 +55,109 @@ class BulkCreateManager:
 
     def save_stragglers(self):
         self._bulk_create()
+        if self._writer is not None:
+            self._wait_for_pending_write()
+            self._writer.submit(connections.close_all).result()
+            self._writer.shutdown()
+            self._writer = None
+
+        if self.rows_written:
+            logger.info(
+                f"{self.model.__name__}: wrote {self.rows_written:,} rows in {self.batches_written:,} batches and "
+                f"{self.seconds_writing:.2f}s ({self.rows_written / max(self.seconds_writing, 1e-6):,.0f} rows/s)"
+            )
 
     def _bulk_create(self):
         if self.count > 0:
-            self.model.objects.bulk_create(self.instances, self.count)
+            batch = self.instances
             self.instances = []
             self.count = 0
+
+            if self._writer is None and self.background and not connection.in_atomic_block:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bulk-create")
+            if self._writer is None:
+                self._write(batch)
+            else:
+                # At most one batch is written while the next one fills, to bound memory
+                self._wait_for_pending_write()
+                self._pending_write = self._writer.submit(self._write, batch)
+
+    def _wait_for_pending_write(self):
+        if self._pending_write is not None:
+            self._pending_write.result()
+            self._pending_write = None
+
+    def _write(self, batch):
+        start = perf_counter()
+        if self.use_copy:
+            batch_bytes = self._copy(batch)
+        else:
+            self.model.objects.bulk_create(batch, len(batch))
+            batch_bytes = len(batch) * sum(len(str(value)) for value in vars(batch[0]).values())
+        seconds = perf_counter() - start
+
+        self.rows_written += len(batch)
+        self.batches_written += 1
+        self.seconds_writing += seconds
+        self._resize(len(batch), batch_bytes, seconds)
+
+    def _resize(self, rows, batch_bytes, seconds):
+        """Move the batch size halfway towards the size that would hit both targets at the last batch's rates"""
+        target_rows = min(
+            self.target_batch_seconds * rows / max(seconds, 1e-6),
+            self.target_batch_bytes * rows / max(batch_bytes, 1),
+        )
+        batch_size = (self.batch_size + target_rows) / 2
+        self.batch_size = int(max(self.min_batch_size, min(self.max_batch_size, batch_size)))
+
+    def _get_copy_fields(self):
+        if self._copy_fields is None:
+            self._copy_fields = [
+                field for field in self.model._meta.concrete_fields if not isinstance(field, models.AutoField)
+            ]
+        return self._copy_fields
+
+    def _get_copy_values(self, instance):
+        return [field.get_prep_value(field.pre_save(instance, True)) for field in self._get_copy_fields()]
+
+    def _get_copy_columns(self):
+        return [field.column for field in self._get_copy_fields()]
+
+    def _copy(self, batch):
+        buffer = io.StringIO()
+        for values in batch:
+            buffer.write("\t".join([format_value_for_copy(value) for value in values]))
+            buffer.write("\n")
+        batch_bytes = buffer.tell()
+        buffer.seek(0)
+
+        columns = ", ".join(f'"{column}"' for column in self._get_copy_columns())
+        with connection.cursor() as cursor:
+            cursor.cursor.copy_expert(f"COPY {self.model._meta.db_table} ({columns}) FROM STDIN", buffer)
+        return batch_bytes
+
+
+class BulkCopyManager(BulkCreateManager):
+    """
+    Stream rows into a model's table with COPY, loading each row like load_data_into_model would without
+    instantiating a model per row. Suits models whose rows aren't needed back after saving.
+    """
+
+    initial_batch_size = 10000
+
+    def __init__(self, model, reverse=None, background=False):
+        super().__init__(model, use_copy=True, background=background)
+        self.reverse = reverse
+        self.columns = None
+        self.load_row = None
+
+    def append(self, data, value_map):
+        if self.load_row is None:
+            self.columns, self.load_row = get_model_row_loader(self.model, value_map, data, self.reverse)
+        self.instances.append(self.load_row(data, value_map))
+        self.count += 1
+        if self.count >= self.batch_size:
+            self._bulk_create()
+
+    def _get_copy_columns(self):
+        return self.columns
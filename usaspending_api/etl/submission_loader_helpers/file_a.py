@@ -30,7 +30,7 @@ def load_file_a(submission_attributes, appropriation_data, db_cursor):
     bulk_treasury_appropriation_account_tas_lookup(appropriation_data, db_cursor)
 
     # Create account objects
-    save_manager = BulkCreateManager(AppropriationAccountBalances)
+    save_manager = BulkCreateManager(AppropriationAccountBalances, use_copy=True)
     for row in appropriation_data:
 
         # Check and see if there is an entry for this TAS
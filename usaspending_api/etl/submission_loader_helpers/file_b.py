@@ -5,8 +5,7 @@ from collections import defaultdict
 
 from usaspending_api.accounts.models import AppropriationAccountBalances
 from usaspending_api.etl.broker_etl_helpers import dictfetchall
-from usaspending_api.etl.management.load_base import load_data_into_model
-from usaspending_api.etl.submission_loader_helpers.bulk_create_manager import BulkCreateManager
+from usaspending_api.etl.submission_loader_helpers.bulk_create_manager import BulkCopyManager
 from usaspending_api.etl.submission_loader_helpers.disaster_emergency_fund_codes import get_disaster_emergency_fund
 from usaspending_api.etl.submission_loader_helpers.object_class import get_object_class
 from usaspending_api.etl.submission_loader_helpers.program_activities import get_program_activity
@@ -151,7 +150,9 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
     skipped_tas = defaultdict(int)  # tracks count of rows skipped due to "missing" TAS
     bulk_treasury_appropriation_account_tas_lookup(prg_act_obj_cls_data, db_cursor)
 
-    save_manager = BulkCreateManager(FinancialAccountsByProgramActivityObjectClass)
+    account_balances_ids = _get_account_balances_ids(submission_attributes.submission_id)
+
+    save_manager = BulkCopyManager(FinancialAccountsByProgramActivityObjectClass, reverse=reverse)
     for row in prg_act_obj_cls_data:
         # Check and see if there is an entry for this TAS
         treasury_account, tas_rendering_label = get_treasury_appropriation_account_tas_lookup(row.get("account_num"))
@@ -160,26 +161,25 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
             continue
 
         # get the corresponding account balances row (aka "File A" record)
-        account_balances = AppropriationAccountBalances.objects.get(
-            treasury_account_identifier=treasury_account, submission_id=submission_attributes.submission_id
-        )
-
-        financial_by_prg_act_obj_cls = FinancialAccountsByProgramActivityObjectClass()
+        account_balances = account_balances_ids.get(treasury_account.treasury_account_identifier, [])
+        if len(account_balances) != 1:
+            exception = AppropriationAccountBalances.MultipleObjectsReturned
+            if not account_balances:
+                exception = AppropriationAccountBalances.DoesNotExist
+            raise exception(f"Found {len(account_balances)} File A records for TAS {tas_rendering_label}")
 
         value_map = {
             "submission": submission_attributes,
             "reporting_period_start": submission_attributes.reporting_period_start,
             "reporting_period_end": submission_attributes.reporting_period_end,
             "treasury_account": treasury_account,
-            "appropriation_account_balances": account_balances,
+            "appropriation_account_balances": account_balances[0],
             "object_class": get_object_class(row["object_class"], row["by_direct_reimbursable_fun"]),
             "program_activity": get_program_activity(row, submission_attributes),
             "disaster_emergency_fund": get_disaster_emergency_fund(row),
         }
 
-        save_manager.append(
-            load_data_into_model(financial_by_prg_act_obj_cls, row, value_map=value_map, save=False, reverse=reverse)
-        )
+        save_manager.append(row, value_map)
 
     save_manager.save_stragglers()
 
@@ -192,3 +192,14 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
         logger.info(f"SKIPPED {total_tas_skipped:,} ROWS of File B (missing TAS)")
     else:
         logger.info("All File B records in Broker loaded into USAspending")
+
+
+def _get_account_balances_ids(submission_id):
+    """ Look up the File A records of a submission by treasury account in one query rather than one per File B row. """
+    account_balances_ids = defaultdict(list)
+    account_balances = AppropriationAccountBalances.objects.filter(submission_id=submission_id).values_list(
+        "treasury_account_identifier_id", "appropriation_account_balances_id"
+    )
+    for treasury_account_identifier, appropriation_account_balances_id in account_balances:
+        account_balances_ids[treasury_account_identifier].append(appropriation_account_balances_id)
+    return account_balances_ids
@@ -12,8 +12,7 @@ from usaspending_api.awards.models import FinancialAccountsByAwards
 from usaspending_api.common.helpers.dict_helpers import upper_case_dict_values
 from usaspending_api.common.helpers.etl_helpers import update_c_to_d_linkages
 from usaspending_api.etl.broker_etl_helpers import dictfetchall
-from usaspending_api.etl.management.load_base import load_data_into_model
-from usaspending_api.etl.submission_loader_helpers.bulk_create_manager import BulkCreateManager
+from usaspending_api.etl.submission_loader_helpers.bulk_create_manager import BulkCopyManager
 from usaspending_api.etl.submission_loader_helpers.disaster_emergency_fund_codes import get_disaster_emergency_fund
 from usaspending_api.etl.submission_loader_helpers.object_class import get_object_class_row
 from usaspending_api.etl.submission_loader_helpers.program_activities import get_program_activity
@@ -151,7 +150,7 @@ def load_file_c(submission_attributes, db_cursor, published_award_financial):
 
 
 def _save_file_c_rows(published_award_financial, total_rows, start_time, skipped_tas, submission_attributes, reverse):
-    save_manager = BulkCreateManager(FinancialAccountsByAwards)
+    save_manager = BulkCopyManager(FinancialAccountsByAwards, reverse=reverse)
     for index, row in enumerate(published_award_financial, 1):
         if not (index % 1000):
             logger.info(f"C File Load: Loading row {index:,} of {total_rows:,} ({datetime.now() - start_time})")
@@ -164,8 +163,6 @@ def _save_file_c_rows(published_award_financial, total_rows, start_time, skipped
             skipped_tas[tas_rendering_label] += 1
             continue
 
-        award_financial_data = FinancialAccountsByAwards()
-
         value_map_faba = {
             "submission": submission_attributes,
             "reporting_period_start": submission_attributes.reporting_period_start,
@@ -177,9 +174,7 @@ def _save_file_c_rows(published_award_financial, total_rows, start_time, skipped
             "distinct_award_key": create_distinct_award_key(row),
         }
 
-        save_manager.append(
-            load_data_into_model(award_financial_data, row, value_map=value_map_faba, save=False, reverse=reverse)
-        )
+        save_manager.append(row, value_map_faba)
 
     save_manager.save_stragglers()
 
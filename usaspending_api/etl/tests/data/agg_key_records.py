@@ -0,0 +1,65 @@
+from random import Random
+
+from usaspending_api.etl.elasticsearch_loader_helpers import aggregate_key_functions as funcs
+
+# The agg keys built for every transaction document (see transform_transaction_data)
+TRANSACTION_AGG_KEY_CREATIONS = {
+    "awarding_subtier_agency_agg_key": funcs.awarding_subtier_agency_agg_key,
+    "awarding_toptier_agency_agg_key": funcs.awarding_toptier_agency_agg_key,
+    "funding_subtier_agency_agg_key": funcs.funding_subtier_agency_agg_key,
+    "funding_toptier_agency_agg_key": funcs.funding_toptier_agency_agg_key,
+    "naics_agg_key": funcs.naics_agg_key,
+    "pop_congressional_agg_key": funcs.pop_congressional_agg_key,
+    "pop_country_agg_key": funcs.pop_country_agg_key,
+    "pop_county_agg_key": funcs.pop_county_agg_key,
+    "pop_state_agg_key": funcs.pop_state_agg_key,
+    "psc_agg_key": funcs.psc_agg_key,
+    "recipient_agg_key": funcs.transaction_recipient_agg_key,
+    "recipient_location_congressional_agg_key": funcs.recipient_location_congressional_agg_key,
+    "recipient_location_county_agg_key": funcs.recipient_location_county_agg_key,
+    "recipient_location_state_agg_key": funcs.recipient_location_state_agg_key,
+}
+
+
+def generate_records(record_count: int, distinct_values: int) -> list:
+    """Synthetic transaction records with the fields the agg key functions read, drawn from distinct_values values"""
+    random = Random(0)
+    records = []
+    for i in range(record_count):
+        record = {
+            "recipient_hash": f"{random.randrange(record_count):032x}",
+            "recipient_levels": ["C", "R"],
+            "recipient_name": f"RECIPIENT {i}",
+            "recipient_unique_id": f"{i:09}",
+            "recipient_uei": f"UEI{i:09}",
+            "naics_code": str(random.randrange(distinct_values)),
+            "naics_description": "NAICS DESCRIPTION",
+            "product_or_service_code": str(random.randrange(distinct_values)),
+            "product_or_service_description": "PSC DESCRIPTION",
+        }
+        for agency_type in ("awarding", "funding"):
+            agency = random.randrange(distinct_values)
+            record[f"{agency_type}_toptier_agency_id"] = agency
+            for agency_tier in ("toptier", "subtier"):
+                record[f"{agency_type}_{agency_tier}_agency_name"] = f"Agency {agency} ({agency_tier})"
+                record[f"{agency_type}_{agency_tier}_agency_abbreviation"] = f"A{agency}"
+                record[f"{agency_type}_{agency_tier}_agency_code"] = f"{agency:03}"
+        for location_type in ("pop", "recipient_location"):
+            location = random.randrange(distinct_values)
+            record.update(
+                {
+                    f"{location_type}_country_code": "USA",
+                    f"{location_type}_country_name": "UNITED STATES",
+                    f"{location_type}_state_code": f"S{location % 56}",
+                    f"{location_type}_state_fips": f"{location % 56:02}",
+                    f"{location_type}_state_name": f"State {location % 56}",
+                    f"{location_type}_state_population": 1000000 + location % 56,
+                    f"{location_type}_county_code": f"{location:03}",
+                    f"{location_type}_county_name": f"County {location}",
+                    f"{location_type}_county_population": 10000 + location,
+                    f"{location_type}_congressional_code": f"{location % 53:02}",
+                    f"{location_type}_congressional_population": 700000 + location % 53,
+                }
+            )
+        records.append(record)
+    return records
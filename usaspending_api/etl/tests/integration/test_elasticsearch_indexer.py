@@ -17,6 +17,7 @@ from usaspending_api.etl.management.commands.elasticsearch_indexer import (
     parse_cli_args,
 )
 from usaspending_api.etl.elasticsearch_loader_helpers import (
+    chunks,
     Controller,
     delete_awards,
     delete_transactions,
@@ -127,6 +128,11 @@ def mock_execute_sql(sql, results, verbosity=None):
     return execute_sql_to_ordered_dictionary(sql)
 
 
+def mock_stream_sql(sql, batch_size, verbosity=None):
+    """Same reason as `mock_execute_sql`, for the `stream_sql_statement` used by the pipelined ETL"""
+    yield from chunks(execute_sql_to_ordered_dictionary(sql), batch_size)
+
+
 def test_create_and_load_new_award_index(award_data_fixture, elasticsearch_award_index, monkeypatch):
     """Test the ``elasticsearch_loader`` django management command to create a new awards index and load it
     with data from the DB
@@ -146,8 +152,9 @@ def test_create_and_load_new_award_index(award_data_fixture, elasticsearch_award
     monkeypatch.setattr(
         "usaspending_api.etl.elasticsearch_loader_helpers.extract_data.execute_sql_statement", mock_execute_sql
     )
-    # Also override SQL function listed in config object with the mock one
+    # Also override SQL functions listed in config object with the mock ones
     es_etl_config["execute_sql_func"] = mock_execute_sql
+    es_etl_config["stream_sql_func"] = mock_stream_sql
     loader = Controller(es_etl_config)
     assert loader.__class__.__name__ == "Controller"
     loader.prepare_for_etl()
@@ -179,8 +186,9 @@ def test_create_and_load_new_transaction_index(award_data_fixture, elasticsearch
     monkeypatch.setattr(
         "usaspending_api.etl.elasticsearch_loader_helpers.extract_data.execute_sql_statement", mock_execute_sql
     )
-    # Also override SQL function listed in config object with the mock one
+    # Also override SQL functions listed in config object with the mock ones
     es_etl_config["execute_sql_func"] = mock_execute_sql
+    es_etl_config["stream_sql_func"] = mock_stream_sql
     loader = Controller(es_etl_config)
     assert loader.__class__.__name__ == "Controller"
     loader.prepare_for_etl()
@@ -219,8 +227,9 @@ def test_incremental_load_into_award_index(award_data_fixture, elasticsearch_awa
     monkeypatch.setattr(
         "usaspending_api.etl.elasticsearch_loader_helpers.extract_data.execute_sql_statement", mock_execute_sql
     )
-    # Also override SQL function listed in config object with the mock one
+    # Also override SQL functions listed in config object with the mock ones
     es_etl_config["execute_sql_func"] = mock_execute_sql
+    es_etl_config["stream_sql_func"] = mock_stream_sql
     ensure_view_exists(es_etl_config["sql_view"], force=True)
     loader = Controller(es_etl_config)
     assert loader.__class__.__name__ == "Controller"
@@ -262,8 +271,9 @@ def test_incremental_load_into_transaction_index(award_data_fixture, elasticsear
     monkeypatch.setattr(
         "usaspending_api.etl.elasticsearch_loader_helpers.extract_data.execute_sql_statement", mock_execute_sql
     )
-    # Also override SQL function listed in config object with the mock one
+    # Also override SQL functions listed in config object with the mock ones
     es_etl_config["execute_sql_func"] = mock_execute_sql
+    es_etl_config["stream_sql_func"] = mock_stream_sql
     ensure_view_exists(es_etl_config["sql_view"], force=True)
     loader = Controller(es_etl_config)
     assert loader.__class__.__name__ == "Controller"
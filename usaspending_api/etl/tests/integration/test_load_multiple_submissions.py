@@ -6,12 +6,15 @@ from django.core.management import call_command, CommandError
 from django.db import connections, DEFAULT_DB_ALIAS
 from django.test import TransactionTestCase
 from model_bakery import baker
+from multiprocessing import Manager
+from unittest.mock import patch
 from usaspending_api.accounts.models import AppropriationAccountBalances
 from usaspending_api.awards.models import FinancialAccountsByAwards
 from usaspending_api.common.helpers.sql_helpers import ordered_dictionary_fetcher
+from usaspending_api.etl.management.commands import load_multiple_submissions
 from usaspending_api.etl.submission_loader_helpers.object_class import reset_object_class_cache
 from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
-from usaspending_api.submissions.models import SubmissionAttributes
+from usaspending_api.submissions.models import DABSLoaderQueue, SubmissionAttributes
 
 
 @pytest.mark.usefixtures("broker_db_setup", "broker_server_dblink_setup")
@@ -484,3 +487,35 @@ class TestWithMultipleDatabases(TransactionTestCase):
         assert SubmissionAttributes.objects.get(submission_id=3).create_date == create_date_sub_3
 
         # Ok.  That's probably good enough for now.  Thanks for bearing with me.
+
+    def test_load_in_parallel(self):
+        """
+        Worker processes share the queue.  Every submission should be loaded exactly once, a
+        submission that fails shouldn't be retried by the other workers, and the queue should be
+        empty once they have all finished.
+        """
+        with Manager() as manager:
+            failed_loads = manager.list()
+
+            def fail_submission_2(command_name, submission_id, *args):
+                if submission_id == 2:
+                    failed_loads.append(submission_id)
+                    raise RuntimeError("Submission 2 is broken")
+                call_command(command_name, submission_id, *args)
+
+            # Patched before the worker processes are forked so they inherit it
+            with patch.object(load_multiple_submissions, "call_command", side_effect=fail_submission_2):
+                with self.assertRaises(SystemExit):
+                    call_command("load_multiple_submissions", "--incremental", "--processes", 3)
+            assert list(failed_loads) == [2]
+
+        assert sorted(SubmissionAttributes.objects.values_list("submission_id", flat=True)) == [1, 3, 4, 5]
+        assert list(DABSLoaderQueue.objects.values_list("submission_id", "state")) == [(2, DABSLoaderQueue.FAILED)]
+
+        # The next run retries it.
+        call_command("load_multiple_submissions", "--incremental", "--processes", 3)
+        assert SubmissionAttributes.objects.count() == 5
+        assert AppropriationAccountBalances.objects.count() == 5
+        assert FinancialAccountsByProgramActivityObjectClass.objects.count() == 7
+        assert FinancialAccountsByAwards.objects.count() == 12
+        assert DABSLoaderQueue.objects.count() == 0
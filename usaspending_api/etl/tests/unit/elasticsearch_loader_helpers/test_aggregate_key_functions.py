@@ -0,0 +1,34 @@
+from usaspending_api.etl.elasticsearch_loader_helpers import aggregate_key_functions as funcs
+from usaspending_api.etl.tests.data.agg_key_records import TRANSACTION_AGG_KEY_CREATIONS, generate_records
+
+
+def test_compiled_agg_key_functions_match():
+    records = generate_records(200, 5)
+    records[0]["awarding_subtier_agency_name"] = None
+    records[1]["pop_state_code"] = None
+    records[2]["naics_code"] = None
+    records[3]["pop_county_name"] = "Doña Ana"
+    records[4]["recipient_hash"] = None
+
+    compiled = funcs.compile_agg_key_functions(TRANSACTION_AGG_KEY_CREATIONS, records[0])
+    for record in records:
+        for key, agg_key_function in TRANSACTION_AGG_KEY_CREATIONS.items():
+            assert compiled[key](record) == agg_key_function(record)
+
+
+def test_compiled_agg_key_functions_respect_available_fields():
+    record = generate_records(1, 1)[0]
+    del record["funding_toptier_agency_abbreviation"]
+    del record["funding_toptier_agency_code"]
+    agg_key_creations = {"funding_toptier_agency_agg_key": funcs.funding_toptier_agency_agg_key}
+
+    compiled = funcs.compile_agg_key_functions(agg_key_creations, record)
+    assert compiled["funding_toptier_agency_agg_key"](record) == funcs.funding_toptier_agency_agg_key(record)
+    assert "abbreviation" not in compiled["funding_toptier_agency_agg_key"](record)
+
+
+def test_recipient_agg_key_functions_are_not_cached():
+    record = generate_records(1, 1)[0]
+    agg_key_creations = {"recipient_agg_key": funcs.transaction_recipient_agg_key}
+    compiled = funcs.compile_agg_key_functions(agg_key_creations, record)
+    assert compiled["recipient_agg_key"] is funcs.transaction_recipient_agg_key
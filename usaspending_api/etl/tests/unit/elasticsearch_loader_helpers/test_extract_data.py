@@ -0,0 +1,45 @@
+from types import GeneratorType
+
+from usaspending_api.etl.elasticsearch_loader_helpers import TaskSpec, chunks, extract_records
+from usaspending_api.etl.elasticsearch_loader_helpers.extract_data import EXTRACT_BATCH_SIZE
+
+
+RECORDS = [{"award_id": i} for i in range(10)]
+
+
+def _task(**kwargs) -> TaskSpec:
+    return TaskSpec(
+        name="test worker",
+        index="test-index",
+        sql="SELECT * FROM test_view",
+        view="test_view",
+        base_table="awards",
+        base_table_id="id",
+        field_for_es_id="award_id",
+        primary_key="award_id",
+        partition_number=0,
+        is_incremental=False,
+        **kwargs,
+    )
+
+
+def test_extract_records_streams_with_fetch_size():
+    fetch_sizes = []
+
+    def stream_sql(sql, batch_size):
+        fetch_sizes.append(batch_size)
+        yield from chunks(RECORDS, batch_size)
+
+    records = extract_records(_task(stream_sql_func=stream_sql, fetch_size=3))
+    assert isinstance(records, GeneratorType)
+    assert fetch_sizes == []  # nothing is read until the records are consumed
+    assert list(records) == RECORDS
+    assert fetch_sizes == [3]
+
+    assert list(extract_records(_task(stream_sql_func=stream_sql))) == RECORDS
+    assert fetch_sizes == [3, EXTRACT_BATCH_SIZE]
+
+
+def test_extract_records_without_streaming():
+    records = extract_records(_task(execute_sql_func=lambda sql, results: list(RECORDS)))
+    assert records == RECORDS
@@ -1,4 +1,6 @@
-from usaspending_api.etl.elasticsearch_loader_helpers.utilities import is_snapshot_running
+import pytest
+
+from usaspending_api.etl.elasticsearch_loader_helpers.utilities import is_snapshot_running, iterate_in_background
 
 
 def test_is_snapshot_running(monkeypatch):
@@ -34,3 +36,34 @@ def test_is_snapshot_running(monkeypatch):
     index_names = ["2021-02-12-transactions", "2021-02-12-awards"]
     result = is_snapshot_running(mock_client, index_names)
     assert result
+
+
+def test_iterate_in_background():
+    assert list(iterate_in_background(range(10), 2)) == list(range(10))
+    assert list(iterate_in_background([], 2)) == []
+
+
+def test_iterate_in_background_reraises_producer_errors():
+    def failing_items():
+        yield 1
+        raise ValueError("Failed to produce")
+
+    items = iterate_in_background(failing_items(), 2)
+    assert next(items) == 1
+    with pytest.raises(ValueError, match="Failed to produce"):
+        next(items)
+
+
+def test_iterate_in_background_stops_producer_when_caller_quits():
+    produced = []
+
+    def items():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    background_items = iterate_in_background(items(), 2)
+    assert next(background_items) == 0
+    background_items.close()
+    # Only the first item and the ones queued (or waiting to be queued) ahead of it were produced
+    assert len(produced) <= 4
@@ -0,0 +1,59 @@
+from threading import current_thread, main_thread
+from unittest.mock import patch
+
+from usaspending_api.accounts.models import AppropriationAccountBalances, TreasuryAppropriationAccount
+from usaspending_api.etl.submission_loader_helpers.bulk_create_manager import BulkCreateManager
+from usaspending_api.submissions.models import SubmissionAttributes
+
+
+def test_batch_size_adapts_to_write_time_and_row_width():
+    manager = BulkCreateManager(AppropriationAccountBalances)
+
+    # Writing 500 narrow rows took a quarter of the target time, so batches grow halfway towards 2,000 rows
+    manager._resize(500, 500 * 100, manager.target_batch_seconds / 4)
+    assert manager.batch_size == 1250
+
+    # Rows so wide that 1,250 of them are past the byte target shrink the batches
+    manager._resize(1250, manager.target_batch_bytes * 4, manager.target_batch_seconds / 4)
+    assert manager.batch_size == (1250 + 1250 // 4) // 2
+
+    # Slow batches keep shrinking down to the minimum
+    for _ in range(10):
+        manager._resize(manager.batch_size, manager.target_batch_bytes, manager.target_batch_seconds * 10)
+    assert manager.batch_size == manager.min_batch_size
+
+
+def test_copy_values_are_saved_like_bulk_create():
+    manager = BulkCreateManager(AppropriationAccountBalances, use_copy=True)
+    instance = AppropriationAccountBalances(
+        treasury_account_identifier=TreasuryAppropriationAccount(treasury_account_identifier=7),
+        submission=SubmissionAttributes(submission_id=5),
+        gross_outlay_amount_by_tas_cpe=-10.5,
+    )
+
+    values = dict(zip(manager._get_copy_columns(), manager._get_copy_values(instance)))
+    assert "appropriation_account_balances_id" not in values
+    assert values["treasury_account_identifier"] == 7
+    assert values["submission_id"] == 5
+    assert str(values["gross_outlay_amount_by_tas_cpe"]) == "-10.5"
+    assert values["final_of_fy"] is False
+    assert values["create_date"] is not None and values["update_date"] is not None
+
+
+def test_background_writes_happen_off_the_appending_thread():
+    written_on = []
+    manager = BulkCreateManager(AppropriationAccountBalances, background=True)
+    manager.batch_size = 2
+
+    with patch.object(manager, "_resize"), patch.object(
+        AppropriationAccountBalances.objects,
+        "bulk_create",
+        side_effect=lambda batch, size: written_on.append(current_thread()),
+    ):
+        for _ in range(5):
+            manager.append(AppropriationAccountBalances())
+        manager.save_stragglers()
+
+    assert manager.rows_written == 5
+    assert manager.batches_written == 3
+    assert len(written_on) == 3 and main_thread() not in written_on
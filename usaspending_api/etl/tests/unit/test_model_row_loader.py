@@ -0,0 +1,46 @@
+import re
+
+from datetime import date
+from decimal import Decimal
+
+from usaspending_api.accounts.models import TreasuryAppropriationAccount
+from usaspending_api.awards.models import FinancialAccountsByAwards
+from usaspending_api.etl.management.load_base import get_model_row_loader, load_data_into_model
+from usaspending_api.submissions.models import SubmissionAttributes
+
+
+def test_model_row_loader_matches_load_data_into_model():
+    reverse = re.compile(r"(_(cpe|fyb)$)|^transaction_obligated_amount$")
+    data = {
+        "piid": "PIID",
+        "transaction_obligated_amou": 10.5,
+        "gross_outlay_amount_by_awa_cpe": None,
+        "ussgl487200_downward_adjus_cpe": "-2.25",
+        "reporting_period_end": "2020-03-31 00:00:00",
+        "unmapped_broker_column": "ignored",
+    }
+    value_map = {
+        "submission": SubmissionAttributes(submission_id=5),
+        "reporting_period_start": date(2020, 1, 1),
+        "treasury_account": TreasuryAppropriationAccount(treasury_account_identifier=7),
+        "object_class": None,
+        "distinct_award_key": lambda row: f"{row['piid']}|||",
+    }
+
+    columns, load_row = get_model_row_loader(FinancialAccountsByAwards, value_map, data, reverse)
+    row = dict(zip(columns, load_row(data, value_map)))
+    instance = load_data_into_model(FinancialAccountsByAwards(), data, value_map=value_map, reverse=reverse)
+
+    assert "financial_accounts_by_awards_id" not in columns
+    assert row["submission_id"] == instance.submission_id == 5
+    assert row["treasury_account_id"] == instance.treasury_account_id == 7
+    assert row["object_class_id"] is instance.object_class_id is None
+    assert row["distinct_award_key"] == instance.distinct_award_key == "PIID|||"
+    assert row["piid"] == instance.piid == "PIID"
+    assert row["transaction_obligated_amount"] == instance.transaction_obligated_amount == Decimal("-10.5")
+    assert row["gross_outlay_amount_by_award_cpe"] is instance.gross_outlay_amount_by_award_cpe is None
+    assert row["ussgl487200_down_adj_pri_ppaid_undel_orders_oblig_refund_cpe"] == Decimal("2.25")
+    assert row["reporting_period_start"] == instance.reporting_period_start == date(2020, 1, 1)
+    assert row["reporting_period_end"] == instance.reporting_period_end == "2020-03-31 00:00:00"
+    assert row["data_source"] == instance.data_source == "DBR"
+    assert row["create_date"] is not None and row["update_date"] is not None
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 import os
 import re
 import boto3
@@ -39,6 +39,25 @@ def format_value_for_sql(val, cur):
     return str(cur.mogrify("%s", (val,)), "utf-8")
 
 
+def format_value_for_copy(val):
+    """formats a value as a column of a COPY ... FROM STDIN in text format"""
+    if val is None:
+        return r"\N"
+    if isinstance(val, bool):
+        return "t" if val else "f"
+    if isinstance(val, (date, datetime)):
+        val = val.isoformat()
+    elif isinstance(val, (list, tuple)):
+        val = "{{{}}}".format(",".join(_format_array_element(element) for element in val))
+    return str(val).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _format_array_element(val):
+    if val is None:
+        return "NULL"
+    return '"{}"'.format(str(val).replace("\\", "\\\\").replace('"', '\\"'))
+
+
 def format_bulk_insert_list_column_sql(cursor, load_objects, type):
     """creates formatted sql text to put into a bulk insert statement"""
     keys = load_objects[0][type].keys()
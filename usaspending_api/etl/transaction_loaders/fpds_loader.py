@@ -1,7 +1,9 @@
+import io
 import logging
+import zlib
 from psycopg2.extras import DictCursor
 from psycopg2 import Error
-from django.db import connection
+from django.db import connection, connections, transaction
 
 from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_nonboolean_columns,
@@ -13,7 +15,11 @@ from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_functions,
     all_broker_columns,
 )
-from usaspending_api.etl.transaction_loaders.data_load_helpers import capitalize_if_string, false_if_null
+from usaspending_api.etl.transaction_loaders.data_load_helpers import (
+    capitalize_if_string,
+    false_if_null,
+    format_value_for_copy,
+)
 from usaspending_api.etl.transaction_loaders.generic_loaders import (
     update_transaction_fpds,
     update_transaction_normalized,
@@ -82,11 +88,13 @@ def delete_stale_fpds(detached_award_procurement_ids):
         return awards_touched
 
 
-def load_fpds_transactions(chunk):
+def load_fpds_transactions(chunk, bulk_upsert=False):
     """
     Run transaction load for the provided ids. This will create any new rows in other tables to support the transaction
     data, but does NOT update "secondary" award values like total obligations or C -> D linkages.
 
+    bulk_upsert loads the whole chunk with a handful of set-based statements instead of one transaction at a time
+
     returns ids for each award touched
     """
     with Timer() as timer:
@@ -96,11 +104,47 @@ def load_fpds_transactions(chunk):
             if broker_transactions:
                 load_objects = _transform_objects(broker_transactions)
 
-                retval = _load_transactions(load_objects)
+                if bulk_upsert:
+                    retval = _bulk_upsert_transactions(load_objects)
+                else:
+                    retval = _load_transactions(load_objects)
     logger.info("batch completed in {}".format(timer.as_string(timer.elapsed)))
     return retval
 
 
+def load_fpds_transactions_in_worker(chunk, bulk_upsert=False):
+    """
+    Run load_fpds_transactions in a worker process. Since the worker's failed_ids aren't shared with the parent
+    process, returns the ids that failed in this chunk along with the ids for each award touched
+    """
+    failed_id_count = len(failed_ids)
+    try:
+        return load_fpds_transactions(chunk, bulk_upsert), failed_ids[failed_id_count:]
+    finally:
+        connections.close_all()
+
+
+def partition_by_award(id_list, partition_count):
+    """
+    Split the ids into (at most) partition_count lists by a hash of their unique_award_key, so that every transaction
+    of an award is in the same partition and partitions loaded at the same time never create the same award
+    """
+    connection.ensure_connection()
+    with connection.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT detached_award_procurement_id, unique_award_key FROM source_procurement_transaction "
+            "WHERE detached_award_procurement_id IN %s",
+            (tuple(id_list),),
+        )
+        partitions = [[] for _ in range(partition_count)]
+        for detached_award_procurement_id, unique_award_key in cursor.fetchall():
+            # crc32 rather than hash() which differs between processes
+            partition = zlib.crc32((unique_award_key or "").upper().encode("utf-8")) % partition_count
+            partitions[partition].append(detached_award_procurement_id)
+
+    return [partition for partition in partitions if partition]
+
+
 def _extract_broker_objects(id_list):
 
     connection.ensure_connection()
@@ -194,6 +238,152 @@ def _load_transactions(load_objects):
     return list(ids_of_awards_created_or_updated)
 
 
+def _bulk_upsert_transactions(load_objects):
+    """
+    Set-based version of _load_transactions. Stages the chunk into temporary tables with COPY, then matches, inserts and
+    updates awards and transactions with a statement per step rather than per transaction. If any statement fails the
+    chunk is loaded one transaction at a time instead, so that the transactions that fail are recorded in failed_ids.
+
+    returns ids for each award touched
+    """
+    transaction_keys = [load_object["transaction_fpds"]["detached_award_proc_unique"] for load_object in load_objects]
+    if len(set(transaction_keys)) < len(transaction_keys):
+        # One at a time, the later versions of a repeated transaction update the earlier ones
+        logger.info("Chunk contains repeated detached_award_proc_unique values; loading one transaction at a time")
+        return _load_transactions(load_objects)
+
+    connection.ensure_connection()
+    try:
+        with transaction.atomic(), connection.connection.cursor() as cursor:
+            return _upsert_staged_transactions(cursor, load_objects)
+    except (Error, RuntimeError) as e:
+        # RuntimeError is the insert mismatch check of _upsert_staged_transactions
+        logger.warning(
+            f"Bulk upsert failed; loading one transaction at a time.\nDetails: {getattr(e, 'pgerror', None) or e}"
+        )
+        return _load_transactions(load_objects)
+
+
+def _upsert_staged_transactions(cursor, load_objects):
+    award_columns = list(load_objects[0]["award"])
+    normalized_columns = list(load_objects[0]["transaction_normalized"])
+    fpds_columns = list(load_objects[0]["transaction_fpds"])
+
+    _stage_load_objects(cursor, load_objects, "award", "awards", award_columns)
+    _stage_load_objects(cursor, load_objects, "transaction_normalized", "transaction_normalized", normalized_columns)
+    _stage_load_objects(cursor, load_objects, "transaction_fpds", "transaction_fpds", fpds_columns)
+    cursor.execute("ALTER TABLE temp_fpds_transaction_normalized ADD COLUMN id BIGINT, ADD COLUMN award_id BIGINT")
+
+    # AWARD GET OR CREATE, using the first transaction of each award like _load_transactions
+    cursor.execute(
+        f"""
+        INSERT INTO awards ({_column_list(award_columns)})
+        SELECT DISTINCT ON (generated_unique_award_id) {_column_list(award_columns)}
+        FROM temp_fpds_award AS t
+        WHERE NOT EXISTS (SELECT 1 FROM awards AS a WHERE a.generated_unique_award_id = t.generated_unique_award_id)
+        ORDER BY generated_unique_award_id, load_order
+        """
+    )
+    awards_inserted = cursor.rowcount
+    cursor.execute(
+        """
+        UPDATE temp_fpds_transaction_normalized AS t SET award_id = a.id
+        FROM awards AS a
+        WHERE a.generated_unique_award_id = t.unique_award_key
+        """
+    )
+
+    # TRANSACTION UPSERT
+    cursor.execute(
+        """
+        UPDATE temp_fpds_transaction_normalized AS t SET id = f.transaction_id
+        FROM temp_fpds_transaction_fpds AS tf
+        INNER JOIN transaction_fpds AS f ON f.detached_award_proc_unique = tf.detached_award_proc_unique
+        WHERE tf.load_order = t.load_order
+        """
+    )
+    cursor.execute(
+        f"""
+        UPDATE transaction_normalized AS tn SET award_id = t.award_id, {_update_pairs(normalized_columns)}
+        FROM temp_fpds_transaction_normalized AS t
+        WHERE tn.id = t.id
+        """
+    )
+    transactions_updated = cursor.rowcount
+    cursor.execute(
+        f"""
+        UPDATE transaction_fpds AS f SET {_update_pairs(fpds_columns)}
+        FROM temp_fpds_transaction_fpds AS t
+        WHERE f.detached_award_proc_unique = t.detached_award_proc_unique
+        """
+    )
+    cursor.execute(
+        f"""
+        WITH inserted AS (
+            INSERT INTO transaction_normalized (award_id, {_column_list(normalized_columns)})
+            SELECT award_id, {_column_list(normalized_columns)}
+            FROM temp_fpds_transaction_normalized
+            WHERE id IS NULL
+            ORDER BY load_order
+            RETURNING id, transaction_unique_id
+        )
+        UPDATE temp_fpds_transaction_normalized AS t SET id = inserted.id
+        FROM inserted
+        WHERE t.id IS NULL AND t.transaction_unique_id = inserted.transaction_unique_id
+        """
+    )
+    transactions_inserted = cursor.rowcount
+    cursor.execute(
+        f"""
+        INSERT INTO transaction_fpds (transaction_id, {_column_list(fpds_columns)})
+        SELECT tn.id, {_column_list(fpds_columns, "t")}
+        FROM temp_fpds_transaction_fpds AS t
+        INNER JOIN temp_fpds_transaction_normalized AS tn ON tn.load_order = t.load_order
+        WHERE NOT EXISTS (
+            SELECT 1 FROM transaction_fpds AS f WHERE f.detached_award_proc_unique = t.detached_award_proc_unique
+        )
+        ORDER BY t.load_order
+        """
+    )
+    if cursor.rowcount != transactions_inserted:
+        msg = "Insert Mismatch! Counts of transaction_normalized ({}) and transaction_fpds ({}) inserts"
+        raise RuntimeError(msg.format(transactions_inserted, cursor.rowcount))
+
+    cursor.execute("SELECT DISTINCT award_id FROM temp_fpds_transaction_normalized")
+    award_ids = [row[0] for row in cursor.fetchall()]
+    cursor.execute("DROP TABLE temp_fpds_award, temp_fpds_transaction_normalized, temp_fpds_transaction_fpds")
+
+    logger.info(
+        f"{awards_inserted:,} awards created, {transactions_inserted:,} transactions created and "
+        f"{transactions_updated:,} transactions updated"
+    )
+    return award_ids
+
+
+def _stage_load_objects(cursor, load_objects, type, source_table, columns):
+    """COPY one type of the load objects into a temporary table with the column types of its destination table"""
+    temp_table = f"temp_fpds_{type}"
+    cursor.execute(f"CREATE TEMPORARY TABLE {temp_table} AS SELECT {_column_list(columns)} FROM {source_table} LIMIT 0")
+    cursor.execute(f"ALTER TABLE {temp_table} ADD COLUMN load_order INTEGER")
+
+    buffer = io.StringIO()
+    for load_order, load_object in enumerate(load_objects):
+        values = [format_value_for_copy(load_object[type][column]) for column in columns]
+        buffer.write("\t".join(values + [str(load_order)]) + "\n")
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {temp_table} ({_column_list(columns)}, load_order) FROM STDIN", buffer)
+    cursor.execute(f"ANALYZE {temp_table}")
+
+
+def _column_list(columns, table_alias=None):
+    prefix = f"{table_alias}." if table_alias else ""
+    return ", ".join(f'{prefix}"{column}"' for column in columns)
+
+
+def _update_pairs(columns):
+    return ", ".join(f'"{column}" = t."{column}"' for column in columns if column not in ["create_date", "created_at"])
+
+
 def _matching_award(cursor, load_object):
     """ Try to find an award for this transaction to belong to by unique_award_key"""
     find_matching_award_sql = "select id from awards where generated_unique_award_id = '{}'".format(
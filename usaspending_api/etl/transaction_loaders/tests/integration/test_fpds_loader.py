@@ -8,6 +8,7 @@ from model_bakery import baker
 from usaspending_api.awards.models import Award, TransactionFPDS, TransactionNormalized
 from usaspending_api.broker.models import ExternalDataLoadDate, ExternalDataType
 from usaspending_api.etl.award_helpers import update_awards
+from usaspending_api.etl.transaction_loaders import fpds_loader
 from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_boolean_columns,
     transaction_fpds_nonboolean_columns,
@@ -62,7 +63,8 @@ def _assemble_source_procurement_records(id_list):
 
 
 @pytest.mark.django_db
-def test_load_source_procurement_by_ids():
+@pytest.mark.parametrize("load_args", [[], ["--bulk-upsert"]])
+def test_load_source_procurement_by_ids(load_args):
     """
     Simple end-to-end integration test to exercise the fpds loader given 3 records in an actual broker database
     to load into an actual usaspending database
@@ -71,7 +73,7 @@ def test_load_source_procurement_by_ids():
     _assemble_source_procurement_records(source_procurement_id_list)
 
     # Run core logic to be tested
-    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list)
+    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list, *load_args)
 
     # Lineage should trace back to the broker records
     usaspending_transactions = TransactionFPDS.objects.all()
@@ -119,6 +121,66 @@ def test_load_source_procurement_by_ids():
     assert transactions_by_id[301].fiscal_year == 2011
 
 
+@pytest.mark.django_db
+def test_bulk_upsert_updates_existing_transactions():
+    source_procurement_id_list = [101, 201, 301]
+    _assemble_source_procurement_records(source_procurement_id_list)
+    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list, "--bulk-upsert")
+    transaction_ids = set(TransactionNormalized.objects.values_list("id", flat=True))
+
+    SourceProcurementTransaction.objects.filter(detached_award_procurement_id=201).update(
+        federal_action_obligation=5, piid="updated"
+    )
+    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list, "--bulk-upsert")
+
+    assert set(TransactionNormalized.objects.values_list("id", flat=True)) == transaction_ids
+    assert Award.objects.count() == 1
+    updated_transaction = TransactionFPDS.objects.get(detached_award_procurement_id=201)
+    assert updated_transaction.piid == "UPDATED"
+    assert updated_transaction.transaction.federal_action_obligation == 5
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_falls_back_to_one_transaction_at_a_time(monkeypatch):
+    upsert_staged_transactions = fpds_loader._upsert_staged_transactions
+
+    def mismatched_upsert(cursor, load_objects):
+        upsert_staged_transactions(cursor, load_objects)
+        raise RuntimeError("Insert Mismatch! Counts of transaction_normalized (3) and transaction_fpds (2) inserts")
+
+    monkeypatch.setattr(fpds_loader, "_upsert_staged_transactions", mismatched_upsert)
+    failed_id_count = len(fpds_loader.failed_ids)
+    source_procurement_id_list = [101, 201, 301]
+    _assemble_source_procurement_records(source_procurement_id_list)
+
+    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list, "--bulk-upsert")
+
+    # The bulk upsert is rolled back, so the transactions are only loaded once
+    assert TransactionFPDS.objects.count() == 3
+    assert TransactionNormalized.objects.count() == 3
+    assert Award.objects.count() == 1
+    assert fpds_loader.failed_ids[failed_id_count:] == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_source_procurement_in_parallel_by_award():
+    source_procurement_id_list = [101, 201, 301, 401]
+    _assemble_source_procurement_records(source_procurement_id_list)
+    SourceProcurementTransaction.objects.filter(detached_award_procurement_id__in=[301, 401]).update(
+        unique_award_key="OTHER_AWARD"
+    )
+
+    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list, "--processes", "2")
+
+    assert TransactionFPDS.objects.count() == 4
+    assert sorted(Award.objects.values_list("generated_unique_award_id", flat=True)) == [
+        "OTHER_AWARD",
+        "UNIQUE_AWARD_KEY",
+    ]
+    for award in Award.objects.all():
+        assert award.latest_transaction_id is not None
+
+
 @pytest.mark.django_db(transaction=True)
 def test_delete_fpds_success(monkeypatch):
     # Award/Transaction deleted based on 1-1 transaction
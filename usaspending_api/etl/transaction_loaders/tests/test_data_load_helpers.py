@@ -1,4 +1,11 @@
-from usaspending_api.etl.transaction_loaders.data_load_helpers import capitalize_if_string, false_if_null
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from usaspending_api.etl.transaction_loaders.data_load_helpers import (
+    capitalize_if_string,
+    false_if_null,
+    format_value_for_copy,
+)
 
 
 def test_capitalize_if_string():
@@ -14,3 +21,13 @@ def test_false_if_null():
     assert false_if_null(True)
     assert not false_if_null(False)
     assert not false_if_null(None)
+
+
+def test_format_value_for_copy():
+    assert format_value_for_copy(None) == r"\N"
+    assert format_value_for_copy(True) == "t"
+    assert format_value_for_copy(Decimal("10.50")) == "10.50"
+    assert format_value_for_copy(date(2020, 1, 2)) == "2020-01-02"
+    assert format_value_for_copy(datetime(2020, 1, 2, 3, tzinfo=timezone.utc)) == "2020-01-02T03:00:00+00:00"
+    assert format_value_for_copy("A\tB\nC\\D") == r"A\tB\nC\\D"
+    assert format_value_for_copy(["small_business", 'say "hi"', None]) == r'{"small_business","say \\"hi\\"",NULL}'
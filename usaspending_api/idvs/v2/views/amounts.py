@@ -9,6 +9,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.awards.models import ParentAward
+from usaspending_api.common.cache import AWARDS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.sql_helpers import execute_sql_to_ordered_dictionary
 from usaspending_api.common.validator.award import get_internal_or_generated_award_id_model
@@ -161,6 +162,7 @@ class IDVAmountsViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/idvs/amounts/award_id.md"
+    cache_data_types = AWARDS_DATA_TYPES
 
     @staticmethod
     def _parse_and_validate_request(requested_award: str) -> dict:
@@ -7,6 +7,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.common.api_versioning import deprecated
+from usaspending_api.common.cache import AWARDS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.generic_helper import get_pagination_metadata
 from usaspending_api.common.validator.pagination import PAGINATION
@@ -98,6 +99,7 @@ class RecipientCount(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/recipient/count.md"
+    cache_data_types = AWARDS_DATA_TYPES
 
     cache_key_whitelist = ["keyword", "award_type"]
 
@@ -113,6 +115,7 @@ class ListRecipients(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/recipient.md"
+    cache_data_types = AWARDS_DATA_TYPES
 
     def request_count(self, filters={}):
         response = RecipientCount.as_view()(request=self.request._request).data
@@ -13,9 +13,11 @@ from rest_framework.views import APIView
 
 from usaspending_api.awards.v2.lookups.lookups import loan_type_mapping
 from usaspending_api.broker.helpers.get_business_categories import get_business_categories
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
 from usaspending_api.common.exceptions import InvalidParameterException
+from usaspending_api.common.helpers.concurrency_helpers import run_concurrently
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.recipient.models import RecipientProfile, RecipientLookup, DUNS
 from usaspending_api.recipient.v2.helpers import validate_year, reshape_filters, get_duns_business_types_mapping
@@ -24,8 +26,10 @@ from usaspending_api.references.models import RefCountryCode
 from usaspending_api.search.models import TransactionSearch as TransactionSearchModel
 from usaspending_api.common.api_versioning import deprecated
 from usaspending_api.search.v2.elasticsearch_helper import (
+    add_unique_terms_count_aggregation,
+    execute_sized_to_unique_terms,
     get_scaled_sum_aggregations,
-    get_number_of_unique_terms_for_transactions,
+    get_unique_terms_count,
 )
 
 logger = logging.getLogger(__name__)
@@ -259,8 +263,6 @@ def obtain_recipient_totals(recipient_id, children=False, year="latest"):
     filters = reshape_filters(recipient_id=recipient_id, year=year)
     filter_query = QueryWithFilters.generate_transactions_elasticsearch_query(filters)
 
-    search = TransactionSearch().filter(filter_query)
-
     if children:
         group_by_field = "recipient_agg_key"
     elif recipient_id[-2:] == "-P":
@@ -268,27 +270,28 @@ def obtain_recipient_totals(recipient_id, children=False, year="latest"):
     else:
         group_by_field = "recipient_hash"
 
-    bucket_count = get_number_of_unique_terms_for_transactions(filter_query, f"{group_by_field}.hash")
-
-    if bucket_count == 0:
-        return []
+    def build_search(bucket_count):
+        search = TransactionSearch().filter(filter_query)
 
-    # Not setting the shard_size since the number of child recipients under a
-    # parent recipient will not exceed 10k
-    group_by_recipient = A("terms", field=group_by_field, size=bucket_count)
+        # Count the unique recipients in the same request as the totals. Not setting the shard_size since the number
+        # of child recipients under a parent recipient will not exceed 10k
+        add_unique_terms_count_aggregation(search, f"{group_by_field}.hash")
+        group_by_recipient = A("terms", field=group_by_field, size=bucket_count)
 
-    sum_obligation = get_scaled_sum_aggregations("generated_pragmatic_obligation")["sum_field"]
+        sum_obligation = get_scaled_sum_aggregations("generated_pragmatic_obligation")["sum_field"]
 
-    filter_loans = A("filter", terms={"type": list(loan_type_mapping.keys())})
-    sum_face_value_loan = get_scaled_sum_aggregations("face_value_loan_guarantee")["sum_field"]
+        filter_loans = A("filter", terms={"type": list(loan_type_mapping.keys())})
+        sum_face_value_loan = get_scaled_sum_aggregations("face_value_loan_guarantee")["sum_field"]
 
-    search.aggs.bucket("group_by_recipient", group_by_recipient)
-    search.aggs["group_by_recipient"].metric("sum_obligation", sum_obligation)
-    search.aggs["group_by_recipient"].bucket("filter_loans", filter_loans)
-    search.aggs["group_by_recipient"]["filter_loans"].metric("sum_face_value_loan", sum_face_value_loan)
+        search.aggs.bucket("group_by_recipient", group_by_recipient)
+        search.aggs["group_by_recipient"].metric("sum_obligation", sum_obligation)
+        search.aggs["group_by_recipient"].bucket("filter_loans", filter_loans)
+        search.aggs["group_by_recipient"]["filter_loans"].metric("sum_face_value_loan", sum_face_value_loan)
+        return search
 
-    response = search.handle_execute()
-    response_as_dict = response.aggs.to_dict()
+    response_as_dict = execute_sized_to_unique_terms(build_search)
+    if get_unique_terms_count(response_as_dict) == 0:
+        return []
     recipient_info_buckets = response_as_dict.get("group_by_recipient", {}).get("buckets", [])
 
     result_list = []
@@ -325,6 +328,7 @@ class RecipientOverView(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/recipient/recipient_id.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     @cache_response()
     def get(self, request, recipient_id):
@@ -335,14 +339,23 @@ class RecipientOverView(APIView):
         if not (recipient_name or recipient_duns or recipient_uei):
             raise InvalidParameterException("Recipient Hash not found: '{}'.".format(recipient_hash))
 
-        alternate_names = (
-            RecipientLookup.objects.filter(recipient_hash=recipient_hash).values("alternate_names").first()
-        )
-        alternate_names = sorted(alternate_names.get("alternate_names", []))
+        queries = {
+            "alternate_names": lambda: (
+                RecipientLookup.objects.filter(recipient_hash=recipient_hash).values("alternate_names").first()
+            ),
+            "location": lambda: extract_location(recipient_hash),
+            "business_types": lambda: extract_business_categories(recipient_name, recipient_uei, recipient_hash),
+            "totals": lambda: obtain_recipient_totals(recipient_id, year=year),
+        }
+        if recipient_level == "C":
+            queries["parents"] = lambda: extract_parents_from_hash(recipient_hash)
+        query_results = run_concurrently(queries)
+
+        alternate_names = sorted(query_results["alternate_names"].get("alternate_names", []))
 
         parents = []
         if recipient_level == "C":
-            parents = extract_parents_from_hash(recipient_hash)
+            parents = query_results["parents"]
         elif recipient_level == "P":
             parents = [
                 {
@@ -353,10 +366,9 @@ class RecipientOverView(APIView):
                 }
             ]
 
-        location = extract_location(recipient_hash)
-        business_types = extract_business_categories(recipient_name, recipient_uei, recipient_hash)
-        results = obtain_recipient_totals(recipient_id, year=year)
-        recipient_totals = results[0] if results else {}
+        location = query_results["location"]
+        business_types = query_results["business_types"]
+        recipient_totals = query_results["totals"][0] if query_results["totals"] else {}
 
         parent_id, parent_name, parent_duns, parent_uei = None, None, None, None
         if parents:
@@ -421,6 +433,7 @@ class ChildRecipients(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/recipient/children/duns_or_uei.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     @cache_response()
     def get(self, request, duns_or_uei):
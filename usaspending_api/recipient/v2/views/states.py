@@ -8,6 +8,7 @@ from django.db.models import Sum
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from usaspending_api.common.cache import AWARDS_DATA_TYPES
 from usaspending_api.common.helpers.orm_helpers import StringAggWithDefault
 from usaspending_api.awards.v2.filters.search import matview_search_filter
 from usaspending_api.awards.v2.lookups.lookups import all_award_types_mappings
@@ -115,6 +116,7 @@ class StateMetaDataViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/recipient/state/fips.md"
+    cache_data_types = AWARDS_DATA_TYPES
 
     def get_state_data(self, state_data_results, field, year=None):
         """Finds which earliest or latest state data to use based on the year and what data is available"""
@@ -196,6 +198,7 @@ class StateAwardBreakdownViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/recipient/state/awards/fips.md"
+    cache_data_types = AWARDS_DATA_TYPES
 
     @cache_response()
     def get(self, request, fips):
@@ -216,6 +219,7 @@ class ListStates(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/recipient/state.md"
+    cache_data_types = AWARDS_DATA_TYPES
 
     @cache_response()
     def get(self, request):
@@ -1,10 +1,16 @@
-from typing import Optional
+from time import monotonic
+from typing import Dict, Optional, Tuple
 
+from django.conf import settings
 from django.utils.text import slugify
 
 from usaspending_api.references.models.cgac import CGAC
 from usaspending_api.references.models.frec import FREC
-from usaspending_api.references.models import ToptierAgencyPublishedDABSView
+from usaspending_api.references.models import Agency, ToptierAgencyPublishedDABSView
+from usaspending_api.submissions.models import SubmissionAttributes
+
+# (expiration time, {<toptier_code>: (<agency_id>, <agency_slug>)}) swapped out as a whole when it is reloaded
+_toptier_agency_lookup = (0.0, {})
 
 
 def retrive_agency_name_from_code(code: str) -> Optional[str]:
@@ -33,3 +39,48 @@ def generate_agency_slugs_for_agency_list(agency_list):
         .values("toptier_agency_id", "name")
     )
     return {res["toptier_agency_id"]: slugify(res["name"]) for res in agency_names}
+
+
+def get_toptier_agency_lookup() -> Dict[str, Tuple[Optional[int], Optional[str]]]:
+    """
+    Returns a dictionary of { <toptier_code>: (<agency_id>, <agency_slug>) } for every toptier agency. The agency_id
+    is only provided if the agency has a submission and the agency_slug only if it has a published File C submission.
+    This dictionary is kept in memory for TOPTIER_AGENCY_LOOKUP_TTL seconds so that endpoints can populate the agency
+    of every result without the need to query the DB 1:1 for each result, or at all for most requests.
+    """
+    global _toptier_agency_lookup
+
+    expires, agencies = _toptier_agency_lookup
+    if monotonic() >= expires:
+        agencies = _load_toptier_agency_lookup()
+        _toptier_agency_lookup = (monotonic() + settings.TOPTIER_AGENCY_LOOKUP_TTL, agencies)
+    return agencies
+
+
+def clear_toptier_agency_lookup() -> None:
+    global _toptier_agency_lookup
+    _toptier_agency_lookup = (0.0, {})
+
+
+def _load_toptier_agency_lookup() -> Dict[str, Tuple[Optional[int], Optional[str]]]:
+    submitted_toptier_codes = set(SubmissionAttributes.objects.values_list("toptier_code", flat=True).distinct())
+
+    # Sorted in reverse so that the first agency or published submission for each toptier code is the one kept
+    agency_ids = {
+        toptier_code: agency_id
+        for agency_id, toptier_code in Agency.objects.filter(toptier_flag=True)
+        .order_by("-id")
+        .values_list("id", "toptier_agency__toptier_code")
+        if toptier_code in submitted_toptier_codes
+    }
+    agency_slugs = {
+        toptier_code: slugify(name)
+        for toptier_code, name in ToptierAgencyPublishedDABSView.objects.order_by("-toptier_agency_id").values_list(
+            "toptier_code", "name"
+        )
+    }
+
+    return {
+        toptier_code: (agency_ids.get(toptier_code), agency_slugs.get(toptier_code))
+        for toptier_code in agency_ids.keys() | agency_slugs.keys()
+    }
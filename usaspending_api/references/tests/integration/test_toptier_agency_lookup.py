@@ -0,0 +1,34 @@
+import pytest
+
+from model_bakery import baker
+
+from usaspending_api.references.helpers import clear_toptier_agency_lookup, get_toptier_agency_lookup
+
+
+@pytest.fixture
+def agency_data(db):
+    baker.make("references.ToptierAgency", toptier_agency_id=1, toptier_code="001", name="Agency With Submission")
+    baker.make("references.ToptierAgency", toptier_agency_id=2, toptier_code="002", name="Agency Without Submission")
+    baker.make("references.Agency", id=11, toptier_agency_id=1, toptier_flag=True)
+    baker.make("references.Agency", id=12, toptier_agency_id=1, toptier_flag=False)
+    baker.make("references.Agency", id=21, toptier_agency_id=2, toptier_flag=True)
+    baker.make("submissions.SubmissionAttributes", submission_id=1, toptier_code="001")
+
+
+def test_agency_id_requires_submission(agency_data):
+    lookup = get_toptier_agency_lookup()
+
+    assert lookup["001"][0] == 11
+    assert lookup.get("002", (None, None))[0] is None
+    assert lookup.get("999", (None, None)) == (None, None)
+
+
+def test_lookup_is_kept_until_cleared(agency_data, django_assert_num_queries):
+    get_toptier_agency_lookup()
+    baker.make("submissions.SubmissionAttributes", submission_id=2, toptier_code="002")
+
+    with django_assert_num_queries(0):
+        assert get_toptier_agency_lookup().get("002", (None, None))[0] is None
+
+    clear_toptier_agency_lookup()
+    assert get_toptier_agency_lookup()["002"][0] == 21
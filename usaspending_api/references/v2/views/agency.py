@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.accounts.models import AppropriationAccountBalances
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.date_helper import now
 from usaspending_api.references.models import Agency, GTASSF133Balances
@@ -17,6 +18,7 @@ class AgencyViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/references/agency/id.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
     @cache_response()
     def get(self, request, pk, format=None):
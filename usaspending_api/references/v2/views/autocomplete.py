@@ -2,6 +2,7 @@ from django.db.models import Case, F, IntegerField, Q, When
 from django.db.models.functions import Upper
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from usaspending_api.common.cache import UNVERSIONED_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.references.models import Cfda, Definition, NAICS, PSC
@@ -10,6 +11,8 @@ from usaspending_api.search.models import AgencyAutocompleteMatview
 
 
 class BaseAutocompleteViewSet(APIView):
+    cache_data_types = UNVERSIONED_DATA_TYPES
+
     @staticmethod
     def get_request_payload(request):
         """
@@ -92,7 +95,7 @@ class AwardingAgencyAutocompleteViewSet(BaseAutocompleteViewSet):
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/autocomplete/awarding_agency.md"
     filter_field = "has_awarding_data"
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def post(self, request):
         return self.agency_autocomplete(request)
 
@@ -105,7 +108,7 @@ class FundingAgencyAutocompleteViewSet(BaseAutocompleteViewSet):
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/autocomplete/funding_agency.md"
     filter_field = "has_funding_data"
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def post(self, request):
         return self.agency_autocomplete(request)
 
@@ -117,7 +120,7 @@ class CFDAAutocompleteViewSet(BaseAutocompleteViewSet):
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/autocomplete/cfda.md"
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def post(self, request):
         """Return CFDA matches by number, title, or name"""
         search_text, limit = self.get_request_payload(request)
@@ -149,7 +152,7 @@ class NAICSAutocompleteViewSet(BaseAutocompleteViewSet):
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/autocomplete/naics.md"
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def post(self, request):
         """Return all NAICS table entries matching the provided search text"""
         search_text, limit = self.get_request_payload(request)
@@ -179,7 +182,7 @@ class PSCAutocompleteViewSet(BaseAutocompleteViewSet):
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/autocomplete/psc.md"
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def post(self, request):
         """Return all PSC table entries matching the provided search text"""
         search_text, limit = self.get_request_payload(request)
@@ -205,7 +208,7 @@ class GlossaryAutocompleteViewSet(BaseAutocompleteViewSet):
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/autocomplete/glossary.md"
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def post(self, request):
 
         search_text, limit = self.get_request_payload(request)
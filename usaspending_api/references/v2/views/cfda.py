@@ -2,6 +2,7 @@ from rest_framework.views import APIView
 from requests import post
 from rest_framework.response import Response
 from django.conf import settings
+from usaspending_api.common.cache import UNVERSIONED_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.exceptions import NoDataFoundException
 import logging
@@ -16,6 +17,7 @@ class CFDAViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/references/cfda/totals.md"
+    cache_data_types = UNVERSIONED_DATA_TYPES
 
     @cache_response()
     def get(self, request, cfda=None):
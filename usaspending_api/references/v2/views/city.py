@@ -3,6 +3,7 @@ from rest_framework.views import APIView
 from collections import OrderedDict
 from elasticsearch_dsl import Q as ES_Q, A
 
+from usaspending_api.common.cache import ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 
 from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
@@ -47,6 +48,7 @@ class CityAutocompleteViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/autocomplete/city.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES
 
     @cache_response()
     def post(self, request, format=None):
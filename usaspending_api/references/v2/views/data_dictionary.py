@@ -3,6 +3,7 @@ import logging
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from usaspending_api.common.cache import UNVERSIONED_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.exceptions import NoDataFoundException
 from usaspending_api.references.models import Rosetta
@@ -17,8 +18,9 @@ class DataDictionaryViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/references/data_dictionary.md"
+    cache_data_types = UNVERSIONED_DATA_TYPES
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def get(self, request, format=None):
         try:
             api_response = Rosetta.objects.filter(document_name="api_response").values("document")[0]
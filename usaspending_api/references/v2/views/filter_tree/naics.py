@@ -4,6 +4,7 @@ from rest_framework.views import APIView
 from django.db.models.functions import Length
 from django.db.models import Q
 
+from usaspending_api.common.cache import UNVERSIONED_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.references.models import NAICS
@@ -14,6 +15,7 @@ class NAICSViewSet(APIView):
     """Return a list of NAICS or a filtered list of NAICS"""
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/references/naics.md"
+    cache_data_types = UNVERSIONED_DATA_TYPES
     naics_queryset = NAICS.objects.annotate(text_len=Length("code"))
 
     def get_six_digit_naics_count(self, code: str) -> int:
@@ -2,6 +2,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from usaspending_api.common.cache import UNVERSIONED_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.references.v2.views.filter_tree.psc_filter_tree import PSCFilterTree
@@ -13,6 +14,7 @@ class PSCViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/references/filter_tree/psc.md"
+    cache_data_types = UNVERSIONED_DATA_TYPES
 
     def _parse_and_validate(self, request):
         models = [
@@ -2,6 +2,7 @@ from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from usaspending_api.common.cache import UNVERSIONED_DATA_TYPES
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.common.helpers.generic_helper import get_pagination
 from usaspending_api.common.cache_decorator import cache_response
@@ -22,8 +23,9 @@ class GlossaryViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/references/glossary.md"
+    cache_data_types = UNVERSIONED_DATA_TYPES
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def get(self, request: Request) -> Response:
         """
         Accepts only pagination-related query parameters
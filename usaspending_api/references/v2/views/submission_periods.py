@@ -3,6 +3,7 @@ import datetime
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
+from usaspending_api.common.cache import UNVERSIONED_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.submissions.models import DABSSubmissionWindowSchedule
@@ -49,7 +50,9 @@ class CachedSubmissionPeriodsViewSet(APIView):
     This ViewSet is only used internally to provided a cached version of the SubmissionPeriodsViewSet
     """
 
-    @cache_response()
+    cache_data_types = UNVERSIONED_DATA_TYPES
+
+    @cache_response(local_cache=True)
     def get(self, request):
         formatted_results = SubmissionPeriodsViewSet.get_closed_submission_windows()
         return Response(formatted_results)
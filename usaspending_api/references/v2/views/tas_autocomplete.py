@@ -3,6 +3,7 @@ from copy import deepcopy
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from usaspending_api.accounts.helpers import TAS_COMPONENT_TO_FIELD_MAPPING
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.search.models import TASAutocompleteMatview
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.validator.tinyshield import TinyShield
@@ -34,6 +35,8 @@ class TASAutocomplete(APIView):
     endpoint.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     @staticmethod
     def _parse_and_validate_request(request_data):
         return TinyShield(deepcopy(TINY_SHIELD_MODELS)).block(request_data)
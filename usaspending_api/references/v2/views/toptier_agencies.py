@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.accounts.models import AppropriationAccountBalances
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.date_helper import now
 from usaspending_api.common.helpers.generic_helper import sort_with_null_last
@@ -20,8 +21,9 @@ class ToptierAgenciesViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/references/toptier_agencies.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def get(self, request, format=None):
         sortable_columns = [
             "agency_id",
@@ -1,6 +1,7 @@
 from django.db.models import Sum
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from usaspending_api.common.cache import UNVERSIONED_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.validator.tinyshield import TinyShield
@@ -14,6 +15,7 @@ class TotalBudgetaryResources(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/references/total_budgetary_resources.md"
+    cache_data_types = UNVERSIONED_DATA_TYPES
 
     @cache_response()
     def get(self, request):
@@ -2,14 +2,21 @@ import itertools
 
 import pytest
 
+from elasticsearch_dsl import A
+from unittest.mock import MagicMock
 from model_bakery import baker
 
+from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
 from usaspending_api.search.tests.data.utilities import setup_elasticsearch_test
 from usaspending_api.search.v2.elasticsearch_helper import (
+    add_unique_terms_count_aggregation,
+    execute_sized_to_unique_terms,
+    get_unique_terms_count,
     spending_by_transaction_count,
     get_download_ids,
     es_minimal_sanitize,
     swap_keys,
+    UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE,
 )
 from usaspending_api.search.v2.es_sanitization import es_sanitize
 
@@ -140,3 +147,42 @@ def test_swap_keys():
         "action_date": "action_date",
         "federal_action_obligation": "federal_action_obligation",
     }
+
+
+def test_unique_terms_count_in_same_request():
+    search = TransactionSearch()
+    add_unique_terms_count_aggregation(search, "recipient_hash.hash")
+    search.aggs.bucket("group_by_agg_key", A("terms", field="recipient_hash", size=10))
+
+    aggs = search.to_dict()["aggs"]
+    assert aggs["field_count"] == {"cardinality": {"field": "recipient_hash.hash", "precision_threshold": 11000}}
+
+    assert get_unique_terms_count({"field_count": {"value": 5}, "group_by_agg_key": {"buckets": []}}) == 5
+    assert get_unique_terms_count({}) == 0
+
+
+@pytest.mark.parametrize(
+    "unique_terms_count,extra_buckets,expected_sizes",
+    [
+        (0, 0, [UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE]),
+        (UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE, 0, [UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE]),
+        (UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE, 1, [UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE, 501]),
+        (5000, 0, [UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE, 5000]),
+    ],
+)
+def test_execute_sized_to_unique_terms(unique_terms_count, extra_buckets, expected_sizes):
+    sizes = []
+
+    def build_search(size):
+        sizes.append(size)
+        search = MagicMock()
+        search.handle_execute.return_value.aggs.to_dict.return_value = {
+            "field_count": {"value": unique_terms_count},
+            "group_by_agg_key": {"buckets": [{"key": i} for i in range(min(size, unique_terms_count))]},
+        }
+        return search
+
+    response_dict = execute_sized_to_unique_terms(build_search, extra_buckets)
+
+    assert sizes == expected_sizes
+    assert len(response_dict["group_by_agg_key"]["buckets"]) == unique_terms_count
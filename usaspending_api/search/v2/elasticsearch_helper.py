@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from django.conf import settings
 from elasticsearch_dsl import A, Q as ES_Q
@@ -17,6 +17,10 @@ from usaspending_api.search.v2.es_sanitization import es_minimal_sanitize
 logger = logging.getLogger("console")
 
 DOWNLOAD_QUERY_SIZE = settings.MAX_DOWNLOAD_LIMIT
+
+# Size of the terms aggregation on the first attempt at a search run by execute_sized_to_unique_terms(). Large enough
+# for the unique terms of most requests, so they are answered in one request, and small enough to keep those light.
+UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE = 500
 TRANSACTIONS_SOURCE_LOOKUP.update({v: k for k, v in TRANSACTIONS_SOURCE_LOOKUP.items()})
 
 
@@ -206,13 +210,44 @@ def _get_number_of_unique_terms(search, field: str) -> int:
           11k to ensure that endpoints using Elasticsearch do not cross the 10k threshold. Elasticsearch endpoints
           should be implemented with a safeguard in case this count is above 10k.
     """
+    add_unique_terms_count_aggregation(search, field)
+    response = search.handle_execute()
+    return get_unique_terms_count(response.aggs.to_dict())
+
+
+def add_unique_terms_count_aggregation(search, field: str) -> None:
+    """
+    Adds the cardinality aggregation used by the "get_number_of_unique_terms" functions to a search so that the count
+    of unique terms is returned alongside its other aggregations instead of needing a separate request. The count is
+    read back from the response with get_unique_terms_count().
+    """
     cardinality_aggregation = A("cardinality", field=field, precision_threshold=11000)
     search.aggs.metric("field_count", cardinality_aggregation)
-    response = search.handle_execute()
-    response_dict = response.aggs.to_dict()
+
+
+def get_unique_terms_count(response_dict: dict) -> int:
     return response_dict.get("field_count", {"value": 0})["value"]
 
 
+def execute_sized_to_unique_terms(build_search: Callable[[int], Any], extra_buckets: int = 0) -> dict:
+    """
+    Executes the search returned by build_search(size) and returns the aggregations of the response, where size is
+    what its terms aggregation needs to hold every unique term. The search must count those terms with
+    add_unique_terms_count_aggregation().
+
+    The search is first built with UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE. If the count returned with it shows that not
+    every term fit, the search is built again sized to the count (plus extra_buckets, e.g. for a null bucket that the
+    count misses) and executed once more, just as if the terms had been counted first. build_search can raise if that
+    size is more than it supports.
+    """
+    size = UNIQUE_TERMS_AGGREGATION_INITIAL_SIZE
+    response_dict = build_search(size).handle_execute().aggs.to_dict()
+    bucket_count = get_unique_terms_count(response_dict) + extra_buckets
+    if bucket_count > size:
+        response_dict = build_search(bucket_count).handle_execute().aggs.to_dict()
+    return response_dict
+
+
 def get_scaled_sum_aggregations(field_to_sum: str, pagination: Optional[Pagination] = None) -> Dict[str, A]:
     """
     Creates a sum and bucket_sort aggregation that can be used for many different aggregations.
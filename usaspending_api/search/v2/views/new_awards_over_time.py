@@ -8,6 +8,7 @@ from elasticsearch_dsl import Q, A
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from usaspending_api.common.cache import ES_AWARDS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.aggregation_helpers import create_count_aggregation
 from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch
@@ -31,6 +32,7 @@ class NewAwardsOverTimeVisualizationViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/new_awards_over_time.md"
+    cache_data_types = ES_AWARDS_DATA_TYPES
 
     def validate_api_request(self, json_payload):
         self.groupings = {
@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.common.api_versioning import api_transformations, API_TRANSFORM_FUNCTIONS
+from usaspending_api.common.cache import ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
 from usaspending_api.common.exceptions import (
@@ -34,6 +35,7 @@ class SpendingByTransactionVisualizationViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/spending_by_transaction.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES
 
     @cache_response()
     def post(self, request):
@@ -131,6 +133,7 @@ class TransactionSummaryVisualizationViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/transaction_spending_summary.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES
 
     @cache_response()
     def post(self, request):
@@ -167,6 +170,7 @@ class SpendingByTransactionCountVisualizaitonViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/spending_by_transaction_count.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES
 
     @cache_response()
     def post(self, request):
@@ -4,14 +4,14 @@ import json
 from sys import maxsize
 from django.conf import settings
 from django.db.models import F
-from django.utils.text import slugify
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 import logging
 from usaspending_api.awards.models import Award
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, ES_AWARDS_DATA_TYPES
 from usaspending_api.etl.elasticsearch_loader_helpers.aggregate_key_functions import return_one_level
-from usaspending_api.references.models import Agency, ToptierAgencyPublishedDABSView
+from usaspending_api.references.helpers import get_toptier_agency_lookup
 from usaspending_api.awards.v2.filters.sub_award import subaward_filter
 from usaspending_api.awards.v2.lookups.lookups import (
     assistance_type_mapping,
@@ -46,7 +46,6 @@ from usaspending_api.common.validator.pagination import PAGINATION
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.common.recipient_lookups import annotate_prime_award_recipient_id
 from usaspending_api.common.exceptions import UnprocessableEntityException
-from usaspending_api.submissions.models import SubmissionAttributes
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +81,7 @@ class SpendingByAwardVisualizationViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/spending_by_award.md"
+    cache_data_types = ES_AWARDS_DATA_TYPES + AWARDS_DATA_TYPES
 
     @cache_response()
     def post(self, request):
@@ -327,27 +327,11 @@ class SpendingByAwardVisualizationViewSet(APIView):
 
         return response
 
-    # For an unknown reason, ES tends to return the awarding agency toptier codes as integers or floats, instead of as
-    # text. This function casts the code back to a string and appends any leading zeroes that were lost.
-    def get_agency_database_id(self, code):
-        code = str(code).zfill(3)
-        agency_id = Agency.objects.filter(toptier_agency__toptier_code=code, toptier_flag=True).first()
-        submission = SubmissionAttributes.objects.filter(toptier_code=code).first()
-        if submission is None or agency_id is None:
-            return None
-        return agency_id.id
-
-    def get_agency_slug(self, code):
-        code = str(code).zfill(3)
-        submission = ToptierAgencyPublishedDABSView.objects.filter(toptier_code=code).first()
-        if submission is None:
-            return None
-        return slugify(submission.name)
-
     def construct_es_response_for_prime_awards(self, response) -> dict:
         results = []
         should_return_display_award_id = "Award ID" in self.fields
         should_return_recipient_id = "recipient_id" in self.fields
+        toptier_agency_lookup = get_toptier_agency_lookup() if "Awarding Agency" in self.fields else {}
         for res in response:
             hit = res.to_dict()
             row = {k: hit[v] for k, v in self.constants["internal_id_fields"].items()}
@@ -372,9 +356,10 @@ class SpendingByAwardVisualizationViewSet(APIView):
             if row.get("Award Amount"):
                 row["Award Amount"] = float(row["Award Amount"])
             if row.get("Awarding Agency"):
-                code = row.pop("agency_code")
-                row["awarding_agency_id"] = self.get_agency_database_id(code)
-                row["agency_slug"] = self.get_agency_slug(code)
+                # For an unknown reason, ES tends to return the awarding agency toptier codes as integers or floats,
+                # instead of as text. Cast the code back to a string and append any leading zeroes that were lost.
+                code = str(row.pop("agency_code")).zfill(3)
+                row["awarding_agency_id"], row["agency_slug"] = toptier_agency_lookup.get(code, (None, None))
             if row.get("COVID-19 Obligations"):
                 row["COVID-19 Obligations"] = sum(
                     [
@@ -11,6 +11,7 @@ from elasticsearch_dsl import Q
 from usaspending_api.awards.v2.filters.sub_award import subaward_filter
 from usaspending_api.awards.v2.lookups.lookups import all_award_types_mappings
 from usaspending_api.common.api_versioning import api_transformations, API_TRANSFORM_FUNCTIONS
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, ES_AWARDS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch
 from usaspending_api.common.exceptions import InvalidParameterException
@@ -31,6 +32,7 @@ class SpendingByAwardCountVisualizationViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/spending_by_award_count.md"
+    cache_data_types = ES_AWARDS_DATA_TYPES + AWARDS_DATA_TYPES
 
     @cache_response()
     def post(self, request):
@@ -7,6 +7,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.common.api_versioning import api_transformations, API_TRANSFORM_FUNCTIONS
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.exceptions import NotImplementedException
 from usaspending_api.common.validator.award_filter import AWARD_FILTER
@@ -48,6 +49,7 @@ class SpendingByCategoryVisualizationViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/spending_by_category.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     @cache_response()
     def post(self, request: Request) -> Response:
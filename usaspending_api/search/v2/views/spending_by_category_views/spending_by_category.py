@@ -13,6 +13,7 @@ from rest_framework.views import APIView
 
 from usaspending_api.awards.v2.filters.sub_award import subaward_filter
 from usaspending_api.common.api_versioning import api_transformations, API_TRANSFORM_FUNCTIONS
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.data_classes import Pagination
 from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
@@ -23,8 +24,10 @@ from usaspending_api.common.validator.award_filter import AWARD_FILTER
 from usaspending_api.common.validator.pagination import PAGINATION
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.search.v2.elasticsearch_helper import (
-    get_number_of_unique_terms_for_transactions,
+    add_unique_terms_count_aggregation,
+    execute_sized_to_unique_terms,
     get_scaled_sum_aggregations,
+    get_unique_terms_count,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,6 +45,8 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
     Abstract class inherited by the different spending by category endpoints.
     """
 
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES + AWARDS_DATA_TYPES
+
     category: Category
     filters: dict
     obligation_column: str
@@ -118,9 +123,12 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
             .order_by("-amount")
         )
 
-    def build_elasticsearch_search_with_aggregations(self, filter_query: ES_Q) -> Optional[TransactionSearch]:
+    def build_elasticsearch_search_with_aggregations(
+        self, filter_query: ES_Q, bucket_count: Optional[int] = None
+    ) -> TransactionSearch:
         """
         Using the provided ES_Q object creates a TransactionSearch object with the necessary applied aggregations.
+        Categories that aren't high cardinality are grouped into bucket_count buckets.
         """
         # Create the filtered Search Object
         search = TransactionSearch().filter(filter_query)
@@ -136,17 +144,14 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
             sum_bucket_sort = sum_aggregations["sum_bucket_truncate"]
             group_by_agg_key_values = {"order": {"sum_field": "desc"}}
         else:
-            # Get count of unique buckets; terminate early if there are no buckets matching criteria
-            bucket_count = get_number_of_unique_terms_for_transactions(filter_query, f"{self.category.agg_key}.hash")
-            if bucket_count == 0:
-                return None
-            else:
-                # Add 100 to make sure that we consider enough records in each shard for accurate results;
-                # Only needed for non high-cardinality fields since those are being routed
-                size = bucket_count
-                shard_size = bucket_count + 100
-                sum_bucket_sort = sum_aggregations["sum_bucket_sort"]
-                group_by_agg_key_values = {}
+            # Count the unique buckets in the same request (see query_elasticsearch_for_prime_awards).
+            # Add 100 to make sure that we consider enough records in each shard for accurate results;
+            # Only needed for non high-cardinality fields since those are being routed
+            add_unique_terms_count_aggregation(search, f"{self.category.agg_key}.hash")
+            size = bucket_count
+            shard_size = bucket_count + 100
+            sum_bucket_sort = sum_aggregations["sum_bucket_sort"]
+            group_by_agg_key_values = {}
 
         if shard_size > 10000:
             logger.warning(f"Max number of buckets reached for aggregation key: {self.category.agg_key}.")
@@ -171,11 +176,20 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
         return search
 
     def query_elasticsearch_for_prime_awards(self, filter_query: ES_Q) -> list:
-        search = self.build_elasticsearch_search_with_aggregations(filter_query)
-        if search is None:
-            return []
-        response = search.handle_execute()
-        results = self.build_elasticsearch_result(response.aggs.to_dict())
+        if self.category.name in self.high_cardinality_categories:
+            search = self.build_elasticsearch_search_with_aggregations(filter_query)
+            response_dict = search.handle_execute().aggs.to_dict()
+        else:
+            # Every bucket is needed to sort them by amount; the unique buckets are counted in the same request and
+            # it is only repeated with more buckets when the count shows that they didn't all fit
+            response_dict = execute_sized_to_unique_terms(
+                lambda bucket_count: self.build_elasticsearch_search_with_aggregations(filter_query, bucket_count)
+            )
+            # Terminate early if there are no buckets matching criteria
+            if get_unique_terms_count(response_dict) == 0:
+                return []
+
+        results = self.build_elasticsearch_result(response_dict)
         return results
 
     @abstractmethod
@@ -17,6 +17,7 @@ from typing import Optional, List, Dict
 from usaspending_api.awards.v2.filters.location_filter_geocode import geocode_filter_locations
 from usaspending_api.awards.v2.filters.sub_award import subaward_filter
 from usaspending_api.common.api_versioning import api_transformations, API_TRANSFORM_FUNCTIONS
+from usaspending_api.common.cache import AWARDS_DATA_TYPES, ES_TRANSACTIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
 from usaspending_api.common.helpers.generic_helper import get_generic_filters_message
@@ -28,7 +29,9 @@ from usaspending_api.references.models import PopCounty, PopCongressionalDistric
 from usaspending_api.search.models import SubawardView
 from usaspending_api.search.v2.elasticsearch_helper import (
     get_scaled_sum_aggregations,
-    get_number_of_unique_terms_for_transactions,
+    add_unique_terms_count_aggregation,
+    execute_sized_to_unique_terms,
+    get_unique_terms_count,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,6 +51,7 @@ class SpendingByGeographyVisualizationViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/spending_by_geography.md"
+    cache_data_types = ES_TRANSACTIONS_DATA_TYPES + AWARDS_DATA_TYPES
 
     agg_key: Optional[str]
     filters: dict
@@ -319,15 +323,13 @@ class SpendingByGeographyVisualizationViewSet(APIView):
 
         return results
 
-    def build_elasticsearch_search_with_aggregation(self, filter_query: ES_Q) -> Optional[TransactionSearch]:
+    def build_elasticsearch_search_with_aggregation(self, filter_query: ES_Q, bucket_count: int) -> TransactionSearch:
         # Create the initial search using filters
         search = TransactionSearch().filter(filter_query)
 
-        # Check number of unique terms (buckets) for performance and restrictions on maximum buckets allowed
-        bucket_count = get_number_of_unique_terms_for_transactions(filter_query, f"{self.agg_key}.hash")
-
-        if bucket_count == 0:
-            return None
+        # Count the unique terms (buckets) in the same request for performance and restrictions on maximum buckets
+        # allowed (see query_elasticsearch)
+        add_unique_terms_count_aggregation(search, f"{self.agg_key}.hash")
 
         # Add 100 to make sure that we consider enough records in each shard for accurate results
         group_by_agg_key = A("terms", field=self.agg_key, size=bucket_count, shard_size=bucket_count + 100)
@@ -379,11 +381,12 @@ class SpendingByGeographyVisualizationViewSet(APIView):
         return results
 
     def query_elasticsearch(self, filter_query: ES_Q) -> list:
-        search = self.build_elasticsearch_search_with_aggregation(filter_query)
-        if search is None:
+        response_dict = execute_sized_to_unique_terms(
+            lambda bucket_count: self.build_elasticsearch_search_with_aggregation(filter_query, bucket_count)
+        )
+        if get_unique_terms_count(response_dict) == 0:
             return []
-        response = search.handle_execute()
-        results_dict = self.build_elasticsearch_result(response.aggs.to_dict())
+        results_dict = self.build_elasticsearch_result(response_dict)
 
         if self.geo_layer_filters:
             filtered_shape_codes = set(self.geo_layer_filters) & set(results_dict.keys())
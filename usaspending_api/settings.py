@@ -33,6 +33,23 @@ DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 # MAX_CONNECTIONS in this case refers to those serving downloads
 DOWNLOAD_DB_WORK_MEM_IN_MB = os.environ.get("DOWNLOAD_DB_WORK_MEM_IN_MB", 128)
 
+# When enabled, psql COPY output is streamed straight into partitioned zip members instead of being written to an
+# intermediate delimited file that is then re-read, partitioned, and compressed
+DOWNLOAD_STREAMING_PIPELINE = os.environ.get("DOWNLOAD_STREAMING_PIPELINE", "").lower() in ["true", "1", "yes"]
+
+# Number of processes used to compress the partitioned download files in parallel (1 compresses them serially) and the
+# zlib compression level used when doing so (-1 is the zlib default)
+DOWNLOAD_ZIP_WORKERS = int(os.environ.get("DOWNLOAD_ZIP_WORKERS", 1))
+DOWNLOAD_ZIP_COMPRESSION_LEVEL = int(os.environ.get("DOWNLOAD_ZIP_COMPRESSION_LEVEL", -1))
+
+# Maximum number of a single download's sources exported by psql at the same time; each export holds one connection to
+# the download database, so this is the per-job connection budget (1 exports the sources one after another)
+DOWNLOAD_MAX_CONCURRENT_SOURCES = int(os.environ.get("DOWNLOAD_MAX_CONCURRENT_SOURCES", 1))
+
+# Hours after which download workers remove, when they start, the files a failed download left in CSV_LOCAL_PATH for a
+# retry to resume from (e.g. when the retry went to another worker); must be well above how long a download can run
+DOWNLOAD_STALE_FILES_MAX_AGE_HOURS = int(os.environ.get("DOWNLOAD_STALE_FILES_MAX_AGE_HOURS", 24))
+
 API_MAX_DATE = "2024-09-30"  # End of FY2024
 API_MIN_DATE = "2000-10-01"  # Beginning of FY2001
 API_SEARCH_MIN_DATE = "2007-10-01"  # Beginning of FY2008
@@ -142,8 +159,17 @@ ES_TRANSACTIONS_NAME_SUFFIX = "transactions"
 ES_TRANSACTIONS_QUERY_ALIAS_PREFIX = "transaction-query"
 ES_TRANSACTIONS_WRITE_ALIAS = "transaction-load-alias"
 ES_TIMEOUT = 90
+# Elasticsearch clients are shared by everything in a process; these tune the connection pool each one keeps open.
+# Sniffing discovers the cluster's nodes from the host above, so only enable it when those nodes are reachable directly
+ES_CLIENT_MAX_CONNECTIONS = int(os.environ.get("ES_CLIENT_MAX_CONNECTIONS", 10))
+ES_CLIENT_SNIFF = os.environ.get("ES_CLIENT_SNIFF", "").lower() in ["true", "1", "yes"]
+ES_CLIENT_SNIFFER_TIMEOUT = int(os.environ.get("ES_CLIENT_SNIFFER_TIMEOUT", 60))
 ES_REPOSITORY = ""
 ES_ROUTING_FIELD = "recipient_agg_key"
+# Number of Elasticsearch queries compiled from request filters that each process keeps for reuse, and for how many
+# seconds; 0 disables reusing them
+QUERY_WITH_FILTERS_CACHE_SIZE = int(os.environ.get("QUERY_WITH_FILTERS_CACHE_SIZE", 1000))
+QUERY_WITH_FILTERS_CACHE_TIMEOUT = int(os.environ.get("QUERY_WITH_FILTERS_CACHE_TIMEOUT", 300))
 
 # Grants API
 GRANTS_API_KEY = os.environ.get("GRANTS_API_KEY")
@@ -426,6 +452,13 @@ if DEBUG:
     LOGGING["loggers"]["django.db.backends"] = {"handlers": ["console"], "level": "DEBUG", "propagate": False}
 
 
+# Seconds an API process keeps its in-memory lookup of toptier agency ids and slugs before reloading it
+TOPTIER_AGENCY_LOOKUP_TTL = int(os.environ.get("TOPTIER_AGENCY_LOOKUP_TTL", 300))
+
+# Number of worker threads per process that run_concurrently runs the independent queries of API requests on; each one
+# keeps its own database connection for up to CONNECTION_MAX_SECONDS (1 runs the queries one after another instead)
+API_CONCURRENT_QUERIES_MAX_WORKERS = int(os.environ.get("API_CONCURRENT_QUERIES_MAX_WORKERS", 4))
+
 # If caches added or renamed, edit clear_caches in usaspending_api/etl/helpers.py
 CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default-loc-mem-cache"},
@@ -455,6 +488,21 @@ CACHE_ENVIRONMENTS = {
 # Set the usaspending-cache to whatever our environment cache dictates
 CACHES["usaspending-cache"] = CACHE_ENVIRONMENTS[CACHE_ENVIRONMENT]
 
+# Per-process cache of rendered responses in front of the usaspending-cache for views using
+# cache_response(local_cache=True). Sized in bytes of response content; 0 disables it
+RESPONSE_LOCAL_CACHE_MAX_BYTES = int(os.environ.get("RESPONSE_LOCAL_CACHE_MAX_BYTES", 0))
+RESPONSE_LOCAL_CACHE_TIMEOUT = int(os.environ.get("RESPONSE_LOCAL_CACHE_TIMEOUT", 30))
+
+# Identical requests missing the cache at once wait for the first one to cache its response instead of all building it.
+# The lock expires after a timeout (seconds) in case its request dies; waiting requests poll for up to the max wait
+CACHE_COALESCING_LOCK_TIMEOUT = int(os.environ.get("CACHE_COALESCING_LOCK_TIMEOUT", 60))
+CACHE_COALESCING_MAX_WAIT = int(os.environ.get("CACHE_COALESCING_MAX_WAIT", 30))
+CACHE_COALESCING_POLL_INTERVAL = float(os.environ.get("CACHE_COALESCING_POLL_INTERVAL", 0.1))
+
+# Seconds an API process reuses the data versions (last load dates) that are part of every cache key before reading
+# them again; responses for newly loaded data are cached under new keys at most this long after the load finishes
+CACHE_DATA_VERSION_TIMEOUT = int(os.environ.get("CACHE_DATA_VERSION_TIMEOUT", 60))
+
 # DRF extensions
 REST_FRAMEWORK_EXTENSIONS = {
     # Not caching errors, these are logged to exceptions.log
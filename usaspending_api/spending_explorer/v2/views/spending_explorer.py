@@ -1,5 +1,6 @@
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.spending_explorer.v2.filters.type_filter import type_filter
 
@@ -13,8 +14,9 @@ class SpendingExplorerViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/spending.md"
+    cache_data_types = SUBMISSIONS_DATA_TYPES
 
-    @cache_response()
+    @cache_response(local_cache=True)
     def post(self, request):
 
         json_request = request.data
@@ -2,6 +2,7 @@ import logging
 import psycopg2
 
 from datetime import timedelta
+from django.db import transaction
 from django.db.models import Q
 from threading import Timer
 from traceback import format_exception
@@ -62,19 +63,25 @@ def claim_next_available_submission(
 ) -> Tuple[Optional[int], Optional[bool]]:
     """
     Finds a submission id that requires processing, claims it, and returns the submission id.
-    Returns None if there are no available submission ids remaining in the queue.
+    Returns None if there are no available submission ids remaining in the queue.  The queue row
+    is locked while it is claimed and rows locked by other processors are skipped so that any
+    number of processors can claim from the queue at once without contending for the same row.
     """
     q = ~Q(submission_id__in=exclude) if exclude else Q()
-    submissions = (
-        DABSLoaderQueue.objects.filter(Q(Q(state=DABSLoaderQueue.READY) | Q(state=DABSLoaderQueue.FAILED)) & q)
-        .order_by("-state", "submission_id")
-        .values("submission_id", "force_reload")
-    )
-    for submission in submissions:
-        submission_id = submission["submission_id"]
-        if start_processing(submission_id, processor_id):
-            return submission_id, submission["force_reload"]
-    return None, None
+    with transaction.atomic():
+        submission = (
+            DABSLoaderQueue.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(Q(state=DABSLoaderQueue.READY) | Q(state=DABSLoaderQueue.FAILED)) & q,
+                processor_id__isnull=True,
+            )
+            .order_by("-state", "submission_id")
+            .values("submission_id", "force_reload")
+            .first()
+        )
+        if submission is None or not start_processing(submission["submission_id"], processor_id):
+            return None, None
+    return submission["submission_id"], submission["force_reload"]
 
 
 def start_processing(submission_id: int, processor_id: str) -> int:
@@ -1,3 +1,4 @@
+from usaspending_api.common.cache import SUBMISSIONS_DATA_TYPES
 from usaspending_api.submissions.models import SubmissionAttributes
 from usaspending_api.submissions.serializers import SubmissionAttributesSerializer
 from usaspending_api.common.mixins import FilterQuerysetMixin
@@ -12,6 +13,8 @@ class SubmissionAttributesViewSet(FilterQuerysetMixin, CachedDetailViewSet):
     Handles requests for information about data submissions.
     """
 
+    cache_data_types = SUBMISSIONS_DATA_TYPES
+
     serializer_class = SubmissionAttributesSerializer
 
     def get_queryset(self):